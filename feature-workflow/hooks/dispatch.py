@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Single entry point for the plugin's PreToolUse and PostToolUse hooks.
+
+Usage:
+    python3 dispatch.py [pre|post]
+
+The phase comes from the first argument, or from the payload's
+hook_event_name when no argument is given. stdin is read once (see
+hook_input.py) and the path is matched against the shared patterns in
+hook_patterns.py before anything else is imported: the PreToolUse and
+PostToolUse modules are only loaded for writes they actually act on, so
+the common case - a Write/Edit outside docs/features - costs little more
+than interpreter startup.
+
+pre_tool_use.py and post_tool_use.py remain runnable on their own.
+"""
+
+import json
+import os
+import sys
+
+# Shared stdin reader and patterns live next to this script
+HOOKS_DIR = os.path.dirname(os.path.abspath(__file__))
+if HOOKS_DIR not in sys.path:
+    sys.path.insert(0, HOOKS_DIR)
+
+from hook_input import read_hook_input
+from hook_patterns import FEATURE_FILE_PATTERN, FEATURE_TOOLS, get_generated_file
+
+
+PHASES = {
+    "pre": "PreToolUse",
+    "post": "PostToolUse",
+    "PreToolUse": "PreToolUse",
+    "PostToolUse": "PostToolUse",
+}
+
+
+def main(argv=None) -> int:
+    """Route one hook invocation to the pre or post handler."""
+    args = sys.argv[1:] if argv is None else argv
+
+    try:
+        hook_data = read_hook_input()
+    except json.JSONDecodeError:
+        # Can't parse input, allow the operation
+        return 0
+
+    phase = PHASES.get(args[0] if args else hook_data.get("hook_event_name", ""))
+    tool_name = hook_data.get("tool_name", "")
+    file_path = hook_data.get("tool_input", {}).get("file_path", "")
+
+    if phase == "PreToolUse":
+        if not get_generated_file(file_path):
+            return 0
+        import pre_tool_use
+        return pre_tool_use.check(file_path)
+
+    if phase == "PostToolUse":
+        if tool_name not in FEATURE_TOOLS or not FEATURE_FILE_PATTERN.search(file_path):
+            return 0
+        import post_tool_use
+        return post_tool_use.handle(tool_name, file_path)
+
+    print(f"[hook] Warning: Unknown hook phase: {args[0] if args else None}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Read hook payloads without decoding the whole tool input.
+
+Write and Edit payloads carry the full file content (or old/new strings)
+being written, often megabytes of it, while the hooks only need
+`tool_name` and `tool_input.file_path`. For small payloads the stdin JSON is
+decoded normally. For large ones only the first HEAD_BYTES are scanned for
+those keys; the rest of stdin is drained unread into a fixed buffer.
+
+The scan is safe on valid JSON: a quote inside a string value is always
+escaped, so `,"file_path":"` can only match a real key. Anything the scan
+cannot settle (keys past the head, odd formatting) falls back to a full
+decode.
+
+Only json, re and sys are imported (not typing) to keep hook startup cheap.
+"""
+
+import json
+import re
+import sys
+
+# Payloads up to this size are decoded in full
+HEAD_BYTES = 64 * 1024
+DRAIN_CHUNK = 256 * 1024
+
+# Key patterns, compiled on first use: most payloads are small and never
+# need them, and compiling at import would add to every hook's startup
+_STRING = rb'"((?:[^"\\]|\\.)*)"'
+_PATTERN_SOURCES = {
+    "tool_name": rb'[{,]\s*"tool_name"\s*:\s*' + _STRING,
+    "hook_event_name": rb'[{,]\s*"hook_event_name"\s*:\s*' + _STRING,
+    "tool_input": rb'[{,]\s*"tool_input"\s*:\s*\{',
+    "file_path": rb'[{,]\s*"file_path"\s*:\s*' + _STRING,
+}
+_patterns = {}
+
+
+def read_hook_input(stream=None) -> dict:
+    """Read a hook payload from stdin.
+
+    Args:
+        stream: Binary or text input stream (default: sys.stdin)
+
+    Returns:
+        The decoded payload, or for large payloads a dict holding only
+        hook_event_name, tool_name and tool_input.file_path
+
+    Raises:
+        json.JSONDecodeError: If the payload is not valid JSON
+    """
+    if stream is None:
+        stream = sys.stdin
+    stream = getattr(stream, "buffer", stream)
+
+    head = _as_bytes(stream.read(HEAD_BYTES))
+    if len(head) < HEAD_BYTES:
+        return json.loads(head)
+
+    fast = scan_head(head)
+    if fast is not None:
+        _drain(stream)
+        return fast
+
+    return json.loads(head + _as_bytes(stream.read()))
+
+
+def scan_head(head: bytes):
+    """Extract tool_name and tool_input.file_path from the start of a payload.
+
+    Returns:
+        A minimal payload dict, or None if either key is not in head
+    """
+    if not _patterns:
+        _patterns.update((key, re.compile(source)) for key, source in _PATTERN_SOURCES.items())
+
+    tool_name = _patterns["tool_name"].search(head)
+    tool_input = _patterns["tool_input"].search(head)
+    if tool_name is None or tool_input is None:
+        return None
+
+    file_path = _patterns["file_path"].search(head, tool_input.end() - 1)
+    if file_path is None:
+        return None
+
+    try:
+        payload = {
+            "tool_name": _unescape(tool_name.group(1)),
+            "tool_input": {"file_path": _unescape(file_path.group(1))},
+        }
+        event_name = _patterns["hook_event_name"].search(head)
+        if event_name is not None:
+            payload["hook_event_name"] = _unescape(event_name.group(1))
+    except ValueError:
+        return None
+    return payload
+
+
+def _unescape(raw: bytes) -> str:
+    """Decode the body of a JSON string literal."""
+    return json.loads(b'"' + raw + b'"')
+
+
+def _as_bytes(data) -> bytes:
+    return data.encode("utf-8") if isinstance(data, str) else data
+
+
+def _drain(stream) -> None:
+    """Consume the rest of the stream so the writer never sees a broken pipe."""
+    readinto = getattr(stream, "readinto", None)
+    if readinto is not None:
+        buffer = bytearray(DRAIN_CHUNK)
+        while readinto(buffer):
+            pass
+        return
+    while stream.read(DRAIN_CHUNK):
+        pass
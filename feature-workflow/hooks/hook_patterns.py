@@ -0,0 +1,30 @@
+"""Path patterns shared by the PreToolUse and PostToolUse hooks.
+
+Kept free of imports beyond re so the dispatcher can match paths before
+deciding whether any heavier hook module needs loading.
+"""
+
+import re
+
+
+# Pattern to match feature file writes
+FEATURE_FILE_PATTERN = re.compile(r"docs/features/([^/]+)/(idea|plan|shipped)\.md$")
+
+# Tools whose writes can touch feature files
+FEATURE_TOOLS = ("Write", "Edit")
+
+# Files under docs/features that are regenerated by the PostToolUse hook
+GENERATED_FILES = ("DASHBOARD.md", "index.json")
+
+# Per-year shards of archived completed features, also regenerated
+ARCHIVE_FILE_PATTERN = re.compile(r"docs/features/(\.archive/DASHBOARD-\d+\.md)$")
+
+
+def get_generated_file(file_path: str) -> str:
+    """Return the generated file name if file_path is one, else ''."""
+    for name in GENERATED_FILES:
+        target = f"docs/features/{name}"
+        if file_path.endswith(target) or f"/{target}" in file_path:
+            return name
+    match = ARCHIVE_FILE_PATTERN.search(file_path)
+    return match.group(1) if match else ""
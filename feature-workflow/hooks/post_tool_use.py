@@ -9,37 +9,63 @@ Status detection by file presence:
 - idea.md only → backlog
 - idea.md + plan.md → in-progress
 - idea.md + plan.md + shipped.md → completed
+
+The changed feature ID is passed to the dashboard generator so that only that
+feature is re-parsed; all others are served from the feature cache.
+
+If the optional dashboard daemon (skills/shared/lib/daemon.py) is running,
+the hook only sends it a "changed" message over its Unix socket. Otherwise
+regeneration happens locally according to FEATURE_WORKFLOW_DASHBOARD_MODE:
+- inprocess (default): import the shared lib and generate in this process,
+  falling back to a subprocess if the import or generation fails
+- subprocess: always run run_dashboard.py in a separate interpreter
+
+Setting FEATURE_WORKFLOW_DEBOUNCE_MS coalesces bursts of in-process writes:
+each hook waits out the window and only the last writer regenerates.
+
+The full-text search index (docs/features/.search-index.json) is updated
+for the written feature by whichever path regenerates the dashboard (the
+daemon, this process, or run_dashboard.py), never before the daemon is
+tried, so a write only pays for it where the dashboard work happens.
 """
 
 import json
 import os
-import re
-import subprocess
 import sys
 from pathlib import Path
 
+# Shared stdin reader and patterns live next to this script
+HOOKS_DIR = os.path.dirname(os.path.abspath(__file__))
+if HOOKS_DIR not in sys.path:
+    sys.path.insert(0, HOOKS_DIR)
 
-# Pattern to match feature file writes
-FEATURE_FILE_PATTERN = re.compile(r"docs/features/([^/]+)/(idea|plan|shipped)\.md$")
+from hook_input import read_hook_input
+from hook_patterns import FEATURE_FILE_PATTERN, FEATURE_TOOLS
+
+
+# Environment variable selecting how the dashboard is regenerated
+MODE_ENV_VAR = "FEATURE_WORKFLOW_DASHBOARD_MODE"
 
 
 def main() -> int:
     """Check if dashboard needs regeneration after a tool call."""
-    # Read hook input from stdin
+    # Read hook input from stdin (large payloads are not decoded in full)
     try:
-        hook_data = json.load(sys.stdin)
+        hook_data = read_hook_input()
     except json.JSONDecodeError:
         return 0
 
+    # Extract tool name and file path from tool input
+    tool_input = hook_data.get("tool_input", {})
+    return handle(hook_data.get("tool_name", ""), tool_input.get("file_path", ""))
+
+
+def handle(tool_name: str, file_path: str) -> int:
+    """Regenerate the dashboard if a Write/Edit touched a feature file."""
     # Only process Write or Edit tool calls
-    tool_name = hook_data.get("tool_name", "")
-    if tool_name not in ("Write", "Edit"):
+    if tool_name not in FEATURE_TOOLS:
         return 0
 
-    # Extract file path from tool input
-    tool_input = hook_data.get("tool_input", {})
-    file_path = tool_input.get("file_path", "")
-
     if not file_path:
         return 0
 
@@ -59,23 +85,123 @@ def main() -> int:
     print(f"[hook] Detected feature file write: {feature_id}/{file_type}.md", file=sys.stderr)
     print(f"[hook] Regenerating DASHBOARD.md", file=sys.stderr)
 
-    # Find the dashboard generation script
+    plugin_root = get_plugin_root()
+
+    if notify_daemon(plugin_root, project_root, feature_id):
+        return 0
+
+    if os.environ.get(MODE_ENV_VAR, "inprocess") != "subprocess":
+        if regenerate_in_process(plugin_root, project_root, feature_id):
+            return 0
+        print("[hook] Falling back to subprocess regeneration", file=sys.stderr)
+
+    regenerate_subprocess(plugin_root, project_root, feature_id)
+    return 0
+
+
+def get_plugin_root() -> Path:
+    """Locate the plugin root from the environment or this script's location."""
     plugin_root = os.environ.get("CLAUDE_PLUGIN_ROOT", "")
     if not plugin_root:
         # Try to find it relative to this script
-        script_dir = Path(__file__).parent
-        plugin_root = str(script_dir.parent)
+        return Path(__file__).parent.parent
+    return Path(plugin_root)
+
+
+def notify_daemon(plugin_root: Path, project_root: str, feature_id: str) -> bool:
+    """Hand the change to a running dashboard daemon, if there is one.
+
+    Returns:
+        True if the daemon regenerated the dashboard
+    """
+    lib_dir = plugin_root / "skills" / "shared" / "lib"
+    if str(lib_dir) not in sys.path:
+        sys.path.insert(0, str(lib_dir))
+
+    try:
+        from daemon_client import send_request
+    except ImportError:
+        return False
+
+    response = send_request({
+        "op": "changed",
+        "project_root": os.path.abspath(project_root),
+        "feature_id": feature_id,
+    })
+    if response is None:
+        return False
+
+    if not response.get("ok"):
+        print(f"[hook] Warning: Dashboard daemon error: {response.get('error')}", file=sys.stderr)
+        return False
 
-    dashboard_script = Path(plugin_root) / "skills" / "shared" / "lib" / "run_dashboard.py"
+    print("[hook] DASHBOARD.md regenerated by daemon", file=sys.stderr)
+    return True
+
+
+def regenerate_in_process(plugin_root: Path, project_root: str, feature_id: str) -> bool:
+    """Regenerate the dashboard by importing the shared lib directly.
+
+    Avoids a second interpreter startup and a second round of imports.
+
+    Returns:
+        True on success, False if the caller should fall back to a subprocess
+    """
+    lib_dir = plugin_root / "skills" / "shared" / "lib"
+    if str(lib_dir) not in sys.path:
+        sys.path.insert(0, str(lib_dir))
+
+    try:
+        from run_dashboard import generate_dashboard
+        from search import update_written
+    except ImportError as e:
+        print(f"[hook] Warning: Could not import dashboard library: {e}", file=sys.stderr)
+        return False
+
+    try:
+        from coalesce import coalesce, get_debounce_window
+
+        features_dir = Path(project_root) / "docs" / "features"
+        window = get_debounce_window()
+        if window <= 0:
+            generate_dashboard(Path(project_root), feature_id=feature_id)
+            update_written(features_dir, {feature_id})
+            return True
+
+        def regenerate(feature_ids: set[str]) -> None:
+            # Force a re-parse of the changed feature; others are checked by signature
+            only = next(iter(feature_ids)) if len(feature_ids) == 1 else None
+            generate_dashboard(Path(project_root), feature_id=only)
+            update_written(features_dir, feature_ids)
+
+        if not coalesce(features_dir, feature_id, window, regenerate):
+            print("[hook] Deferred DASHBOARD.md regeneration to a later write", file=sys.stderr)
+
+    except Exception as e:
+        print(f"[hook] Warning: Dashboard regeneration error: {e}", file=sys.stderr)
+        return False
+
+    return True
+
+
+def regenerate_subprocess(plugin_root: Path, project_root: str, feature_id: str) -> bool:
+    """Regenerate the dashboard by running run_dashboard.py in a subprocess.
+
+    Returns:
+        True if the script ran and exited successfully
+    """
+    import subprocess
+
+    dashboard_script = plugin_root / "skills" / "shared" / "lib" / "run_dashboard.py"
 
     if not dashboard_script.exists():
         print(f"[hook] Warning: Dashboard script not found at {dashboard_script}", file=sys.stderr)
-        return 0
+        return False
 
     # Run the dashboard generation script
     try:
         result = subprocess.run(
-            [sys.executable, str(dashboard_script), project_root],
+            [sys.executable, str(dashboard_script), project_root, feature_id],
             capture_output=True,
             text=True,
             timeout=30,
@@ -85,16 +211,18 @@ def main() -> int:
             print(f"[hook] Warning: Dashboard regeneration failed", file=sys.stderr)
             if result.stderr:
                 print(result.stderr, file=sys.stderr)
-        else:
-            if result.stderr:
-                print(result.stderr, file=sys.stderr)
+            return False
+
+        if result.stderr:
+            print(result.stderr, file=sys.stderr)
+        return True
 
     except subprocess.TimeoutExpired:
         print("[hook] Warning: Dashboard regeneration timed out", file=sys.stderr)
     except Exception as e:
         print(f"[hook] Warning: Dashboard regeneration error: {e}", file=sys.stderr)
 
-    return 0
+    return False
 
 
 if __name__ == "__main__":
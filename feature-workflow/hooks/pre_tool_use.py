@@ -7,39 +7,54 @@ Exit codes:
 
 Blocks:
 - docs/features/DASHBOARD.md (auto-generated from feature directories)
+- docs/features/index.json (machine-readable index, generated alongside)
+- docs/features/.archive/DASHBOARD-YYYY.md (archived completed features)
 
 Allows:
 - All writes to docs/features/[id]/*.md (feature directories)
 """
 
 import json
+import os
 import sys
 
+# Shared stdin reader and patterns live next to this script
+HOOKS_DIR = os.path.dirname(os.path.abspath(__file__))
+if HOOKS_DIR not in sys.path:
+    sys.path.insert(0, HOOKS_DIR)
+
+from hook_input import read_hook_input
+from hook_patterns import get_generated_file
+
 
 def main() -> int:
     """Check if the tool call should be blocked."""
-    # Read hook input from stdin
+    # Read hook input from stdin (large payloads are not decoded in full)
     try:
-        hook_data = json.load(sys.stdin)
+        hook_data = read_hook_input()
     except json.JSONDecodeError:
         # Can't parse input, allow the operation
         return 0
 
     # Extract file path from tool input
     tool_input = hook_data.get("tool_input", {})
-    file_path = tool_input.get("file_path", "")
+    return check(tool_input.get("file_path", ""))
+
 
+def check(file_path: str) -> int:
+    """Return 2 (and explain why on stderr) if file_path must not be written."""
     if not file_path:
         return 0
 
-    # Block direct writes to DASHBOARD.md
-    if file_path.endswith("docs/features/DASHBOARD.md") or "/docs/features/DASHBOARD.md" in file_path:
+    # Block direct writes to DASHBOARD.md, index.json and archive shards
+    generated = get_generated_file(file_path)
+    if generated:
         print("", file=sys.stderr)
         print("=" * 67, file=sys.stderr)
-        print("  BLOCKED: Direct write to DASHBOARD.md is not allowed", file=sys.stderr)
+        print(f"  BLOCKED: Direct write to {generated} is not allowed", file=sys.stderr)
         print("=" * 67, file=sys.stderr)
         print("", file=sys.stderr)
-        print("  DASHBOARD.md is auto-generated from feature directories.", file=sys.stderr)
+        print(f"  {generated} is auto-generated from feature directories.", file=sys.stderr)
         print("", file=sys.stderr)
         print("  To update the dashboard, write to feature directories instead:", file=sys.stderr)
         print("", file=sys.stderr)
@@ -47,7 +62,7 @@ def main() -> int:
         print("  Start work:        Write docs/features/[id]/plan.md", file=sys.stderr)
         print("  Complete feature:  Write docs/features/[id]/shipped.md", file=sys.stderr)
         print("", file=sys.stderr)
-        print("  The hook will automatically regenerate DASHBOARD.md.", file=sys.stderr)
+        print(f"  The hook will automatically regenerate {generated}.", file=sys.stderr)
         print("", file=sys.stderr)
         print("=" * 67, file=sys.stderr)
         return 2
@@ -7,11 +7,20 @@ Usage:
 Creates:
     docs/features/
     docs/features/DASHBOARD.md (initial template)
+    docs/features/.gitignore (ignores machine-local cache files; also
+        added to an already initialized project that lacks it)
 """
 
 import sys
 from pathlib import Path
 
+# Add the shared lib directory to the Python path for imports
+LIB_DIR = Path(__file__).parent.parent.parent / "shared" / "lib"
+if str(LIB_DIR) not in sys.path:
+    sys.path.insert(0, str(LIB_DIR))
+
+from feature_cache import ensure_gitignore
+
 
 INITIAL_DASHBOARD = """# Feature Dashboard
 
@@ -38,9 +47,10 @@ def main() -> int:
     # Check if already initialized
     if features_dir.is_dir():
         print(f"Feature workflow already initialized at {features_dir}")
+        ensure_gitignore(features_dir)
 
         # Count existing features
-        feature_count = sum(1 for p in features_dir.iterdir() if p.is_dir())
+        feature_count = sum(1 for p in features_dir.iterdir() if p.is_dir() and not p.name.startswith("."))
 
         if (features_dir / "DASHBOARD.md").exists():
             print("DASHBOARD.md exists")
@@ -56,6 +66,9 @@ def main() -> int:
     dashboard_path = features_dir / "DASHBOARD.md"
     dashboard_path.write_text(INITIAL_DASHBOARD)
 
+    # Keep the feature cache out of version control
+    ensure_gitignore(features_dir)
+
     print("")
     print("Feature workflow initialized!")
     print("")
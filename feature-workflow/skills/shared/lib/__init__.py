@@ -5,19 +5,37 @@ This module provides common utilities for:
 - YAML frontmatter parsing
 - Feature status models
 - Statusline context management
+
+Submodules are imported on first attribute access (PEP 562), so importing
+e.g. lib.statusline does not also load the dashboard and model modules.
 """
 
-from .models import FeatureStatus, FeatureContext
-from .frontmatter import parse_frontmatter
-from .dashboard import generate_dashboard
-from .statusline import set_context, clear_context, get_context
-
-__all__ = [
-    "FeatureStatus",
-    "FeatureContext",
-    "parse_frontmatter",
-    "generate_dashboard",
-    "set_context",
-    "clear_context",
-    "get_context",
-]
+import importlib
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "FeatureStatus": "models",
+    "FeatureContext": "models",
+    "parse_frontmatter": "frontmatter",
+    "generate_dashboard": "dashboard",
+    "set_context": "statusline",
+    "clear_context": "statusline",
+    "get_context": "statusline",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,105 @@
+"""Archive policy for old completed features.
+
+The Completed table otherwise grows with the age of the project. When an
+archive limit is configured, completed features beyond it are moved out of
+DASHBOARD.md into one file per shipping year:
+
+    docs/features/.archive/DASHBOARD-2023.md
+    docs/features/.archive/DASHBOARD-2024.md
+
+The directory is dot-prefixed so it can never be a feature directory (a
+feature may well be called "archive"); the feature scan skips dot
+directories. The main dashboard links to each shard. Shards are written with the same
+skip-if-unchanged logic as DASHBOARD.md, so a year's file is only rewritten
+when a feature enters or leaves it. Features without a shipped date have no
+year to go to and always stay on the main dashboard.
+
+Configuration (both off by default; either limit alone is enough):
+- FEATURE_WORKFLOW_ARCHIVE_DAYS: archive features shipped more than N days ago
+- FEATURE_WORKFLOW_KEEP_COMPLETED: keep only the N most recently shipped
+"""
+
+import os
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional, Sequence
+
+# Handle both package and standalone imports
+try:
+    from .models import FeatureContext
+except ImportError:
+    from models import FeatureContext
+
+
+ARCHIVE_DIRNAME = ".archive"
+SHARD_PREFIX = "DASHBOARD-"
+
+ARCHIVE_DAYS_ENV_VAR = "FEATURE_WORKFLOW_ARCHIVE_DAYS"
+KEEP_COMPLETED_ENV_VAR = "FEATURE_WORKFLOW_KEEP_COMPLETED"
+
+
+def _env_limit(name: str) -> int:
+    try:
+        return max(int(os.environ.get(name, "0")), 0)
+    except ValueError:
+        return 0
+
+
+@dataclass(frozen=True)
+class ArchivePolicy:
+    """Limits on completed features shown in DASHBOARD.md (0 = no limit)."""
+
+    max_age_days: int = 0
+    keep_completed: int = 0
+
+    @classmethod
+    def from_env(cls) -> "ArchivePolicy":
+        """Read the policy from FEATURE_WORKFLOW_ARCHIVE_DAYS/KEEP_COMPLETED."""
+        return cls(_env_limit(ARCHIVE_DAYS_ENV_VAR), _env_limit(KEEP_COMPLETED_ENV_VAR))
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age_days > 0 or self.keep_completed > 0
+
+    def split(
+        self,
+        completed: Sequence[FeatureContext],
+        today: Optional[date] = None,
+    ) -> tuple[list[FeatureContext], dict[int, list[FeatureContext]]]:
+        """Split completed features into those kept and those archived.
+
+        Args:
+            completed: Completed features, in dashboard order
+            today: Reference date for max_age_days (default: today)
+
+        Returns:
+            Tuple of (kept features in their original order,
+            shipping year -> archived features in their original order)
+        """
+        if not self.enabled:
+            return list(completed), {}
+
+        archived_ids = set()
+        dated = [ctx for ctx in completed if ctx.shipped is not None]
+
+        if self.max_age_days > 0:
+            cutoff = (today or date.today()) - timedelta(days=self.max_age_days)
+            archived_ids.update(ctx.feature_id for ctx in dated if ctx.shipped < cutoff)
+
+        if self.keep_completed > 0:
+            newest_first = sorted(dated, key=lambda ctx: (ctx.shipped, ctx.feature_id), reverse=True)
+            archived_ids.update(ctx.feature_id for ctx in newest_first[self.keep_completed:])
+
+        kept = []
+        archived: dict[int, list[FeatureContext]] = {}
+        for ctx in completed:
+            if ctx.feature_id in archived_ids:
+                archived.setdefault(ctx.shipped.year, []).append(ctx)
+            else:
+                kept.append(ctx)
+        return kept, dict(sorted(archived.items()))
+
+
+def shard_name(year: int) -> str:
+    """Return the archive file name for a shipping year."""
+    return f"{SHARD_PREFIX}{year}.md"
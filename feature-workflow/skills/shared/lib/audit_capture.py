@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""Extract [AUDIT:audit-id:sequence] lines from runtime output.
+
+The feature-audit runtime-capture phase turns pasted or executed output
+into a structured capture (see skills/feature-audit/runtime-capture.md):
+
+    {"captureId": "...", "capturedAt": "...", "method": "paste", ...,
+     "logs": [{"sequence": 1, "raw": "...", "timestamp": null, "data": ...}],
+     "missingSequences": [4], "missingCount": 1, "outOfOrder": [...],
+     "unexpectedLogs": [...], "unexpectedCount": 0}
+
+Input is scanned in constant memory: files are memory-mapped and searched
+for the marker directly, so only matching lines are ever copied; stdin is
+scanned the same way one 1 MiB chunk at a time. Log records are written
+to the output as they are found. Only the sequence bookkeeping and the
+first MAX_UNEXPECTED unexpected lines stay in memory; later ones are only
+counted.
+
+Sequence gaps are tracked as lines arrive, as sorted (first, last)
+intervals: a jump past the highest sequence seen opens one, and a late
+arrival splits it, so a stray huge sequence number costs one interval
+rather than one entry per missing number. The capture lists the first
+MAX_MISSING missing sequences along with the total count. When the
+audit's injections.json is available, its injection IDs are the expected
+sequences and anything else is reported as unexpected.
+
+Usage:
+    python3 audit_capture.py <audit-id> [log_file|-] [--injections PATH]
+        [--method paste|direct] [--command CMD] [--scenario TEXT]
+        [--capture-id ID] [--output PATH]
+"""
+
+import bisect
+import itertools
+import json
+import mmap
+import os
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Optional
+
+
+MARKER = b"[AUDIT:"
+MARKER_PATTERN = re.compile(rb"\[AUDIT:([^:\]\s]+):(\d+)\]")
+TIMESTAMP_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+ANSI_PATTERN = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+
+READ_CHUNK = 1024 * 1024
+
+# Missing sequences listed in a capture; missingCount has the total
+MAX_MISSING = 1000
+
+# Unexpected lines kept in a capture; unexpectedCount has the total
+MAX_UNEXPECTED = 100
+
+# Where injection manifests live, relative to the project root
+AUDITS_DIR = Path("docs") / "audits"
+
+
+class CaptureParser:
+    """Incremental state for one capture of one audit.
+
+    Feed it lines (or pre-matched markers) in input order; records for the
+    audit are returned as they are parsed, and gaps are kept up to date.
+    """
+
+    def __init__(self, audit_id: str, expected: Optional[Iterable[int]] = None):
+        self.audit_id = audit_id
+        self.expected = set(expected) if expected is not None else None
+        self.seen: set[int] = set()
+        # Sorted, disjoint (first, last) runs of missing sequences below highest
+        self.gaps: list[tuple[int, int]] = []
+        self.out_of_order: list[dict[str, int]] = []
+        self.unexpected: list[dict[str, Any]] = []
+        self.unexpected_count = 0
+        self.log_count = 0
+        self.highest = 0
+        self.last = 0
+
+    def feed(self, line: bytes) -> Optional[dict[str, Any]]:
+        """Parse one line of output, returning its log record if it is one."""
+        if MARKER not in line:
+            return None
+        match = MARKER_PATTERN.search(line)
+        if match is None:
+            return None
+        return self.feed_match(line, match)
+
+    def feed_match(self, line: bytes, match: "re.Match[bytes]") -> Optional[dict[str, Any]]:
+        """Handle a line whose marker has already been located."""
+        raw = line.decode("utf-8", errors="replace").rstrip("\r\n")
+        if "\x1b" in raw:
+            raw = ANSI_PATTERN.sub("", raw)
+
+        audit_id = match.group(1).decode("utf-8", errors="replace")
+        sequence = int(match.group(2))
+
+        if audit_id != self.audit_id:
+            self._unexpected(audit_id, sequence, raw, "other-audit")
+            return None
+        if self.expected is not None and sequence not in self.expected:
+            self._unexpected(audit_id, sequence, raw, "unexpected-sequence")
+            return None
+
+        self._track(sequence)
+
+        prefix = line[:match.start()].decode("utf-8", errors="replace")
+        timestamp = TIMESTAMP_PATTERN.search(prefix)
+        message = line[match.end():].decode("utf-8", errors="replace").strip()
+        if "\x1b" in message:
+            message = ANSI_PATTERN.sub("", message)
+
+        return {
+            "sequence": sequence,
+            "raw": raw,
+            "timestamp": timestamp.group(0) if timestamp else None,
+            "message": message,
+            "data": parse_data(message),
+        }
+
+    def _unexpected(self, audit_id: str, sequence: int, raw: str, reason: str) -> None:
+        self.unexpected_count += 1
+        if len(self.unexpected) < MAX_UNEXPECTED:
+            self.unexpected.append({"auditId": audit_id, "sequence": sequence, "raw": raw, "reason": reason})
+
+    def _track(self, sequence: int) -> None:
+        self.log_count += 1
+        if sequence < self.last and sequence not in self.seen:
+            self.out_of_order.append({"sequence": sequence, "after": self.last})
+        self.last = sequence
+
+        self.seen.add(sequence)
+        if sequence > self.highest:
+            if sequence > self.highest + 1:
+                self.gaps.append((self.highest + 1, sequence - 1))
+            self.highest = sequence
+            return
+
+        # Split the gap holding a late arrival, if any: the last one starting at or below it
+        i = bisect.bisect_right(self.gaps, (sequence + 1,)) - 1
+        if i < 0:
+            return
+        first, last = self.gaps[i]
+        if sequence > last:
+            return
+        self.gaps[i:i + 1] = [
+            (start, end) for start, end in ((first, sequence - 1), (sequence + 1, last)) if start <= end
+        ]
+
+    def missing_sequences(self, limit: Optional[int] = None) -> list[int]:
+        """Expected sequences never seen (gaps below the highest without a manifest).
+
+        Args:
+            limit: Return at most this many, lowest first
+        """
+        if self.expected is not None:
+            return sorted(self.expected - self.seen)[:limit]
+        runs = (range(first, last + 1) for first, last in self.gaps)
+        return list(itertools.islice(itertools.chain.from_iterable(runs), limit))
+
+    def missing_count(self) -> int:
+        """Number of missing sequences, however many missing_sequences lists."""
+        if self.expected is not None:
+            return len(self.expected - self.seen)
+        return sum(last - first + 1 for first, last in self.gaps)
+
+
+def parse_data(message: str) -> Any:
+    """Best-effort decode of the value a log line carries.
+
+    Tries the whole message, then the text from its first brace or bracket,
+    then the text after its last ": ". Returns None if nothing is JSON.
+    """
+    candidates = [message]
+    starts = [i for i in (message.find("{"), message.find("[")) if i > 0]
+    if starts:
+        candidates.append(message[min(starts):])
+    if ": " in message:
+        candidates.append(message.rsplit(": ", 1)[1])
+
+    for candidate in candidates:
+        try:
+            return json.loads(candidate)
+        except ValueError:
+            continue
+    return None
+
+
+def iter_mapped(path: Path, parser: CaptureParser) -> Iterator[dict[str, Any]]:
+    """Yield log records from a file, searching a memory map for markers."""
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+        with mm:
+            yield from _scan(mm, parser)
+
+
+def iter_stream(
+    stream: IO[bytes],
+    parser: CaptureParser,
+    chunk_size: int = READ_CHUNK,
+) -> Iterator[dict[str, Any]]:
+    """Yield log records from a binary stream, read in fixed-size chunks.
+
+    Each chunk is cut at its last newline and scanned like a mapped file;
+    the partial line left over is carried into the next chunk.
+    """
+    pending = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        data = pending + chunk
+        cut = data.rfind(b"\n") + 1
+        pending = data[cut:]
+        if cut:
+            yield from _scan(data[:cut], parser)
+    if pending:
+        yield from _scan(pending, parser)
+
+
+def _scan(buffer: Any, parser: CaptureParser) -> Iterator[dict[str, Any]]:
+    """Feed the lines of buffer (bytes or mmap) that carry a marker."""
+    line_end = -1
+    for match in MARKER_PATTERN.finditer(buffer):
+        if match.start() < line_end:
+            # Only the first marker on a line counts
+            continue
+        line_start = buffer.rfind(b"\n", 0, match.start()) + 1
+        line_end = buffer.find(b"\n", match.end())
+        if line_end < 0:
+            line_end = len(buffer)
+
+        line = buffer[line_start:line_end]
+        record = parser.feed_match(line, MARKER_PATTERN.match(line, match.start() - line_start))
+        if record is not None:
+            yield record
+
+
+def load_expected(injections_path: Path) -> Optional[list[int]]:
+    """Return the injection IDs in injections.json, or None if unreadable."""
+    try:
+        manifest = json.loads(injections_path.read_text(encoding="utf-8"))
+        return [int(injection["id"]) for injection in manifest.get("injections", [])]
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+def write_capture(
+    out: IO[str],
+    records: Iterable[dict[str, Any]],
+    parser: CaptureParser,
+    header: dict[str, Any],
+) -> None:
+    """Stream the capture JSON: header fields, each log record, then the summary."""
+    out.write("{")
+    for key, value in header.items():
+        out.write(f"{json.dumps(key)}: {json.dumps(value)}, ")
+
+    out.write('"logs": [')
+    first = True
+    for record in records:
+        out.write("\n  " if first else ",\n  ")
+        out.write(json.dumps(record))
+        first = False
+    out.write("\n]" if not first else "]")
+
+    summary = {
+        "sequencesSeen": sorted(parser.seen),
+        "missingSequences": parser.missing_sequences(MAX_MISSING),
+        "missingCount": parser.missing_count(),
+        "outOfOrder": parser.out_of_order,
+        "unexpectedLogs": parser.unexpected,
+        "unexpectedCount": parser.unexpected_count,
+    }
+    for key, value in summary.items():
+        out.write(f", {json.dumps(key)}: {json.dumps(value)}")
+    out.write("}\n")
+
+
+def capture(
+    audit_id: str,
+    source: Optional[Path],
+    out: IO[str],
+    expected: Optional[Iterable[int]] = None,
+    **header: Any,
+) -> CaptureParser:
+    """Parse source (a file, or stdin when None) and write the capture to out.
+
+    Args:
+        audit_id: Audit whose logs are captured; other audits' lines are unexpected
+        source: Log file to memory-map, or None to read stdin
+        out: Text stream receiving the capture JSON
+        expected: Sequences the audit injected, if known
+        **header: Extra top-level fields (captureId, method, command, scenario)
+
+    Returns:
+        The parser, holding the capture's sequence bookkeeping
+    """
+    parser = CaptureParser(audit_id, expected)
+    fields = {
+        "captureId": header.pop("captureId", None)
+        or f"capture-{datetime.now().strftime('%Y%m%dT%H%M%S')}",
+        "auditId": audit_id,
+        "capturedAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **{key: value for key, value in header.items() if value is not None},
+    }
+
+    if source is None:
+        records = iter_stream(sys.stdin.buffer, parser)
+    else:
+        records = iter_mapped(source, parser)
+    write_capture(out, records, parser, fields)
+    return parser
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = sys.argv[1:]
+    options: dict[str, Optional[str]] = {}
+
+    for flag in ("--injections", "--method", "--command", "--scenario", "--capture-id", "--output"):
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 >= len(args):
+                print(f"Error: {flag} needs a value", file=sys.stderr)
+                return 1
+            options[flag] = args[i + 1]
+            del args[i:i + 2]
+
+    if not args or len(args) > 2:
+        print(
+            "Usage: python3 audit_capture.py <audit-id> [log_file|-] [--injections PATH] "
+            "[--method paste|direct] [--command CMD] [--scenario TEXT] [--capture-id ID] "
+            "[--output PATH]",
+            file=sys.stderr,
+        )
+        return 1
+
+    audit_id = args[0]
+    source = Path(args[1]) if len(args) == 2 and args[1] != "-" else None
+    if source is not None and not source.is_file():
+        print(f"Error: {source} is not a file", file=sys.stderr)
+        return 1
+
+    injections = options.get("--injections")
+    injections_path = Path(injections) if injections else AUDITS_DIR / audit_id / "injections.json"
+    expected = load_expected(injections_path) if injections or injections_path.exists() else None
+    if injections and expected is None:
+        print(f"Error: cannot read injection IDs from {injections_path}", file=sys.stderr)
+        return 1
+
+    header = {
+        "captureId": options.get("--capture-id"),
+        "method": options.get("--method") or ("direct" if options.get("--command") else "paste"),
+        "command": options.get("--command"),
+        "scenario": options.get("--scenario"),
+    }
+
+    output = options.get("--output")
+    if output is None:
+        parser = capture(audit_id, source, sys.stdout, expected, **header)
+    else:
+        output_path = Path(output)
+        tmp_path = output_path.with_name(f"{output_path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as out:
+                parser = capture(audit_id, source, out, expected, **header)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+
+    missing = ", ".join(str(sequence) for sequence in parser.missing_sequences(20))
+    missing_count = parser.missing_count()
+    if missing_count > 20:
+        missing += f", ... ({missing_count} total)"
+    print(
+        f"[audit] {parser.log_count} logs, sequences {sorted(parser.seen)}, "
+        f"missing [{missing}], {parser.unexpected_count} unexpected",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""Compare runtime captures of the same audit.
+
+Each capture written by audit_capture.py is reduced to a digest: one entry
+per (auditId, sequence, occurrence), where occurrence counts repeats of a
+sequence (a log inside a loop) so the second pass through a line is only
+ever compared with another second pass. Each entry keeps a hash of the
+record's payload (its parsed data in canonical JSON form, or its message
+when there is none) and nothing else, so memory grows by a fixed amount per log line whatever the
+payloads hold, and two captures are compared with dict lookups in linear
+time. Hashes are only compared within one run, so Python's own string
+hash is used rather than a slower digest.
+
+Against the first (baseline) capture, every other capture reports:
+- missing: sequences the baseline logged and this capture did not
+- new: sequences this capture logged and the baseline did not
+- changed: sequences logged by both with a different payload
+- moved: sequences logged by both outside the longest run they share in
+  the same relative order (a longest increasing subsequence, which adds
+  a log factor)
+
+Capture files are streamed one record per line as audit_capture.py writes
+them; other JSON layouts are loaded whole. Payloads are only kept for the
+first few changed sequences, read back in a second pass.
+
+Usage:
+    python3 audit_diff.py <baseline.json> <capture.json>... [--examples N] [--json]
+"""
+
+import bisect
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+
+# Changed sequences whose payloads are shown, per compared capture
+DEFAULT_EXAMPLES = 5
+
+# Longest payload text kept in an example
+MAX_PAYLOAD = 200
+
+# Occurrence counts fit below this, so (sequence, occurrence) packs into one int
+_OCCURRENCE_BITS = 32
+
+
+def _key(sequence: int, occurrence: int) -> int:
+    return (sequence << _OCCURRENCE_BITS) | occurrence
+
+
+def format_key(key: int) -> str:
+    """Render a key as "sequence", or "sequence#occurrence" for repeats."""
+    sequence, occurrence = key >> _OCCURRENCE_BITS, key & ((1 << _OCCURRENCE_BITS) - 1)
+    return str(sequence) if occurrence == 1 else f"{sequence}#{occurrence}"
+
+
+def payload_text(record: dict[str, Any]) -> str:
+    """Return a record's payload as display text."""
+    data = record.get("data")
+    if data is None:
+        return str(record.get("message") or "")
+    return json.dumps(data)
+
+
+def payload_hash(record: dict[str, Any]) -> int:
+    """Hash a record's payload; equal JSON data hashes equal within a run.
+
+    Data is hashed in canonical form (sorted keys), so objects logged with
+    their keys in a different order are not reported as changed.
+    """
+    data = record.get("data")
+    if data is None:
+        return hash(str(record.get("message") or ""))
+    return hash(json.dumps(data, sort_keys=True, separators=(",", ":")))
+
+
+def read_capture(path: Path) -> tuple[dict[str, Any], Iterator[dict[str, Any]]]:
+    """Return a capture's header fields and an iterator over its log records.
+
+    Files in audit_capture.py's layout (header and "logs": [ on the first
+    line, one record per line after it) are streamed; anything else is
+    parsed as a whole JSON document.
+    """
+    with path.open(encoding="utf-8") as f:
+        first = f.readline()
+
+    if first.startswith("{") and first.rstrip().endswith('"logs": ['):
+        header = json.loads(first.rstrip() + "]}")
+        header.pop("logs")
+        return header, _stream_records(path)
+
+    capture = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(capture, dict) or not isinstance(capture.get("logs"), list):
+        raise ValueError(f"{path} is not a capture")
+    logs = capture.pop("logs")
+    return capture, iter(log for log in logs if isinstance(log, dict))
+
+
+def _stream_records(path: Path) -> Iterator[dict[str, Any]]:
+    # raw_decode skips json.loads' wrapper and stops at the record's closing brace
+    decode = json.JSONDecoder().raw_decode
+    with path.open(encoding="utf-8") as f:
+        f.readline()
+        for line in f:
+            if line.startswith("]"):
+                # End of the logs; the summary follows on the same line
+                return
+            start = line.find("{")
+            if start >= 0:
+                yield decode(line, start)[0]
+
+
+def iter_keyed(records: Iterator[dict[str, Any]]) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield (key, record), numbering repeated sequences 1, 2, 3..."""
+    occurrences: dict[int, int] = {}
+    for record in records:
+        sequence = record.get("sequence")
+        if not isinstance(sequence, int):
+            continue
+        occurrence = occurrences.get(sequence, 0) + 1
+        occurrences[sequence] = occurrence
+        yield _key(sequence, occurrence), record
+
+
+@dataclass
+class CaptureDigest:
+    """Payload hashes of one capture, keyed in arrival order."""
+
+    path: Path
+    audit_id: Optional[str]
+    capture_id: Optional[str]
+    scenario: Optional[str]
+    hashes: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def label(self) -> str:
+        """Capture ID with its scenario, for display."""
+        name = self.capture_id or self.path.name
+        return f"{name} ({self.scenario})" if self.scenario else name
+
+
+def digest_capture(path: Path) -> CaptureDigest:
+    """Stream a capture file into a CaptureDigest."""
+    header, records = read_capture(path)
+    digest = CaptureDigest(path, header.get("auditId"), header.get("captureId"), header.get("scenario"))
+    hashes = digest.hashes
+    for key, record in iter_keyed(records):
+        hashes[key] = payload_hash(record)
+    return digest
+
+
+def stable_keys(baseline_order: dict[int, int], keys: list[int]) -> set[int]:
+    """Return the keys forming a longest run in baseline order (patience LIS).
+
+    Args:
+        baseline_order: Key -> position in the baseline
+        keys: Shared keys in the other capture's order
+    """
+    tails: list[int] = []
+    tail_index: list[int] = []
+    previous = [-1] * len(keys)
+
+    for i, key in enumerate(keys):
+        position = baseline_order[key]
+        j = bisect.bisect_left(tails, position)
+        if j == len(tails):
+            tails.append(position)
+            tail_index.append(i)
+        else:
+            tails[j] = position
+            tail_index[j] = i
+        previous[i] = tail_index[j - 1] if j else -1
+
+    stable: set[int] = set()
+    i = tail_index[-1] if tail_index else -1
+    while i >= 0:
+        stable.add(keys[i])
+        i = previous[i]
+    return stable
+
+
+@dataclass
+class CaptureDiff:
+    """Differences between a baseline capture and another capture."""
+
+    baseline: CaptureDigest
+    other: CaptureDigest
+    missing: list[int]
+    new: list[int]
+    changed: list[int]
+    moved: list[int]
+    unchanged: int
+    examples: dict[int, tuple[str, str]] = field(default_factory=dict)
+
+    @property
+    def identical(self) -> bool:
+        """Check whether the captures logged the same payloads in the same order."""
+        return not (self.missing or self.new or self.changed or self.moved)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for --json output, with keys rendered by format_key."""
+        return {
+            "baseline": self.baseline.capture_id or str(self.baseline.path),
+            "capture": self.other.capture_id or str(self.other.path),
+            "scenario": self.other.scenario,
+            "missing": [format_key(key) for key in self.missing],
+            "new": [format_key(key) for key in self.new],
+            "changed": [format_key(key) for key in self.changed],
+            "moved": [format_key(key) for key in self.moved],
+            "unchanged": self.unchanged,
+            "examples": [
+                {"sequence": format_key(key), "baseline": before, "capture": after}
+                for key, (before, after) in self.examples.items()
+            ],
+        }
+
+
+def compare(baseline: CaptureDigest, other: CaptureDigest) -> CaptureDiff:
+    """Align two digests by key and classify every sequence."""
+    if baseline.audit_id != other.audit_id:
+        # Different audits share no sequences
+        return CaptureDiff(baseline, other, list(baseline.hashes), list(other.hashes), [], [], 0)
+
+    base_hashes, other_hashes = baseline.hashes, other.hashes
+    missing = [key for key in base_hashes if key not in other_hashes]
+    new: list[int] = []
+    changed: list[int] = []
+    shared: list[int] = []
+    for key, value in other_hashes.items():
+        base_value = base_hashes.get(key)
+        if base_value is None:
+            new.append(key)
+            continue
+        shared.append(key)
+        if base_value != value:
+            changed.append(key)
+
+    baseline_order = {key: i for i, key in enumerate(base_hashes) if key in other_hashes}
+    stable = stable_keys(baseline_order, shared)
+    moved = [key for key in shared if key not in stable]
+
+    return CaptureDiff(baseline, other, missing, new, changed, moved, len(shared) - len(changed))
+
+
+def collect_examples(diff: CaptureDiff, limit: int = DEFAULT_EXAMPLES) -> None:
+    """Fill diff.examples with the payloads of its first changed sequences."""
+    wanted = set(diff.changed[:limit])
+    if not wanted:
+        return
+
+    def payloads(path: Path) -> dict[int, str]:
+        found: dict[int, str] = {}
+        for key, record in iter_keyed(read_capture(path)[1]):
+            if key in wanted:
+                found[key] = payload_text(record)[:MAX_PAYLOAD]
+                if len(found) == len(wanted):
+                    break
+        return found
+
+    before, after = payloads(diff.baseline.path), payloads(diff.other.path)
+    diff.examples = {key: (before.get(key, ""), after.get(key, "")) for key in diff.changed[:limit]}
+
+
+def diff_captures(paths: list[Path], examples: int = DEFAULT_EXAMPLES) -> list[CaptureDiff]:
+    """Compare the first capture with each of the others.
+
+    Only the baseline's digest and one other digest are held at a time.
+    """
+    baseline = digest_capture(paths[0])
+    diffs = []
+    for path in paths[1:]:
+        diff = compare(baseline, digest_capture(path))
+        collect_examples(diff, examples)
+        # Drop the hashes; the diff keeps the keys it reports
+        diff.other.hashes = {}
+        diffs.append(diff)
+    return diffs
+
+
+def format_diff(diff: CaptureDiff) -> list[str]:
+    """Render a diff as text lines."""
+    def keys(values: list[int]) -> str:
+        shown = ", ".join(format_key(key) for key in values[:20])
+        return shown + (f", ... ({len(values)} total)" if len(values) > 20 else "")
+
+    lines = [f"{diff.baseline.label} -> {diff.other.label}"]
+    if diff.baseline.audit_id != diff.other.audit_id:
+        lines.append(f"  different audits: {diff.baseline.audit_id} vs {diff.other.audit_id}")
+    if diff.identical:
+        lines.append(f"  identical ({diff.unchanged} logs)")
+        return lines
+    for name in ("missing", "new", "changed", "moved"):
+        values = getattr(diff, name)
+        if values:
+            lines.append(f"  {name}: {keys(values)}")
+    for key, (before, after) in diff.examples.items():
+        lines.append(f"    {format_key(key)}: {before} -> {after}")
+    lines.append(f"  unchanged: {diff.unchanged}")
+    return lines
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = sys.argv[1:]
+    examples = DEFAULT_EXAMPLES
+    as_json = False
+
+    if "--json" in args:
+        args.remove("--json")
+        as_json = True
+    if "--examples" in args:
+        i = args.index("--examples")
+        try:
+            examples = max(int(args[i + 1]), 0)
+        except (IndexError, ValueError):
+            print("Error: --examples needs an integer", file=sys.stderr)
+            return 1
+        del args[i:i + 2]
+
+    if len(args) < 2:
+        print(
+            "Usage: python3 audit_diff.py <baseline.json> <capture.json>... [--examples N] [--json]",
+            file=sys.stderr,
+        )
+        return 1
+
+    paths = [Path(arg) for arg in args]
+    for path in paths:
+        if not path.is_file():
+            print(f"Error: {path} is not a file", file=sys.stderr)
+            return 1
+
+    try:
+        diffs = diff_captures(paths, examples)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot read capture: {e}", file=sys.stderr)
+        return 1
+
+    if as_json:
+        print(json.dumps([diff.to_dict() for diff in diffs], indent=2))
+    else:
+        for diff in diffs:
+            print("\n".join(format_diff(diff)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
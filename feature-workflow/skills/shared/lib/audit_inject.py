@@ -0,0 +1,398 @@
+#!/usr/bin/env python3
+"""Apply and revert feature-audit log injections from injections.json.
+
+The manifest (docs/audits/[audit-id]/injections.json, see
+skills/feature-audit/injection-active.md) lists each injection with its
+file, 1-based target line, position (before/after/replace, default after)
+and content. Injections are grouped by file (paths normalized, so
+"./src/a.ts" and "src/a.ts" are the same file) and each file is rewritten
+once:
+
+- apply: every injection for the file is placed in a single pass over its
+  original lines, so line numbers in the manifest never need adjusting
+  for earlier insertions; the resulting injectedLine is recorded.
+- revert: injected lines are found at their recorded injectedLine, or by
+  content if the file has shifted since, and removed (or, for replace,
+  swapped back to originalContent) in one pass.
+
+Files are processed in parallel and written through a temp file plus
+os.replace, so a file is never left half-written. Each injection's status
+(injected/removed/failed) and any error are written back to the manifest.
+
+Usage:
+    python3 audit_inject.py <apply|revert> <audit-id> [--root DIR] [--workers N]
+"""
+
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    from .audit_state import normalize_file
+except ImportError:
+    from audit_state import normalize_file
+
+
+POSITIONS = ("before", "after", "replace")
+
+# Where injection manifests live, relative to the project root
+AUDITS_DIR = Path("docs") / "audits"
+
+
+def manifest_path(project_root: Path, audit_id: str) -> Path:
+    """Return the injections.json path for an audit."""
+    return project_root / AUDITS_DIR / audit_id / "injections.json"
+
+
+def load_manifest(path: Path) -> dict[str, Any]:
+    """Read an injections.json manifest."""
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("injections"), list):
+        raise ValueError(f"{path} has no injections list")
+    return manifest
+
+
+def save_manifest(path: Path, manifest: dict[str, Any]) -> None:
+    """Atomically write the manifest back, keeping it human-readable."""
+    _replace_text(path, json.dumps(manifest, indent=2) + "\n")
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _content(injection: dict[str, Any]) -> str:
+    # Strategy entries call it "code", manifest entries "injectedContent"
+    return injection.get("injectedContent") or injection.get("code") or ""
+
+
+def _indent(line: str) -> str:
+    return line[:len(line) - len(line.lstrip(" \t"))]
+
+
+def _newline(lines: list[str]) -> str:
+    for line in lines:
+        if line.endswith("\r\n"):
+            return "\r\n"
+        if line.endswith("\n"):
+            return "\n"
+    return "\n"
+
+
+def _fail(injection: dict[str, Any], error: str) -> None:
+    injection["status"] = "failed"
+    injection["error"] = error
+
+
+def _read_lines(path: Path) -> list[str]:
+    with path.open(encoding="utf-8", newline="") as f:
+        return f.readlines()
+
+
+def _replace_text(path: Path, content: str) -> None:
+    """Write content via a temp file in the same directory, keeping the file mode."""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        try:
+            os.chmod(tmp_path, path.stat().st_mode & 0o7777)
+        except OSError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def apply_file(path: Path, injections: list[dict[str, Any]]) -> int:
+    """Apply a file's pending injections in one read-modify-write.
+
+    Line numbers always refer to the file without injections. When some of
+    the file's entries are already injected (a retry after a partial
+    failure), their lines are taken out first and every entry is placed
+    again in the same pass, so pending entries land where they would have
+    the first time. Each placed entry is updated in place with its status,
+    injectedLine and, for replace, the originalContent it displaced.
+
+    Returns:
+        Number of pending injections applied
+    """
+    pending = [inj for inj in injections if inj.get("status") != "injected"]
+    if not pending:
+        return 0
+
+    try:
+        lines = _read_lines(path)
+    except (OSError, UnicodeDecodeError) as e:
+        for injection in pending:
+            _fail(injection, f"cannot read {path}: {e}")
+        return 0
+
+    injected = [inj for inj in injections if inj.get("status") == "injected"]
+    if injected:
+        found = _locate_injected(lines, injected)
+        if len(found) < len(injected):
+            for injection in pending:
+                _fail(injection, "earlier injections not found in the file; revert it first")
+            return 0
+        lines = _strip_injected(lines, found)
+        # Place every entry again, the injected ones included
+        pending = list(injections)
+
+    newline = _newline(lines)
+    final_newline = not lines or lines[-1].endswith(("\n", "\r"))
+    if not final_newline:
+        lines[-1] += newline
+
+    # Original line number -> injections, in manifest order
+    by_line: dict[int, list[dict[str, Any]]] = {}
+    for injection in pending:
+        line_no, position = injection.get("line"), injection.setdefault("position", "after")
+        if position not in POSITIONS:
+            _fail(injection, f"unknown position {position!r}")
+        elif not isinstance(line_no, int) or not 1 <= line_no <= len(lines):
+            _fail(injection, f"line {line_no} is outside 1-{len(lines)}")
+        elif not _content(injection):
+            _fail(injection, "no injectedContent")
+        else:
+            by_line.setdefault(line_no, []).append(injection)
+
+    replaced = {
+        line_no for line_no, group in by_line.items()
+        if sum(inj.get("position") == "replace" for inj in group) > 1
+    }
+    for line_no in replaced:
+        for injection in by_line.pop(line_no):
+            _fail(injection, f"more than one replace for line {line_no}")
+
+    if not by_line and not injected:
+        return 0
+
+    out: list[str] = []
+    injected_at = _now()
+    applied = 0
+
+    def emit(injection: dict[str, Any], target: str) -> None:
+        nonlocal applied
+        content = _content(injection)
+        if not content[:1].isspace():
+            content = _indent(target) + content
+        out.append(content.rstrip("\r\n") + newline)
+        if injection.get("status") != "injected":
+            injection["injectedAt"] = injected_at
+            applied += 1
+        injection.update(status="injected", injectedLine=len(out))
+        injection.pop("error", None)
+
+    for line_no, line in enumerate(lines, 1):
+        group = by_line.get(line_no)
+        if group is None:
+            out.append(line)
+            continue
+
+        for injection in group:
+            if injection.get("position") == "before":
+                emit(injection, line)
+
+        replacement = next((inj for inj in group if inj.get("position") == "replace"), None)
+        if replacement is None:
+            out.append(line)
+        else:
+            replacement["originalContent"] = line.rstrip("\r\n")
+            emit(replacement, line)
+
+        for injection in group:
+            if injection.get("position") == "after":
+                emit(injection, line)
+
+    if not final_newline:
+        out[-1] = out[-1].rstrip("\r\n")
+    _replace_text(path, "".join(out))
+    return applied
+
+
+def revert_file(path: Path, injections: list[dict[str, Any]]) -> int:
+    """Remove a file's injected lines in one read-modify-write.
+
+    Injections whose line cannot be found keep status "injected" and get an
+    error, so a later revert retries them.
+
+    Returns:
+        Number of injections removed
+    """
+    active = [inj for inj in injections if inj.get("status") == "injected"]
+    if not active:
+        return 0
+
+    try:
+        lines = _read_lines(path)
+    except (OSError, UnicodeDecodeError) as e:
+        for injection in active:
+            injection["error"] = f"cannot read {path}: {e}"
+        return 0
+
+    found = _locate_injected(lines, active)
+    found_ids = {id(injection) for injection in found.values()}
+    for injection in active:
+        if id(injection) not in found_ids:
+            injection["error"] = "injected line not found"
+
+    if not found:
+        return 0
+
+    out = _strip_injected(lines, found)
+    removed_at = _now()
+    for injection in found.values():
+        injection.update(status="removed", removedAt=removed_at)
+        injection.pop("error", None)
+
+    _replace_text(path, "".join(out))
+    return len(found)
+
+
+def _locate_injected(lines: list[str], injections: list[dict[str, Any]]) -> dict[int, dict[str, Any]]:
+    """Return line index -> injection for each injected line that can be found.
+
+    A line is found at its recorded injectedLine, or, if the file shifted
+    since, at the nearest unclaimed line with the injection's content.
+    """
+    stripped = [line.strip() for line in lines]
+    found: dict[int, dict[str, Any]] = {}
+
+    def locate(injection: dict[str, Any]) -> Optional[int]:
+        content = _content(injection).strip()
+        hint = injection.get("injectedLine")
+        if isinstance(hint, int) and 0 < hint <= len(lines):
+            if hint - 1 not in found and stripped[hint - 1] == content:
+                return hint - 1
+        candidates = [i for i, text in enumerate(stripped) if text == content and i not in found]
+        if not candidates:
+            return None
+        anchor = (hint - 1) if isinstance(hint, int) else 0
+        return min(candidates, key=lambda i: abs(i - anchor))
+
+    for injection in injections:
+        index = locate(injection)
+        if index is not None:
+            found[index] = injection
+    return found
+
+
+def _strip_injected(lines: list[str], found: dict[int, dict[str, Any]]) -> list[str]:
+    """Return lines without the found injections, restoring replaced lines."""
+    out = []
+    for index, line in enumerate(lines):
+        injection = found.get(index)
+        if injection is None:
+            out.append(line)
+        elif injection.get("position") == "replace":
+            ending = line[len(line.rstrip("\r\n")):]
+            out.append(injection.get("originalContent", "") + ending)
+
+    if out and lines and not lines[-1].endswith(("\n", "\r")):
+        out[-1] = out[-1].rstrip("\r\n")
+    return out
+
+
+def run(
+    project_root: Path,
+    manifest: dict[str, Any],
+    revert: bool = False,
+    workers: Optional[int] = None,
+) -> dict[str, int]:
+    """Apply or revert every injection in a manifest, one task per file.
+
+    Manifest entries are updated in place; the caller saves the manifest.
+
+    Returns:
+        File (normalized project-relative path) -> injections applied or removed
+    """
+    by_file: dict[str, list[dict[str, Any]]] = {}
+    for injection in manifest["injections"]:
+        file_name = injection.get("file")
+        if not file_name:
+            _fail(injection, "no file")
+            continue
+        by_file.setdefault(normalize_file(file_name), []).append(injection)
+
+    operation = revert_file if revert else apply_file
+
+    def process(item: tuple[str, list[dict[str, Any]]]) -> int:
+        file_name, injections = item
+        return operation(project_root / file_name, injections)
+
+    items = list(by_file.items())
+    workers = min(workers or os.cpu_count() or 1, max(len(items), 1))
+    if workers <= 1:
+        counts = [process(item) for item in items]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            counts = list(executor.map(process, items))
+
+    return dict(zip(by_file, counts))
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = sys.argv[1:]
+    project_root = Path.cwd()
+    workers: Optional[int] = None
+
+    for flag in ("--root", "--workers"):
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 >= len(args):
+                print(f"Error: {flag} needs a value", file=sys.stderr)
+                return 1
+            value = args[i + 1]
+            del args[i:i + 2]
+            if flag == "--root":
+                project_root = Path(value)
+            else:
+                try:
+                    workers = int(value)
+                except ValueError:
+                    print("Error: --workers needs an integer", file=sys.stderr)
+                    return 1
+
+    if len(args) != 2 or args[0] not in ("apply", "revert"):
+        print("Usage: python3 audit_inject.py <apply|revert> <audit-id> [--root DIR] [--workers N]", file=sys.stderr)
+        return 1
+
+    command, audit_id = args
+    path = manifest_path(project_root, audit_id)
+    try:
+        manifest = load_manifest(path)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot read {path}: {e}", file=sys.stderr)
+        return 1
+
+    counts = run(project_root, manifest, revert=command == "revert", workers=workers)
+    if command == "apply":
+        manifest["injectedAt"] = _now()
+    save_manifest(path, manifest)
+
+    verb = "injected" if command == "apply" else "removed"
+    for file_name, count in counts.items():
+        print(f"{file_name}\t{count} {verb}")
+
+    failed = [inj for inj in manifest["injections"] if inj.get("error")]
+    for injection in failed:
+        print(
+            f"[audit] Failed #{injection.get('id')} {injection.get('file')}:{injection.get('line')}: "
+            f"{injection.get('error')}",
+            file=sys.stderr,
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
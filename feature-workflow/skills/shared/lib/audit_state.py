@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""Indexed view of docs/audits/registry.json and the audits' manifests.
+
+The registry lists every audit ever run (see skills/feature-audit/target.md),
+so finding the active ones by reading it and then each active audit's
+injections.json gets slower as history grows. This module keeps an index
+in docs/audits/.registry-index.json:
+
+    {"version": 1, "registry": [mtime_ns, size],
+     "audits": {id: registry entry},
+     "byStatus": {status: [ids]},
+     "byFile": {file: [ids]},
+     "manifests": {id: {"signature": [mtime_ns, size], "files": {file: injected}}}}
+
+docs/audits/.registry-active.json holds the same fields restricted to the
+active audits, so the common questions ("which audits are active?", "is
+this file under an active audit?") read a file whose size does not grow
+with history.
+
+Writes made through set_audit update the registry and both indexes
+together. Loads are validated against the stat signatures of registry.json
+and of the active audits' injections.json only, and loaded indexes are
+memoized per project. Any other change to registry.json (an agent editing
+it directly) triggers a rebuild, which re-parses only the manifests whose
+signature changed.
+
+Usage:
+    python3 audit_state.py [--root DIR] active
+    python3 audit_state.py [--root DIR] file <path>
+    python3 audit_state.py [--root DIR] set <audit-id> <status> [--name NAME]
+    python3 audit_state.py [--root DIR] rebuild
+"""
+
+import bisect
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+
+# Where audits live, relative to the project root
+AUDITS_DIR = Path("docs") / "audits"
+REGISTRY_FILENAME = "registry.json"
+INDEX_FILENAME = ".registry-index.json"
+ACTIVE_FILENAME = ".registry-active.json"
+INDEX_VERSION = 1
+
+# Registry statuses during which injections may be live in the code. The
+# feature-audit phases register an audit as in-progress and set it to
+# completed at cleanup; no other status is written.
+ACTIVE_STATUSES = ("in-progress",)
+
+# (audits directory, index filename) -> index loaded from it in this process
+_loaded: dict[tuple[Path, str], "AuditIndex"] = {}
+
+
+def _signature(path: Path) -> Optional[list[int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def normalize_file(file_name: str) -> str:
+    """Normalize a project-relative path the way the index stores it."""
+    return os.path.normpath(file_name).replace(os.sep, "/")
+
+
+def read_manifest_files(manifest_path: Path) -> Optional[dict[str, int]]:
+    """Return {file: injected count} for a manifest, or None if unreadable.
+
+    Every file the manifest mentions is included, with 0 when none of its
+    injections is still marked injected.
+    """
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        injections = manifest["injections"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+    files: dict[str, int] = {}
+    for injection in injections if isinstance(injections, list) else ():
+        if isinstance(injection, dict) and injection.get("file"):
+            file_name = normalize_file(str(injection["file"]))
+            files[file_name] = files.get(file_name, 0) + (injection.get("status") == "injected")
+    return files
+
+
+class AuditIndex:
+    """Registry entries with status and file lookups.
+
+    Lists in byStatus and byFile are kept sorted so that incremental updates
+    and full rebuilds produce identical indexes.
+    """
+
+    def __init__(self, data: Optional[dict[str, Any]] = None):
+        data = data or {}
+        self.registry: Optional[list[int]] = data.get("registry")
+        self.audits: dict[str, dict[str, Any]] = data.get("audits", {})
+        self.by_status: dict[str, list[str]] = data.get("byStatus", {})
+        self.by_file: dict[str, list[str]] = data.get("byFile", {})
+        self.manifests: dict[str, dict[str, Any]] = data.get("manifests", {})
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the on-disk index."""
+        return {
+            "version": INDEX_VERSION,
+            "registry": self.registry,
+            "audits": self.audits,
+            "byStatus": self.by_status,
+            "byFile": self.by_file,
+            "manifests": self.manifests,
+        }
+
+    def get(self, audit_id: str) -> Optional[dict[str, Any]]:
+        """Return an audit's registry entry, or None."""
+        return self.audits.get(audit_id)
+
+    def ids_with_status(self, *statuses: str) -> list[str]:
+        """Return the IDs of audits in any of the given statuses."""
+        return sorted(audit_id for status in statuses for audit_id in self.by_status.get(status, ()))
+
+    def active_ids(self) -> list[str]:
+        """Return the IDs of audits whose session is still active."""
+        return self.ids_with_status(*ACTIVE_STATUSES)
+
+    def is_active(self, audit_id: str) -> bool:
+        """Check whether an audit is registered with an active status."""
+        return self.audits.get(audit_id, {}).get("status") in ACTIVE_STATUSES
+
+    def files(self, audit_id: str) -> dict[str, int]:
+        """Return {file: injected count} from an audit's manifest."""
+        return self.manifests.get(audit_id, {}).get("files", {})
+
+    def audits_for_file(self, file_name: str, active_only: bool = True) -> list[str]:
+        """Return the audits whose manifest lists file_name.
+
+        Args:
+            file_name: Project-relative path
+            active_only: Only include audits with an active status
+        """
+        audit_ids = self.by_file.get(normalize_file(file_name), [])
+        if active_only:
+            return [audit_id for audit_id in audit_ids if self.is_active(audit_id)]
+        return list(audit_ids)
+
+    def active_view(self) -> "AuditIndex":
+        """Return an index holding only the active audits."""
+        view = AuditIndex()
+        view.registry = self.registry
+        for audit_id in self.active_ids():
+            view.put_audit(self.audits[audit_id])
+            view.put_manifest(audit_id, self.manifests.get(audit_id, {}).get("signature"), self.files(audit_id))
+        return view
+
+    def put_audit(self, entry: dict[str, Any]) -> None:
+        """Add or replace a registry entry, moving it between status lists."""
+        audit_id = entry["id"]
+        previous = self.audits.get(audit_id)
+        if previous is not None:
+            _discard(self.by_status, previous.get("status"), audit_id)
+        self.audits[audit_id] = entry
+        _insert(self.by_status, entry.get("status"), audit_id)
+
+    def put_manifest(self, audit_id: str, signature: Optional[list[int]], files: dict[str, int]) -> None:
+        """Record an audit's manifest signature and files, updating byFile."""
+        for file_name in self.files(audit_id):
+            _discard(self.by_file, file_name, audit_id)
+        self.manifests[audit_id] = {"signature": signature, "files": files}
+        for file_name in files:
+            _insert(self.by_file, file_name, audit_id)
+
+
+def _insert(index: dict[str, list[str]], key: Any, audit_id: str) -> None:
+    if not isinstance(key, str):
+        return
+    ids = index.setdefault(key, [])
+    i = bisect.bisect_left(ids, audit_id)
+    if i == len(ids) or ids[i] != audit_id:
+        ids.insert(i, audit_id)
+
+
+def _discard(index: dict[str, list[str]], key: Any, audit_id: str) -> None:
+    ids = index.get(key) if isinstance(key, str) else None
+    if not ids:
+        return
+    i = bisect.bisect_left(ids, audit_id)
+    if i < len(ids) and ids[i] == audit_id:
+        del ids[i]
+        if not ids:
+            del index[key]
+
+
+def _is_fresh(index: AuditIndex, audits_dir: Path) -> bool:
+    """Check the registry and active manifests against their recorded signatures."""
+    if _signature(audits_dir / REGISTRY_FILENAME) != index.registry:
+        return False
+    return all(
+        _signature(audits_dir / audit_id / "injections.json") == index.manifests.get(audit_id, {}).get("signature")
+        for audit_id in index.active_ids()
+    )
+
+
+def read_registry(audits_dir: Path) -> list[dict[str, Any]]:
+    """Return the registry's audit entries, skipping malformed ones."""
+    try:
+        data = json.loads((audits_dir / REGISTRY_FILENAME).read_text(encoding="utf-8"))
+        audits = data["audits"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+    if not isinstance(audits, list):
+        return []
+    return [entry for entry in audits if isinstance(entry, dict) and isinstance(entry.get("id"), str)]
+
+
+def rebuild_index(audits_dir: Path, previous: Optional[AuditIndex] = None) -> AuditIndex:
+    """Build the index from registry.json, reusing unchanged manifests from previous."""
+    index = AuditIndex()
+    index.registry = _signature(audits_dir / REGISTRY_FILENAME)
+    old_manifests = previous.manifests if previous is not None else {}
+
+    for entry in read_registry(audits_dir):
+        audit_id = entry["id"]
+        index.put_audit(entry)
+
+        signature = _signature(audits_dir / audit_id / "injections.json")
+        old = old_manifests.get(audit_id)
+        if old is not None and old.get("signature") == signature:
+            files = old.get("files", {})
+        else:
+            files = read_manifest_files(audits_dir / audit_id / "injections.json") or {}
+        index.put_manifest(audit_id, signature, files)
+
+    return index
+
+
+def read_index(audits_dir: Path, filename: str = INDEX_FILENAME) -> Optional[AuditIndex]:
+    """Read an on-disk index, returning None if missing, stale or corrupt."""
+    try:
+        data = json.loads((audits_dir / filename).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+    return AuditIndex(data)
+
+
+def write_index(audits_dir: Path, index: AuditIndex, filename: str = INDEX_FILENAME) -> None:
+    """Atomically write an on-disk index. Failures are non-fatal."""
+    index_path = audits_dir / filename
+    tmp_path = index_path.with_name(f"{filename}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(index.to_dict(), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _load_fresh(audits_dir: Path, filename: str) -> Optional[AuditIndex]:
+    """Return the memoized or stored index if it is still valid."""
+    index = _loaded.get((audits_dir, filename))
+    if index is not None and _is_fresh(index, audits_dir):
+        return index
+    index = read_index(audits_dir, filename)
+    if index is not None and _is_fresh(index, audits_dir):
+        _loaded[(audits_dir, filename)] = index
+        return index
+    return None
+
+
+def _store(audits_dir: Path, index: AuditIndex) -> None:
+    """Write and memoize the full index and its active view."""
+    view = index.active_view()
+    if audits_dir.is_dir():
+        write_index(audits_dir, index)
+        write_index(audits_dir, view, ACTIVE_FILENAME)
+    _loaded[(audits_dir, INDEX_FILENAME)] = index
+    _loaded[(audits_dir, ACTIVE_FILENAME)] = view
+
+
+def load_index(project_root: Path) -> AuditIndex:
+    """Return an up-to-date index of every audit in a project.
+
+    Tries, in order: the index already loaded in this process, the on-disk
+    index, and a rebuild (which is then written back).
+    """
+    audits_dir = project_root / AUDITS_DIR
+    index = _load_fresh(audits_dir, INDEX_FILENAME)
+    if index is not None:
+        return index
+
+    previous = _loaded.get((audits_dir, INDEX_FILENAME)) or read_index(audits_dir)
+    index = rebuild_index(audits_dir, previous)
+    _store(audits_dir, index)
+    return index
+
+
+def load_active(project_root: Path) -> AuditIndex:
+    """Return an up-to-date index of a project's active audits only.
+
+    Falls back to load_index (and refreshes the stored view) when the
+    stored view is missing or stale.
+    """
+    audits_dir = project_root / AUDITS_DIR
+    view = _load_fresh(audits_dir, ACTIVE_FILENAME)
+    if view is not None:
+        return view
+
+    view = load_index(project_root).active_view()
+    if audits_dir.is_dir():
+        write_index(audits_dir, view, ACTIVE_FILENAME)
+    _loaded[(audits_dir, ACTIVE_FILENAME)] = view
+    return view
+
+
+def set_audit(project_root: Path, audit_id: str, **fields: Any) -> dict[str, Any]:
+    """Create or update an audit's registry entry and the index with it.
+
+    The audit's manifest is re-read too, so calling this after injecting or
+    cleaning up keeps its files current.
+
+    Args:
+        project_root: Project root containing docs/audits
+        audit_id: Audit to update
+        **fields: Registry fields to set, such as status, name, completedAt
+
+    Returns:
+        The updated registry entry
+    """
+    audits_dir = project_root / AUDITS_DIR
+    index = load_index(project_root)
+    registry_path = audits_dir / REGISTRY_FILENAME
+
+    try:
+        data = json.loads(registry_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        data = {"audits": []}
+    if not isinstance(data, dict) or not isinstance(data.get("audits"), list):
+        raise ValueError(f"{registry_path} has no audits list")
+
+    entry = next((e for e in data["audits"] if isinstance(e, dict) and e.get("id") == audit_id), None)
+    if entry is None:
+        entry = {"id": audit_id, "createdAt": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+        data["audits"].append(entry)
+    entry.update(fields)
+
+    audits_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = registry_path.with_name(f"{REGISTRY_FILENAME}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, registry_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+    index.registry = _signature(registry_path)
+    index.put_audit(dict(entry))
+    manifest = audits_dir / audit_id / "injections.json"
+    index.put_manifest(audit_id, _signature(manifest), read_manifest_files(manifest) or {})
+    _store(audits_dir, index)
+    return entry
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = sys.argv[1:]
+    project_root = Path.cwd()
+    name: Optional[str] = None
+
+    for flag in ("--root", "--name"):
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 >= len(args):
+                print(f"Error: {flag} needs a value", file=sys.stderr)
+                return 1
+            if flag == "--root":
+                project_root = Path(args[i + 1])
+            else:
+                name = args[i + 1]
+            del args[i:i + 2]
+
+    usage = (
+        "Usage: python3 audit_state.py [--root DIR] "
+        "<active | file <path> | set <audit-id> <status> [--name NAME] | rebuild>"
+    )
+    if not args or args[0] not in ("active", "file", "set", "rebuild"):
+        print(usage, file=sys.stderr)
+        return 1
+    command, args = args[0], args[1:]
+    if len(args) != {"active": 0, "file": 1, "set": 2, "rebuild": 0}[command]:
+        print(usage, file=sys.stderr)
+        return 1
+
+    if command == "set":
+        audit_id, status = args
+        fields: dict[str, Any] = {"status": status}
+        if name is not None:
+            fields["name"] = name
+        if status == "completed":
+            fields["completedAt"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        try:
+            entry = set_audit(project_root, audit_id, **fields)
+        except (OSError, ValueError) as e:
+            print(f"Error: cannot update registry: {e}", file=sys.stderr)
+            return 1
+        print(json.dumps(entry, indent=2))
+        return 0
+
+    audits_dir = project_root / AUDITS_DIR
+    if command == "rebuild":
+        index = rebuild_index(audits_dir)
+        _store(audits_dir, index)
+        print(f"[audit] Indexed {len(index.audits)} audits, {len(index.active_ids())} active", file=sys.stderr)
+        return 0
+
+    index = load_active(project_root)
+    if command == "active":
+        print(json.dumps([
+            {**index.audits[audit_id], "files": index.files(audit_id)}
+            for audit_id in index.active_ids()
+        ], indent=2))
+        return 0
+
+    file_name = Path(args[0])
+    if file_name.is_absolute():
+        try:
+            file_name = file_name.resolve().relative_to(project_root.resolve())
+        except ValueError:
+            return 0
+    for audit_id in index.audits_for_file(str(file_name)):
+        entry = index.audits[audit_id]
+        injected = index.files(audit_id).get(normalize_file(str(file_name)), 0)
+        print(f"{audit_id}\t{entry.get('status')}\t{injected}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
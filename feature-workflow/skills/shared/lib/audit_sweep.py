@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Find leftover feature-audit markers anywhere in a repository.
+
+After cleanup no `[AUDIT:` log or `AUDIT-INJECTED` comment should remain.
+This sweep lists candidate files (git ls-files when the root is a git
+checkout, otherwise a walk honouring .gitignore files), checks each file's
+bytes for the markers, and only decodes the files that contain one. Files
+are checked in batches on a thread pool.
+
+Every hit is cross-checked against docs/audits/*/injections.json:
+- tracked: the line is an injection its manifest still lists as injected
+- orphaned: anything else (already reverted, or never recorded)
+
+Manifests under docs/audits themselves are not scanned.
+
+Usage:
+    python3 audit_sweep.py [--root DIR] [--workers N] [--json]
+
+Exits 1 when any orphaned marker is found.
+"""
+
+import fnmatch
+import json
+import os
+import re
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:
+    from .audit_state import normalize_file
+except ImportError:
+    from audit_state import normalize_file
+
+
+MARKERS = (b"[AUDIT:", b"AUDIT-INJECTED")
+MARKER_PATTERN = re.compile(r"\[AUDIT:([^:\]\s]+):(\d+)\]")
+
+# Where injection manifests live, relative to the project root
+AUDITS_DIR = "docs/audits"
+
+# Files are handed to workers in batches to keep pool overhead low
+BATCH_SIZE = 256
+
+# Files with a NUL byte in their head are treated as binary and skipped
+BINARY_SNIFF = 8192
+
+# Longest line text kept in a hit
+MAX_TEXT = 200
+
+
+@dataclass
+class MarkerHit:
+    """One line containing an audit marker."""
+
+    file: str
+    line: int
+    text: str
+    audit_id: Optional[str]
+    sequence: Optional[int]
+    status: str = "orphaned"
+    injection_id: Optional[int] = None
+
+
+def list_files(root: Path) -> list[str]:
+    """Return candidate files relative to root, with .gitignore applied."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root, capture_output=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return sorted(walk_files(root))
+    return sorted({name for name in result.stdout.decode("utf-8", errors="replace").split("\0") if name})
+
+
+def walk_files(root: Path) -> Iterator[str]:
+    """Walk root, skipping .git and paths ignored by any .gitignore on the way.
+
+    Supports the common .gitignore subset: globs, "dir/" patterns, rooted
+    "/pattern"s, patterns with slashes, "**", and "!" negation.
+    """
+    # (directory relative to root, pattern, dir_only, negate)
+    inherited: list[tuple[str, str, bool, bool]] = []
+    stack = [("", inherited)]
+
+    while stack:
+        rel_dir, rules = stack.pop()
+        directory = root / rel_dir
+        rules = rules + _read_gitignore(directory / ".gitignore", rel_dir)
+
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if entry.name == ".git" or _ignored(rel_path, is_dir, rules):
+                continue
+            if is_dir:
+                stack.append((rel_path, rules))
+            elif entry.is_file(follow_symlinks=False):
+                yield rel_path
+
+
+def _read_gitignore(path: Path, rel_dir: str) -> list[tuple[str, str, bool, bool]]:
+    try:
+        lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return []
+
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        dir_only = line.endswith("/")
+        pattern = line.rstrip("/")
+        if pattern:
+            rules.append((rel_dir, pattern, dir_only, negate))
+    return rules
+
+
+def _ignored(rel_path: str, is_dir: bool, rules: list[tuple[str, str, bool, bool]]) -> bool:
+    ignored = False
+    for base, pattern, dir_only, negate in rules:
+        if dir_only and not is_dir:
+            continue
+        local = rel_path[len(base) + 1:] if base else rel_path
+        if "/" in pattern:
+            matched = fnmatch.fnmatchcase(local, pattern.lstrip("/")) or (
+                pattern.startswith("**/") and fnmatch.fnmatchcase(local, pattern[3:])
+            )
+        else:
+            matched = fnmatch.fnmatchcase(local.rsplit("/", 1)[-1], pattern)
+        if matched:
+            ignored = not negate
+    return ignored
+
+
+def scan_file(root: Path, rel_path: str) -> list[MarkerHit]:
+    """Return the marker lines in one file (empty for most files)."""
+    try:
+        data = (root / rel_path).read_bytes()
+    except OSError:
+        return []
+    if not any(marker in data for marker in MARKERS):
+        return []
+    if b"\0" in data[:BINARY_SNIFF]:
+        return []
+
+    hits = []
+    for line_no, line in enumerate(data.decode("utf-8", errors="replace").splitlines(), 1):
+        if "[AUDIT:" not in line and "AUDIT-INJECTED" not in line:
+            continue
+        match = MARKER_PATTERN.search(line)
+        hits.append(MarkerHit(
+            file=rel_path,
+            line=line_no,
+            text=line.strip()[:MAX_TEXT],
+            audit_id=match.group(1) if match else None,
+            sequence=int(match.group(2)) if match else None,
+        ))
+    return hits
+
+
+def load_injections(root: Path) -> dict[tuple[str, str], dict[str, Any]]:
+    """Index every manifest's injections by (normalized file, stripped content).
+
+    Unreadable manifests are skipped.
+    """
+    index: dict[tuple[str, str], dict[str, Any]] = {}
+    for manifest_path in sorted((root / AUDITS_DIR).glob("*/injections.json")):
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            injections = manifest["injections"]
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        for injection in injections:
+            if not isinstance(injection, dict):
+                continue
+            content = (injection.get("injectedContent") or injection.get("code") or "").strip()
+            if injection.get("file") and content:
+                key = (normalize_file(injection["file"]), content[:MAX_TEXT])
+                # Prefer an entry still marked injected when content repeats
+                if key not in index or injection.get("status") == "injected":
+                    index[key] = injection
+    return index
+
+
+def sweep(root: Path, workers: Optional[int] = None) -> tuple[int, list[MarkerHit]]:
+    """Scan the repository and classify every marker hit.
+
+    Returns:
+        Tuple of (files scanned, hits sorted by file and line)
+    """
+    files = [
+        name for name in list_files(root)
+        if not (name == AUDITS_DIR or name.startswith(AUDITS_DIR + "/"))
+    ]
+    batches = [files[i:i + BATCH_SIZE] for i in range(0, len(files), BATCH_SIZE)]
+
+    def scan_batch(batch: list[str]) -> list[MarkerHit]:
+        return [hit for rel_path in batch for hit in scan_file(root, rel_path)]
+
+    workers = min(workers or (os.cpu_count() or 1) * 2, max(len(batches), 1))
+    if workers <= 1:
+        results = [scan_batch(batch) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(scan_batch, batches))
+
+    hits = [hit for batch_hits in results for hit in batch_hits]
+    if hits:
+        injections = load_injections(root)
+        for hit in hits:
+            injection = injections.get((hit.file, hit.text))
+            if injection is not None and injection.get("status") == "injected":
+                hit.status = "tracked"
+                hit.injection_id = injection.get("id")
+    return len(files), hits
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = sys.argv[1:]
+    root = Path.cwd()
+    workers: Optional[int] = None
+    as_json = False
+
+    if "--json" in args:
+        args.remove("--json")
+        as_json = True
+    for flag in ("--root", "--workers"):
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 >= len(args):
+                print(f"Error: {flag} needs a value", file=sys.stderr)
+                return 1
+            value = args[i + 1]
+            del args[i:i + 2]
+            if flag == "--root":
+                root = Path(value)
+            else:
+                try:
+                    workers = int(value)
+                except ValueError:
+                    print("Error: --workers needs an integer", file=sys.stderr)
+                    return 1
+
+    if args:
+        print("Usage: python3 audit_sweep.py [--root DIR] [--workers N] [--json]", file=sys.stderr)
+        return 1
+    if not root.is_dir():
+        print(f"Error: {root} is not a directory", file=sys.stderr)
+        return 1
+
+    scanned, hits = sweep(root, workers=workers)
+    orphaned = [hit for hit in hits if hit.status == "orphaned"]
+
+    if as_json:
+        print(json.dumps({
+            "filesScanned": scanned,
+            "tracked": [asdict(hit) for hit in hits if hit.status == "tracked"],
+            "orphaned": [asdict(hit) for hit in orphaned],
+        }, indent=2))
+    else:
+        for hit in hits:
+            print(f"{hit.status}\t{hit.file}:{hit.line}\t{hit.text}")
+
+    print(
+        f"[audit] {scanned} files scanned, {len(hits)} markers: "
+        f"{len(hits) - len(orphaned)} tracked, {len(orphaned)} orphaned",
+        file=sys.stderr,
+    )
+    return 1 if orphaned else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Debounced, coalescing dashboard regeneration.
+
+Skills often write idea.md, plan.md and shipped.md back to back, and each
+write fires the PostToolUse hook. Instead of regenerating the dashboard on
+every write, each caller records itself in a "dirty" marker file, waits for
+a short debounce window, and only the last caller to mark the tree dirty
+does the work - for every feature recorded in the marker.
+
+All marker reads and writes happen under an exclusive lock on
+docs/features/.dashboard.lock, so a write that lands while a regeneration
+is running is never lost: it simply starts a new window.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to unlocked coalescing
+    fcntl = None
+
+
+DIRTY_FILENAME = ".dashboard-dirty"
+LOCK_FILENAME = ".dashboard.lock"
+
+# Environment variable enabling coalescing in hooks (milliseconds, 0 = off)
+DEBOUNCE_ENV_VAR = "FEATURE_WORKFLOW_DEBOUNCE_MS"
+
+
+def get_debounce_window() -> float:
+    """Return the configured debounce window in seconds (0 when disabled)."""
+    try:
+        return max(int(os.environ.get(DEBOUNCE_ENV_VAR, "0")), 0) / 1000
+    except ValueError:
+        return 0.0
+
+
+def coalesce(
+    features_dir: Path,
+    feature_id: str,
+    window: float,
+    regenerate: Callable[[set[str]], None],
+) -> bool:
+    """Mark feature_id dirty and regenerate if no later write arrives in time.
+
+    Args:
+        features_dir: Path to docs/features
+        feature_id: ID of the feature that was just written
+        window: Debounce window in seconds
+        regenerate: Called with every feature ID marked dirty since the last
+            successful regeneration, while the lock is held. If it raises,
+            the marker is kept and the exception propagates.
+
+    Returns:
+        True if this caller regenerated, False if it deferred to a later writer
+    """
+    marker = features_dir / DIRTY_FILENAME
+    lock_path = features_dir / LOCK_FILENAME
+    token = f"{os.getpid()}.{threading.get_ident()}.{time.time_ns()}"
+
+    with _locked(lock_path):
+        with marker.open("a", encoding="utf-8") as f:
+            f.write(f"{token} {feature_id}\n")
+
+    time.sleep(window)
+
+    with _locked(lock_path):
+        records = _read_marker(marker)
+        if not records or records[-1][0] != token:
+            # A later writer owns the regeneration (or already did it)
+            return False
+
+        regenerate({fid for _, fid in records})
+        # Only once regeneration succeeded: if it raises, the recorded
+        # features stay in the marker for the next writer to pick up
+        marker.unlink()
+
+    return True
+
+
+def _read_marker(marker: Path) -> list[tuple[str, str]]:
+    """Return (token, feature_id) records from the dirty marker."""
+    try:
+        lines = marker.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return []
+
+    records = []
+    for line in lines:
+        token, _, feature_id = line.partition(" ")
+        if token:
+            records.append((token, feature_id))
+    return records
+
+
+@contextmanager
+def _locked(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on lock_path."""
+    if fcntl is None:
+        yield
+        return
+
+    with lock_path.open("a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""Optional long-lived dashboard daemon for feature-workflow.
+
+Hooks are cold-started Python processes, so every tool call pays for an
+interpreter launch plus a scan of docs/features. The daemon keeps the
+parsed FeatureContext set of each project it has seen in memory, polls the
+feature directories for changes made outside Claude (git pull, editors), and
+serves hook requests over a Unix domain socket. See daemon_client.py for the
+wire protocol.
+
+Usage:
+    python3 daemon.py serve     # Run in the foreground
+    python3 daemon.py status    # Check whether a daemon is answering
+    python3 daemon.py stop      # Ask a running daemon to exit
+
+The socket defaults to ~/.claude/feature-workflow.sock and can be moved with
+FEATURE_WORKFLOW_SOCKET. Hooks fall back to in-process generation whenever
+the daemon is not running.
+"""
+
+import json
+import os
+import socketserver
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Optional
+
+# Add the lib directory to the Python path for imports
+LIB_DIR = Path(__file__).parent
+if str(LIB_DIR) not in sys.path:
+    sys.path.insert(0, str(LIB_DIR))
+
+from daemon_client import get_socket_path, send_request
+from feature_cache import read_cache, refresh_entries, stat_signature, write_cache
+from models import FeatureContext
+from dashboard import write_dashboard
+from search import update_written
+
+
+# Seconds between background scans of registered projects
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+class ProjectState:
+    """In-memory feature state for one project root."""
+
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.features_dir = project_root / "docs" / "features"
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.features: dict[str, FeatureContext] = {}
+        self.cache_dirty = False
+
+    def refresh(self) -> bool:
+        """Validate every feature against its stat signature.
+
+        Returns:
+            True if any feature was added, removed or re-parsed
+        """
+        entries, features, changed = refresh_entries(
+            self.features_dir, self.entries, known=self.features
+        )
+        self.entries = entries
+        self.features = {ctx.feature_id: ctx for ctx in features}
+        self.cache_dirty = self.cache_dirty or changed
+        return changed
+
+    def update_feature(self, feature_id: str) -> None:
+        """Re-parse a single feature that is known to have changed."""
+        feature_dir = self.features_dir / feature_id
+        signature = stat_signature(feature_dir)
+        ctx = FeatureContext.from_directory(feature_dir) if signature else None
+
+        if ctx is None:
+            self.entries.pop(feature_id, None)
+            self.features.pop(feature_id, None)
+        else:
+            self.entries[feature_id] = {"files": signature, "context": ctx.to_dict()}
+            self.features[feature_id] = ctx
+        self.cache_dirty = True
+
+    def render(self) -> None:
+        """Write DASHBOARD.md and index.json from the in-memory features."""
+        self.features_dir.mkdir(parents=True, exist_ok=True)
+        features = [self.features[fid] for fid in sorted(self.features)]
+        write_dashboard(self.project_root, features, entries=self.entries)
+
+    def flush_cache(self) -> None:
+        """Persist in-memory entries so non-daemon runs stay consistent."""
+        if self.cache_dirty and self.features_dir.is_dir():
+            write_cache(self.features_dir, self.entries)
+            self.cache_dirty = False
+
+
+class DashboardDaemon:
+    """Request dispatcher and background watcher shared by all connections."""
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self.projects: dict[str, ProjectState] = {}
+        self.projects_lock = threading.Lock()
+        self.stopping = threading.Event()
+
+    def get_project(self, project_root: str) -> ProjectState:
+        """Return the state for a project, loading it on first use."""
+        root = str(Path(project_root).resolve())
+        with self.projects_lock:
+            state = self.projects.get(root)
+            if state is None:
+                state = ProjectState(Path(root))
+                # Seed from the on-disk cache so the first load is incremental
+                state.entries = read_cache(state.features_dir)
+                self.projects[root] = state
+                is_new = True
+            else:
+                is_new = False
+
+        if is_new:
+            with state.lock:
+                state.refresh()
+        return state
+
+    def handle(self, message: dict[str, Any]) -> dict[str, Any]:
+        """Process one request and return the response object."""
+        op = message.get("op")
+
+        if op == "ping":
+            with self.projects_lock:
+                projects = sorted(self.projects)
+            return {"ok": True, "pid": os.getpid(), "projects": projects}
+
+        if op == "shutdown":
+            self.stopping.set()
+            return {"ok": True}
+
+        if op not in ("changed", "render"):
+            return {"ok": False, "error": f"unknown op: {op}"}
+
+        project_root = message.get("project_root")
+        if not project_root or not Path(project_root).is_dir():
+            return {"ok": False, "error": f"not a directory: {project_root}"}
+
+        state = self.get_project(project_root)
+        with state.lock:
+            feature_id = message.get("feature_id")
+            if op == "changed" and feature_id:
+                state.update_feature(feature_id)
+            else:
+                state.refresh()
+            state.render()
+            if op == "changed" and feature_id:
+                update_written(state.features_dir, {feature_id})
+            count = len(state.features)
+
+        return {"ok": True, "features": count}
+
+    def watch(self) -> None:
+        """Poll registered projects and re-render any whose files changed."""
+        while not self.stopping.wait(self.poll_interval):
+            with self.projects_lock:
+                states = list(self.projects.values())
+            for state in states:
+                with state.lock:
+                    try:
+                        if state.refresh():
+                            state.render()
+                        state.flush_cache()
+                    except Exception as e:
+                        print(f"[daemon] Warning: refresh failed for {state.project_root}: {e}", file=sys.stderr)
+
+    def flush_all(self) -> None:
+        """Persist the feature cache of every project."""
+        with self.projects_lock:
+            states = list(self.projects.values())
+        for state in states:
+            with state.lock:
+                state.flush_cache()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON line, writes one JSON line."""
+
+    def handle(self) -> None:
+        daemon: DashboardDaemon = self.server.daemon_state
+        try:
+            message = json.loads(self.rfile.readline().decode("utf-8"))
+            if not isinstance(message, dict):
+                raise ValueError("request must be a JSON object")
+            response = daemon.handle(message)
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+        if daemon.stopping.is_set():
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(socket_path: Optional[Path] = None, poll_interval: float = DEFAULT_POLL_INTERVAL) -> int:
+    """Run the daemon in the foreground until a shutdown request arrives.
+
+    Returns:
+        Process exit code
+    """
+    path = socket_path or get_socket_path()
+
+    if path.exists():
+        if send_request({"op": "ping"}, socket_path=path):
+            print(f"[daemon] Already running on {path}", file=sys.stderr)
+            return 1
+        # Stale socket from a daemon that did not exit cleanly
+        path.unlink()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    daemon = DashboardDaemon(poll_interval=poll_interval)
+
+    old_umask = os.umask(0o077)
+    try:
+        server = _Server(str(path), _RequestHandler)
+    finally:
+        os.umask(old_umask)
+    server.daemon_state = daemon
+
+    watcher = threading.Thread(target=daemon.watch, daemon=True)
+    watcher.start()
+    print(f"[daemon] Listening on {path}", file=sys.stderr)
+
+    try:
+        server.serve_forever(poll_interval=min(poll_interval, 0.5))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stopping.set()
+        server.server_close()
+        daemon.flush_all()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    print("[daemon] Stopped", file=sys.stderr)
+    return 0
+
+
+def main() -> int:
+    """CLI entry point."""
+    if len(sys.argv) < 2:
+        print("Usage: python3 daemon.py <serve|status|stop>", file=sys.stderr)
+        print("  serve   - Run the dashboard daemon in the foreground", file=sys.stderr)
+        print("  status  - Report whether a daemon is running", file=sys.stderr)
+        print("  stop    - Stop a running daemon", file=sys.stderr)
+        return 1
+
+    command = sys.argv[1].lower()
+
+    if command == "serve":
+        return serve()
+
+    elif command == "status":
+        response = send_request({"op": "ping"})
+        if not response:
+            print("Daemon not running")
+            return 1
+        print(f"Daemon running (pid {response.get('pid')}) on {get_socket_path()}")
+        for project in response.get("projects", []):
+            print(f"  - {project}")
+        return 0
+
+    elif command == "stop":
+        if not send_request({"op": "shutdown"}):
+            print("Daemon not running")
+            return 1
+        print("Daemon stopped")
+        return 0
+
+    else:
+        print(f"Unknown command: {command}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
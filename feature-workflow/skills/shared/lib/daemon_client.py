@@ -0,0 +1,76 @@
+"""Minimal client for the feature-workflow dashboard daemon.
+
+Kept deliberately small (json, os, socket only) so hooks can import it on
+every tool call without paying for the rest of the shared library.
+
+Protocol: the client connects to a Unix domain socket, sends one JSON
+object terminated by a newline and reads one JSON line back.
+
+    {"op": "changed", "project_root": "/abs/path", "feature_id": "my-feature"}
+    {"op": "render", "project_root": "/abs/path"}
+    {"op": "ping"}
+    {"op": "shutdown"}
+
+Responses always carry "ok": true/false, plus "error" on failure.
+"""
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Optional
+
+
+# Environment variable overriding the daemon socket location
+SOCKET_ENV_VAR = "FEATURE_WORKFLOW_SOCKET"
+
+
+def get_socket_path() -> Path:
+    """Return the daemon socket path (~/.claude/feature-workflow.sock by default)."""
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    return Path.home() / ".claude" / "feature-workflow.sock"
+
+
+def send_request(
+    message: dict[str, Any],
+    timeout: float = 2.0,
+    socket_path: Optional[Path] = None,
+) -> Optional[dict[str, Any]]:
+    """Send a request to the daemon and return its response.
+
+    Args:
+        message: Request object (must include "op")
+        timeout: Seconds to wait for connect and response
+        socket_path: Override for the socket location
+
+    Returns:
+        Response dict, or None if no daemon is reachable
+    """
+    path = socket_path or get_socket_path()
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+            chunks: list[bytes] = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+    except OSError:
+        return None
+
+    try:
+        response = json.loads(b"".join(chunks).decode("utf-8"))
+    except ValueError:
+        return None
+    return response if isinstance(response, dict) else None
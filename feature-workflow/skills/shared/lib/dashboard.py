@@ -6,6 +6,12 @@ Scans docs/features/*/ to find all features and their status based on file prese
 - idea.md + plan.md → in-progress
 - idea.md + plan.md + shipped.md → completed
 
+This is the single dashboard renderer: run_dashboard.py, the hooks and the
+daemon all call into it. The layout is a list of Sections, each a table of
+Columns, so new columns or sections do not need another render loop. Every
+run also refreshes docs/features/index.json (see feature_index.py) and, when
+an archive limit is set, the per-year archive shards (see archive.py).
+
 Usage:
     python3 dashboard.py <project_root>
 
@@ -14,130 +20,313 @@ Can also be imported and called as a library:
     generate_dashboard(project_root)
 """
 
+import os
 import sys
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# Handle both package and standalone imports
+try:
+    from .models import FeatureContext, FeatureStatus
+    from .feature_cache import load_entries
+    from .feature_index import build_index, write_index
+    from .dashboard_writer import write_lines_if_changed
+    from .graph import DependencyGraph
+    from .archive import ARCHIVE_DIRNAME, SHARD_PREFIX, ArchivePolicy, shard_name
+except ImportError:
+    from models import FeatureContext, FeatureStatus
+    from feature_cache import load_entries
+    from feature_index import build_index, write_index
+    from dashboard_writer import write_lines_if_changed
+    from graph import DependencyGraph
+    from archive import ARCHIVE_DIRNAME, SHARD_PREFIX, ArchivePolicy, shard_name
+
+
+class DashboardData:
+    """Features grouped by status plus lookups shared by all columns.
+
+    Built once per render: the feature lookup, the dependency graph and the
+    unmet-dependency map are all O(features + dependency edges). Edges come
+    from both dependsOn and the reverse blockedBy declarations.
+
+    With an archive policy, completed features past its limits are moved
+    from by_status into archived (shipping year -> features); lookups and
+    dependencies still cover every feature.
+    """
+
+    def __init__(self, features: list[FeatureContext], archive: Optional[ArchivePolicy] = None):
+        self.features = features
+        self.all_features: dict[str, FeatureContext] = {}
+        self.by_status: dict[FeatureStatus, list[FeatureContext]] = {
+            status: [] for status in FeatureStatus
+        }
+
+        for ctx in features:
+            self.all_features[ctx.feature_id] = ctx
+            self.by_status[ctx.status].append(ctx)
+
+        self.archived: dict[int, list[FeatureContext]] = {}
+        if archive is not None and archive.enabled:
+            self.by_status[FeatureStatus.COMPLETED], self.archived = archive.split(
+                self.by_status[FeatureStatus.COMPLETED]
+            )
+
+        self.graph = DependencyGraph(features)
+        self.unmet_dependencies: dict[str, list[str]] = {
+            ctx.feature_id: self.graph.unmet_dependencies(ctx.feature_id)
+            for ctx in features
+        }
+
 
-from .models import FeatureContext, FeatureStatus
+@dataclass(frozen=True)
+class Column:
+    """A dashboard table column."""
 
+    header: str
+    value: Callable[[FeatureContext, DashboardData], str]
 
-def generate_dashboard(project_root: Path) -> None:
-    """Generate DASHBOARD.md from feature directories.
+
+@dataclass(frozen=True)
+class Section:
+    """A dashboard section: one table of features with a given status."""
+
+    title: str
+    status: FeatureStatus
+    empty_message: str
+    columns: tuple[Column, ...]
+
+
+def _format_date(d: Optional[object]) -> str:
+    """Format a date for display, handling None values."""
+    if d is None:
+        return ""
+    return str(d)
+
+
+ID_COLUMN = Column("ID", lambda ctx, data: f"[{ctx.feature_id}](./{ctx.feature_id}/)")
+NAME_COLUMN = Column("Name", lambda ctx, data: ctx.name)
+PRIORITY_COLUMN = Column("Priority", lambda ctx, data: ctx.priority)
+EFFORT_COLUMN = Column("Effort", lambda ctx, data: ctx.effort)
+STARTED_COLUMN = Column("Started", lambda ctx, data: _format_date(ctx.started))
+ADDED_COLUMN = Column("Added", lambda ctx, data: _format_date(ctx.created))
+SHIPPED_COLUMN = Column("Shipped", lambda ctx, data: _format_date(ctx.shipped))
+BLOCKED_BY_COLUMN = Column(
+    "Blocked By", lambda ctx, data: ", ".join(data.unmet_dependencies[ctx.feature_id])
+)
+
+# Archive shards live one level down, so feature links go up first
+ARCHIVE_COLUMNS: tuple[Column, ...] = (
+    Column("ID", lambda ctx, data: f"[{ctx.feature_id}](../{ctx.feature_id}/)"),
+    NAME_COLUMN,
+    SHIPPED_COLUMN,
+)
+
+DEFAULT_SECTIONS: tuple[Section, ...] = (
+    Section(
+        "In Progress",
+        FeatureStatus.IN_PROGRESS,
+        "*No features in progress*",
+        (ID_COLUMN, NAME_COLUMN, PRIORITY_COLUMN, STARTED_COLUMN),
+    ),
+    Section(
+        "Backlog",
+        FeatureStatus.BACKLOG,
+        "*No features in backlog*",
+        (ID_COLUMN, NAME_COLUMN, PRIORITY_COLUMN, EFFORT_COLUMN, ADDED_COLUMN, BLOCKED_BY_COLUMN),
+    ),
+    Section(
+        "Completed",
+        FeatureStatus.COMPLETED,
+        "*No completed features*",
+        (ID_COLUMN, NAME_COLUMN, SHIPPED_COLUMN),
+    ),
+)
+
+
+def generate_dashboard(
+    project_root: Path,
+    feature_id: Optional[str] = None,
+    use_cache: bool = True,
+    force: bool = False,
+    workers: Optional[int] = None,
+) -> None:
+    """Generate DASHBOARD.md, index.json and archive shards from feature directories.
 
     Args:
         project_root: Path to the project root directory
+        feature_id: ID of the feature that just changed, if known. Only that
+            feature is re-parsed; the rest come from the feature cache.
+        use_cache: Set False to bypass docs/features/.dashboard-cache.json
+        force: Rewrite DASHBOARD.md even if its content is unchanged
+        workers: Threads used to scan feature directories (default: sequential,
+            or FEATURE_WORKFLOW_SCAN_WORKERS)
     """
     features_dir = project_root / "docs" / "features"
-    dashboard_path = features_dir / "DASHBOARD.md"
 
     # Ensure features directory exists
     features_dir.mkdir(parents=True, exist_ok=True)
 
-    # Collect features by status
-    backlog_items: list[FeatureContext] = []
-    inprogress_items: list[FeatureContext] = []
-    completed_items: list[FeatureContext] = []
-
-    # Scan feature directories
-    if features_dir.exists():
-        for feature_dir in sorted(features_dir.iterdir()):
-            # Skip non-directories and DASHBOARD.md
-            if not feature_dir.is_dir():
-                continue
-            if feature_dir.name == "DASHBOARD.md":
-                continue
-
-            # Parse feature context
-            ctx = FeatureContext.from_directory(feature_dir)
-            if ctx is None:
-                continue
-
-            # Categorize by status
-            if ctx.status == FeatureStatus.COMPLETED:
-                completed_items.append(ctx)
-            elif ctx.status == FeatureStatus.IN_PROGRESS:
-                inprogress_items.append(ctx)
-            else:
-                backlog_items.append(ctx)
-
-    # Generate dashboard content
-    content = _generate_dashboard_content(
-        backlog_items, inprogress_items, completed_items
+    # Scan feature directories (re-parsing only what changed since the last run)
+    features, entries = load_entries(
+        features_dir, changed_feature=feature_id, use_cache=use_cache, workers=workers
     )
+    write_dashboard(project_root, features, force=force, entries=entries)
 
-    # Write dashboard
-    dashboard_path.write_text(content, encoding="utf-8")
+
+def write_dashboard(
+    project_root: Path,
+    features: list[FeatureContext],
+    force: bool = False,
+    sections: tuple[Section, ...] = DEFAULT_SECTIONS,
+    entries: Optional[dict[str, dict[str, Any]]] = None,
+    archive: Optional[ArchivePolicy] = None,
+) -> None:
+    """Render DASHBOARD.md, index.json and archive shards from already-loaded features.
+
+    Args:
+        project_root: Path to the project root directory
+        features: Feature contexts sorted by feature ID
+        force: Rewrite DASHBOARD.md even if its content is unchanged
+        sections: Dashboard layout
+        entries: Feature cache entries, used for file mtimes in index.json
+        archive: Completed-feature limits (default: from the environment)
+    """
+    features_dir = project_root / "docs" / "features"
+    dashboard_path = features_dir / "DASHBOARD.md"
+    data = DashboardData(features, archive if archive is not None else ArchivePolicy.from_env())
+
+    # The index tracks file mtimes, so it can change when the dashboard does not
+    if write_index(features_dir, build_index(features, data.unmet_dependencies, entries)):
+        print("[dashboard] Updated index.json", file=sys.stderr)
+
+    for name in write_archive(features_dir, data, force=force):
+        print(f"[dashboard] Updated {ARCHIVE_DIRNAME}/{name}", file=sys.stderr)
+
+    # Stream the dashboard (skipped when nothing but the timestamp would change)
+    if not write_lines_if_changed(dashboard_path, lambda: iter_dashboard(data, sections), force=force):
+        print("[dashboard] DASHBOARD.md unchanged, skipped write", file=sys.stderr)
+        return
 
     # Log to stderr (for hook feedback)
     print(f"[dashboard] Generated DASHBOARD.md with:", file=sys.stderr)
-    print(f"  - {len(inprogress_items)} in progress", file=sys.stderr)
-    print(f"  - {len(backlog_items)} in backlog", file=sys.stderr)
-    print(f"  - {len(completed_items)} completed", file=sys.stderr)
+    print(f"  - {len(data.by_status[FeatureStatus.IN_PROGRESS])} in progress", file=sys.stderr)
+    print(f"  - {len(data.by_status[FeatureStatus.BACKLOG])} in backlog", file=sys.stderr)
+    print(f"  - {len(data.by_status[FeatureStatus.COMPLETED])} completed", file=sys.stderr)
+    if data.archived:
+        archived = sum(len(items) for items in data.archived.values())
+        print(f"  - {archived} archived in {len(data.archived)} files", file=sys.stderr)
+
+
+def write_archive(features_dir: Path, data: DashboardData, force: bool = False) -> list[str]:
+    """Write one archive shard per shipping year and remove stale ones.
+
+    Returns:
+        Names of the shards written or removed
+    """
+    archive_dir = features_dir / ARCHIVE_DIRNAME
+    wanted = {shard_name(year): (year, items) for year, items in data.archived.items()}
+    changed = []
+
+    try:
+        with os.scandir(archive_dir) as it:
+            existing = [entry.name for entry in it if entry.name.startswith(SHARD_PREFIX)]
+    except OSError:
+        existing = []
+
+    for name in sorted(set(existing) - set(wanted)):
+        (archive_dir / name).unlink()
+        changed.append(name)
+
+    if wanted:
+        archive_dir.mkdir(exist_ok=True)
+    for name, (year, items) in wanted.items():
+        if write_lines_if_changed(
+            archive_dir / name, lambda: iter_archive_shard(year, items, data), force=force
+        ):
+            changed.append(name)
 
+    return changed
 
-def _generate_dashboard_content(
-    backlog: list[FeatureContext],
-    in_progress: list[FeatureContext],
-    completed: list[FeatureContext],
+
+def render_dashboard(
+    data: DashboardData,
+    sections: tuple[Section, ...] = DEFAULT_SECTIONS,
 ) -> str:
     """Generate the markdown content for DASHBOARD.md."""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return "".join(iter_dashboard(data, sections))
 
-    lines = [
-        "# Feature Dashboard",
-        "",
-        "*Auto-generated by hooks. Do not edit directly.*",
-        f"*Last updated: {timestamp}*",
-        "",
-        "## In Progress",
-    ]
-
-    if not in_progress:
-        lines.append("*No features in progress*")
-    else:
-        lines.append("")
-        lines.append("| ID | Name | Priority | Started |")
-        lines.append("|----|------|----------|---------|")
-        for ctx in in_progress:
-            started = _format_date(ctx.started)
-            lines.append(f"| [{ctx.feature_id}](./{ctx.feature_id}/) | {ctx.name} | {ctx.priority} | {started} |")
-
-    lines.extend(["", "## Backlog"])
-
-    if not backlog:
-        lines.append("*No features in backlog*")
-    else:
-        lines.append("")
-        lines.append("| ID | Name | Priority | Effort | Added |")
-        lines.append("|----|------|----------|--------|-------|")
-        for ctx in backlog:
-            created = _format_date(ctx.created)
-            lines.append(f"| [{ctx.feature_id}](./{ctx.feature_id}/) | {ctx.name} | {ctx.priority} | {ctx.effort} | {created} |")
-
-    lines.extend(["", "## Completed"])
-
-    if not completed:
-        lines.append("*No completed features*")
-    else:
-        lines.append("")
-        lines.append("| ID | Name | Shipped |")
-        lines.append("|----|------|---------|")
-        for ctx in completed:
-            shipped = _format_date(ctx.shipped)
-            lines.append(f"| [{ctx.feature_id}](./{ctx.feature_id}/) | {ctx.name} | {shipped} |")
-
-    # Add trailing newline
-    lines.append("")
-
-    return "\n".join(lines)
 
+def iter_dashboard(
+    data: DashboardData,
+    sections: tuple[Section, ...] = DEFAULT_SECTIONS,
+) -> Iterator[str]:
+    """Yield DASHBOARD.md line by line, each with its trailing newline.
 
-def _format_date(d: Optional[object]) -> str:
-    """Format a date for display, handling None values."""
-    if d is None:
-        return ""
-    return str(d)
+    Rows are rendered as they are consumed, so writing the result with
+    write_lines_if_changed never builds the whole document in memory.
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    yield "# Feature Dashboard\n"
+    yield "\n"
+    yield "*Auto-generated by hooks. Do not edit directly.*\n"
+    yield f"*Last updated: {timestamp}*\n"
+
+    for section in sections:
+        yield "\n"
+        yield f"## {section.title}\n"
+        items = data.by_status[section.status]
+
+        if not items:
+            yield section.empty_message + "\n"
+        else:
+            yield "\n"
+            for line in iter_table(
+                [col.header for col in section.columns],
+                ([col.value(ctx, data) for col in section.columns] for ctx in items),
+            ):
+                yield line + "\n"
+
+        if section.status == FeatureStatus.COMPLETED and data.archived:
+            links = ", ".join(
+                f"[{year}](./{ARCHIVE_DIRNAME}/{shard_name(year)}) ({len(archived)})"
+                for year, archived in data.archived.items()
+            )
+            yield "\n"
+            yield f"*Older completed features: {links}*\n"
+
+
+def iter_archive_shard(year: int, items: list[FeatureContext], data: DashboardData) -> Iterator[str]:
+    """Yield the lines of one year's archive shard."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    yield f"# Completed Features: {year}\n"
+    yield "\n"
+    yield "*Auto-generated by hooks. Do not edit directly.*\n"
+    yield f"*Last updated: {timestamp}*\n"
+    yield "\n"
+    yield "[Back to dashboard](../DASHBOARD.md)\n"
+    yield "\n"
+    for line in iter_table(
+        [col.header for col in ARCHIVE_COLUMNS],
+        ([col.value(ctx, data) for col in ARCHIVE_COLUMNS] for ctx in items),
+    ):
+        yield line + "\n"
+
+
+def render_table(headers: list[str], rows: Iterable[list[str]]) -> list[str]:
+    """Render a markdown table as a list of lines."""
+    return list(iter_table(headers, rows))
+
+
+def iter_table(headers: list[str], rows: Iterable[list[str]]) -> Iterator[str]:
+    """Yield the lines of a markdown table, without newlines."""
+    yield "| " + " | ".join(headers) + " |"
+    yield "|" + "|".join("-" * (len(header) + 2) for header in headers) + "|"
+    for row in rows:
+        yield "| " + " | ".join(row) + " |"
 
 
 def main() -> int:
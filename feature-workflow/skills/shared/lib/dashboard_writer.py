@@ -0,0 +1,156 @@
+"""Write DASHBOARD.md only when its content actually changed.
+
+The dashboard carries a "Last updated" timestamp, so naively rewriting it on
+every hook run churns git status, editor reloads and file watchers even when
+no feature data changed. Each written dashboard is stamped with a hash of
+its content excluding the timestamp line:
+
+    *Last updated: 2024-01-25 14:30:00*
+    <!-- content-hash: 3f2a... -->
+
+Before writing, the new content is hashed the same way and compared to the
+stamp in the existing file; on a match both the write and the timestamp
+bump are skipped.
+
+Content can also be streamed: write_lines_if_changed takes a callable that
+yields lines and runs it twice, once to hash and once to write, so a large
+dashboard is never held as one string. Either way the new file goes to a
+temp file in the same directory, takes the old file's mode and is renamed
+over it, so readers never see a half-written dashboard.
+"""
+
+import hashlib
+import io
+import os
+import re
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+
+TIMESTAMP_PATTERN = re.compile(r"^\*Last updated: [^\n]*\*\n", re.MULTILINE)
+HASH_PATTERN = re.compile(r"^<!-- content-hash: ([0-9a-f]{64}) -->$")
+
+# The stamp sits right after the timestamp, so only the head of the file is read
+HEADER_LINES = 8
+
+WRITE_BUFFER = 64 * 1024
+
+
+def content_hash(content: str) -> str:
+    """Return the SHA-256 of content with the timestamp line removed."""
+    return hashlib.sha256(TIMESTAMP_PATTERN.sub("", content).encode("utf-8")).hexdigest()
+
+
+def hash_lines(lines: Iterable[str]) -> str:
+    """Return the content_hash of the concatenated lines, without joining them."""
+    sha = hashlib.sha256()
+    for line in lines:
+        if not TIMESTAMP_PATTERN.match(line):
+            sha.update(line.encode("utf-8"))
+    return sha.hexdigest()
+
+
+def read_stored_hash(path: Path) -> Optional[str]:
+    """Return the content hash stamped into an existing dashboard, if any."""
+    try:
+        with path.open(encoding="utf-8") as f:
+            for _ in range(HEADER_LINES):
+                line = f.readline()
+                if not line:
+                    break
+                match = HASH_PATTERN.match(line.rstrip("\n"))
+                if match:
+                    return match.group(1)
+    except (OSError, UnicodeDecodeError):
+        pass
+    return None
+
+
+def write_if_changed(path: Path, content: str, force: bool = False) -> bool:
+    """Write content to path unless the stored hash shows it is unchanged.
+
+    Args:
+        path: Dashboard file to write
+        content: Rendered markdown, including a "*Last updated: ...*" line
+        force: Write even when the content hash matches
+
+    Returns:
+        True if the file was written, False if the write was skipped
+    """
+    return write_lines_if_changed(path, lambda: io.StringIO(content), force=force)
+
+
+def write_lines_if_changed(
+    path: Path,
+    render: Callable[[], Iterable[str]],
+    force: bool = False,
+) -> bool:
+    """Stream rendered lines to path unless the stored hash shows it is unchanged.
+
+    Args:
+        path: Dashboard file to write
+        render: Returns a fresh iterable of newline-terminated lines each
+            time it is called; called once to hash and, if the content
+            changed, once more to write
+        force: Write even when the content hash matches
+
+    Returns:
+        True if the file was written, False if the write was skipped
+    """
+    digest = hash_lines(render())
+    if not force and read_stored_hash(path) == digest:
+        return False
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8", buffering=WRITE_BUFFER) as f:
+            f.writelines(stamp_lines(render(), digest))
+        # Keep the existing file's mode; a new file gets the usual default
+        try:
+            os.chmod(tmp_path, path.stat().st_mode & 0o7777)
+        except OSError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def stamp_hash(content: str, digest: str) -> str:
+    """Insert the content-hash comment after the timestamp line."""
+    stamp = f"<!-- content-hash: {digest} -->\n"
+    match = TIMESTAMP_PATTERN.search(content)
+    if match is None:
+        return stamp + content
+    return content[:match.end()] + stamp + content[match.end():]
+
+
+def stamp_lines(lines: Iterable[str], digest: str) -> Iterator[str]:
+    """Yield lines with the content-hash comment after the timestamp line.
+
+    Only the first HEADER_LINES lines are searched for the timestamp (the
+    stamp is not read back from further down); without one the stamp leads.
+    """
+    stamp = f"<!-- content-hash: {digest} -->\n"
+    iterator = iter(lines)
+    head = []
+
+    for line in iterator:
+        head.append(line)
+        if TIMESTAMP_PATTERN.match(line):
+            yield from head
+            yield stamp
+            break
+        if len(head) >= HEADER_LINES:
+            yield stamp
+            yield from head
+            break
+    else:
+        yield stamp
+        yield from head
+
+    yield from iterator
@@ -0,0 +1,314 @@
+"""Persistent feature-state cache for incremental dashboard regeneration.
+
+Parsing every feature directory on each hook run is the dominant cost of
+dashboard generation in large projects. This module keeps the parsed
+FeatureContext records in docs/features/.dashboard-cache.json, keyed by
+feature ID, together with a stat signature (mtime, size, inode) for each of
+idea.md, plan.md and shipped.md.
+
+A feature is re-parsed only when its signature changes. Every cached
+feature is checked on every load (one scandir per directory), so records
+written back by a concurrent run, or edits made outside the hooks, are
+caught on the next load. When the caller knows which feature was just
+written (the PostToolUse hook does), that feature is re-parsed even if
+its signature looks unchanged.
+
+Directories that do need checking can be fanned out over a bounded thread
+pool, which hides per-file latency on network-mounted trees. Results are
+always merged back in sorted directory order.
+
+The cache's signatures (inodes, mtimes) only hold on the machine that
+wrote them, so every cache write first makes sure docs/features/.gitignore
+lists the cache and the other machine-local files the hooks create.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+# Handle both package and standalone imports
+try:
+    from .models import FeatureContext
+except ImportError:
+    from models import FeatureContext
+
+
+CACHE_FILENAME = ".dashboard-cache.json"
+CACHE_VERSION = 1
+FEATURE_FILES = ("idea.md", "plan.md", "shipped.md")
+
+# Generated files under docs/features that only make sense on the machine that wrote them
+LOCAL_FILES = (CACHE_FILENAME, ".dashboard-dirty", ".dashboard.lock", ".search-index.json")
+
+# Environment variable setting the default scan thread count
+WORKERS_ENV_VAR = "FEATURE_WORKFLOW_SCAN_WORKERS"
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def load_features(
+    features_dir: Path,
+    changed_feature: Optional[str] = None,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+) -> list[FeatureContext]:
+    """Load all features under features_dir, reusing cached records.
+
+    Args:
+        features_dir: Path to docs/features
+        changed_feature: ID of a feature known to have just changed. It is
+            re-parsed without trusting its signature, which may not have
+            moved within the filesystem's mtime resolution. Every other
+            feature is validated against its signature.
+        use_cache: Set False to ignore and leave the on-disk cache untouched
+        workers: Threads used to stat and parse feature directories. Defaults
+            to FEATURE_WORKFLOW_SCAN_WORKERS, or sequential when unset. Useful
+            on network filesystems where each stat/read is a round-trip.
+
+    Returns:
+        FeatureContext records sorted by feature ID
+    """
+    return load_entries(features_dir, changed_feature, use_cache, workers)[0]
+
+
+def load_entries(
+    features_dir: Path,
+    changed_feature: Optional[str] = None,
+    use_cache: bool = True,
+    workers: Optional[int] = None,
+) -> tuple[list[FeatureContext], dict[str, dict[str, Any]]]:
+    """Like load_features, but also return the cache entries.
+
+    The entries carry each feature's stat signature, which lets callers such
+    as the JSON index report file mtimes without stat'ing anything again.
+
+    Returns:
+        Tuple of (contexts sorted by ID, entries keyed by feature ID)
+    """
+    cached = read_cache(features_dir) if use_cache else {}
+    entries, features, dirty = refresh_entries(features_dir, cached, changed_feature, workers=workers)
+
+    if use_cache and dirty:
+        write_cache(features_dir, entries)
+
+    return features, entries
+
+
+def refresh_entries(
+    features_dir: Path,
+    cached: dict[str, dict[str, Any]],
+    changed_feature: Optional[str] = None,
+    known: Optional[dict[str, FeatureContext]] = None,
+    workers: Optional[int] = None,
+) -> tuple[dict[str, dict[str, Any]], list[FeatureContext], bool]:
+    """Bring a set of cache entries up to date with the feature directories.
+
+    Args:
+        features_dir: Path to docs/features
+        cached: Existing cache entries keyed by feature ID
+        changed_feature: See load_features
+        known: Already-built contexts to reuse for unchanged entries instead
+            of rebuilding them from their serialized form
+        workers: See load_features
+
+    Returns:
+        Tuple of (fresh entries, contexts sorted by ID, whether anything changed)
+    """
+    entries: dict[str, dict[str, Any]] = {}
+    features: list[FeatureContext] = []
+    dirty = False
+
+    if not features_dir.is_dir():
+        return entries, features, bool(cached)
+
+    feature_ids = list_feature_dirs(features_dir)
+    to_check: list[tuple[Path, Optional[dict[str, Any]]]] = []
+
+    for feature_id in feature_ids:
+        # The just-written feature is re-parsed regardless of its signature
+        entry = None if feature_id == changed_feature else cached.get(feature_id)
+        to_check.append((features_dir / feature_id, entry))
+
+    # Stat (and re-parse where needed) every directory
+    results = _map_bounded(
+        lambda item: _validate_entry(item[0], item[1], known),
+        to_check,
+        get_scan_workers() if workers is None else workers,
+    )
+
+    for feature_id, (entry, ctx, changed) in zip(feature_ids, results):
+        dirty = dirty or changed
+        if ctx is None:
+            continue
+        entries[feature_id] = entry
+        features.append(ctx)
+
+    # Features whose directories disappeared
+    if set(cached) - set(entries):
+        dirty = True
+
+    return entries, features, dirty
+
+
+def get_scan_workers() -> int:
+    """Return the configured scan worker count (1 = sequential)."""
+    try:
+        return max(int(os.environ.get(WORKERS_ENV_VAR, "1")), 1)
+    except ValueError:
+        return 1
+
+
+def _map_bounded(fn: Callable[[T], R], items: list[T], workers: int) -> list[R]:
+    """Map fn over items, on a bounded thread pool when workers > 1.
+
+    Results are returned in input order regardless of completion order.
+    """
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(workers, len(items))) as executor:
+        return list(executor.map(fn, items))
+
+
+def _validate_entry(
+    feature_dir: Path,
+    entry: Optional[dict[str, Any]],
+    known: Optional[dict[str, FeatureContext]],
+) -> tuple[Optional[dict[str, Any]], Optional[FeatureContext], bool]:
+    """Check one directory against its cache entry, re-parsing if stale.
+
+    Returns:
+        Tuple of (entry, context, changed); entry and context are None when
+        the directory is not a valid feature
+    """
+    names, signature = scan_feature_dir(feature_dir)
+    if signature is None:
+        # Not a valid feature without idea.md
+        return None, None, entry is not None
+
+    if entry is not None and entry.get("files") == signature:
+        ctx = _context_from_entry(entry, feature_dir, known)
+        if ctx is not None:
+            return entry, ctx, False
+
+    ctx = FeatureContext.from_entries(feature_dir, names)
+    if ctx is None:
+        return None, None, entry is not None
+    return {"files": signature, "context": ctx.to_dict()}, ctx, True
+
+
+def stat_signature(feature_dir: Path) -> Optional[dict[str, Optional[list[int]]]]:
+    """Return {filename: [mtime_ns, size, inode] or None} for a feature directory.
+
+    Returns None when idea.md is missing (the directory is not a feature).
+    """
+    return scan_feature_dir(feature_dir)[1]
+
+
+def scan_feature_dir(feature_dir: Path) -> tuple[set[str], Optional[dict[str, Optional[list[int]]]]]:
+    """List a feature directory once and stat only the feature files present.
+
+    Returns:
+        Tuple of (entry names, stat signature or None if idea.md is missing)
+    """
+    names: set[str] = set()
+    signature: dict[str, Optional[list[int]]] = dict.fromkeys(FEATURE_FILES)
+
+    try:
+        with os.scandir(feature_dir) as it:
+            for entry in it:
+                names.add(entry.name)
+                if entry.name in signature:
+                    st = entry.stat()
+                    signature[entry.name] = [st.st_mtime_ns, st.st_size, st.st_ino]
+    except OSError:
+        return names, None
+
+    if signature["idea.md"] is None:
+        return names, None
+    return names, signature
+
+
+def list_feature_dirs(features_dir: Path) -> list[str]:
+    """Return sorted names of feature subdirectories, using d_type instead of stat.
+
+    Dot directories (such as the dashboard archive) are never features.
+    """
+    with os.scandir(features_dir) as it:
+        return sorted(entry.name for entry in it if entry.is_dir() and not entry.name.startswith("."))
+
+
+def _context_from_entry(
+    entry: dict[str, Any],
+    feature_dir: Path,
+    known: Optional[dict[str, FeatureContext]] = None,
+) -> Optional[FeatureContext]:
+    """Rebuild a FeatureContext from a cache entry, or None if it is malformed."""
+    if known is not None and feature_dir.name in known:
+        return known[feature_dir.name]
+    try:
+        return FeatureContext.from_dict(entry["context"], feature_dir)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def read_cache(features_dir: Path) -> dict[str, dict[str, Any]]:
+    """Read cached feature entries, returning {} if missing, stale or corrupt."""
+    cache_path = features_dir / CACHE_FILENAME
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+
+    features = data.get("features")
+    if not isinstance(features, dict):
+        return {}
+    return features
+
+
+def ensure_gitignore(features_dir: Path) -> None:
+    """Add any LOCAL_FILES missing from docs/features/.gitignore. Failures are non-fatal.
+
+    Existing entries are left alone; missing ones are appended, creating
+    the file if needed.
+    """
+    path = features_dir / ".gitignore"
+    try:
+        existing = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing = ""
+    except (OSError, UnicodeDecodeError):
+        return
+
+    listed = {line.strip().lstrip("/") for line in existing.splitlines()}
+    missing = [name for name in LOCAL_FILES if name not in listed]
+    if not missing:
+        return
+
+    separator = "\n" if existing and not existing.endswith("\n") else ""
+    try:
+        with path.open("a", encoding="utf-8") as f:
+            f.write(separator + "".join(f"{name}\n" for name in missing))
+    except OSError:
+        pass
+
+
+def write_cache(features_dir: Path, entries: dict[str, dict[str, Any]]) -> None:
+    """Atomically write the cache file. Failures are non-fatal."""
+    ensure_gitignore(features_dir)
+    cache_path = features_dir / CACHE_FILENAME
+    tmp_path = cache_path.with_name(f"{CACHE_FILENAME}.{os.getpid()}.tmp")
+    data = {"version": CACHE_VERSION, "features": entries}
+    try:
+        tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,127 @@
+"""Machine-readable feature index written alongside DASHBOARD.md.
+
+Skills that look features up (checking-backlog, feature-status,
+tracking-progress) would otherwise parse the markdown tables in
+DASHBOARD.md and then open idea.md files one by one. The generator also
+writes docs/features/index.json, a single compact JSON document:
+
+    {
+      "version": 1,
+      "counts": {"backlog": 4, "in_progress": 1, "completed": 3},
+      "features": [
+        {"id": "dark-mode", "status": "backlog", "name": "Dark Mode", ...,
+         "dependsOn": ["auth"], "blockedBy": [], "unmetDependencies": ["auth"],
+         "mtimes": {"idea.md": 1705312345.123}}
+      ]
+    }
+
+Each feature record holds every FeatureContext field (see
+FeatureContext.to_dict), the dependencies not yet completed, and the mtime
+in seconds of each feature file present. The file is only rewritten when
+its content changes, and always atomically, so readers never see a
+partial document.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+# Handle both package and standalone imports
+try:
+    from .models import FeatureContext, FeatureStatus
+    from .feature_cache import stat_signature
+except ImportError:
+    from models import FeatureContext, FeatureStatus
+    from feature_cache import stat_signature
+
+
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+
+
+def build_index(
+    features: list[FeatureContext],
+    unmet_dependencies: dict[str, list[str]],
+    entries: Optional[dict[str, dict[str, Any]]] = None,
+) -> dict[str, Any]:
+    """Build the index document for a set of features.
+
+    Args:
+        features: Feature contexts sorted by feature ID
+        unmet_dependencies: Feature ID -> dependencies not yet completed
+        entries: Feature cache entries whose stat signatures supply file
+            mtimes. Features without an entry are stat'ed directly.
+
+    Returns:
+        JSON-serializable index document
+    """
+    counts = {status.value: 0 for status in FeatureStatus}
+    records = []
+
+    for ctx in features:
+        counts[ctx.status.value] += 1
+
+        entry = entries.get(ctx.feature_id) if entries is not None else None
+        signature = entry.get("files") if entry is not None else None
+        if signature is None:
+            signature = stat_signature(ctx.feature_dir) or {}
+
+        record = ctx.to_dict()
+        record["unmetDependencies"] = unmet_dependencies.get(ctx.feature_id, [])
+        record["mtimes"] = {
+            name: stat[0] / 1e9
+            for name, stat in signature.items()
+            if stat is not None
+        }
+        records.append(record)
+
+    return {"version": INDEX_VERSION, "counts": counts, "features": records}
+
+
+def write_index(features_dir: Path, index: dict[str, Any]) -> bool:
+    """Write index.json unless its content is unchanged.
+
+    Returns:
+        True if the file was written, False if the write was skipped
+    """
+    return write_json_if_changed(features_dir / INDEX_FILENAME, index)
+
+
+def write_json_if_changed(path: Path, data: Any) -> bool:
+    """Atomically write data as compact JSON unless the file already matches.
+
+    Returns:
+        True if the file was written, False if the write was skipped
+    """
+    content = json.dumps(data, separators=(",", ":")) + "\n"
+
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return False
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def read_index(features_dir: Path) -> Optional[dict[str, Any]]:
+    """Read index.json, returning None if it is missing, stale or corrupt."""
+    try:
+        data = json.loads((features_dir / INDEX_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+    return data
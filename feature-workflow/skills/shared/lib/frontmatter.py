@@ -1,13 +1,15 @@
 """YAML frontmatter parsing utilities."""
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 
 def parse_frontmatter(file_path: Path) -> dict[str, Any]:
     """Parse YAML frontmatter from a markdown file.
 
-    Extracts content between the first pair of '---' markers.
+    Reads line by line and stops at the closing '---', so the body of large
+    plan.md/shipped.md files is never read. Gives up as soon as the first
+    non-blank line is not an opening '---'.
 
     Args:
         file_path: Path to the markdown file
@@ -15,15 +17,14 @@ def parse_frontmatter(file_path: Path) -> dict[str, Any]:
     Returns:
         Dictionary of frontmatter key-value pairs, or empty dict if no frontmatter
     """
-    if not file_path.exists():
-        return {}
-
+    # A missing file surfaces as OSError, so no separate exists() stat is needed
     try:
-        content = file_path.read_text(encoding="utf-8")
+        with file_path.open(encoding="utf-8") as f:
+            frontmatter_lines = _collect_frontmatter_lines(f)
     except (OSError, UnicodeDecodeError):
         return {}
 
-    return parse_frontmatter_string(content)
+    return _parse_frontmatter_lines(frontmatter_lines)
 
 
 def parse_frontmatter_string(content: str) -> dict[str, Any]:
@@ -35,23 +36,40 @@ def parse_frontmatter_string(content: str) -> dict[str, Any]:
     Returns:
         Dictionary of frontmatter key-value pairs
     """
-    lines = content.split("\n")
-    result: dict[str, Any] = {}
+    return _parse_frontmatter_lines(_collect_frontmatter_lines(content.split("\n")))
 
-    in_frontmatter = False
-    frontmatter_lines: list[str] = []
 
-    for line in lines:
+def _collect_frontmatter_lines(lines: Iterable[str]) -> list[str]:
+    """Return the lines between the opening and closing '---' fences.
+
+    Consumes lines lazily and stops at the closing fence. Returns an empty
+    list when the first non-blank line is not '---' or the fence never closes.
+    """
+    it = iter(lines)
+
+    for line in it:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped != "---":
+            return []
+        break
+    else:
+        return []
+
+    frontmatter_lines: list[str] = []
+    for line in it:
         if line.strip() == "---":
-            if not in_frontmatter:
-                in_frontmatter = True
-                continue
-            else:
-                # End of frontmatter
-                break
+            return frontmatter_lines
+        frontmatter_lines.append(line.rstrip("\n"))
 
-        if in_frontmatter:
-            frontmatter_lines.append(line)
+    # No closing delimiter
+    return []
+
+
+def _parse_frontmatter_lines(frontmatter_lines: list[str]) -> dict[str, Any]:
+    """Parse simple YAML key: value lines into a dict."""
+    result: dict[str, Any] = {}
 
     # Parse simple YAML key: value pairs
     for line in frontmatter_lines:
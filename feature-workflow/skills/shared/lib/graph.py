@@ -0,0 +1,245 @@
+"""Dependency graph over features.
+
+Dependencies are declared from both ends (see feature-capture/capture.md):
+when B depends on A, B's idea.md lists `dependsOn: [A]` and A's lists
+`blockedBy: [B]`. Either declaration alone is enough to create the edge
+B -> A here, so a half-synced pair still blocks correctly.
+
+The graph is built once per scan in O(features + edges) and then kept
+current with update()/remove() when a single feature changes, touching only
+that feature's edges. Each feature carries a count of prerequisites that
+are not yet completed, so readiness checks are O(1).
+
+Queries:
+- unmet_dependencies(id): direct prerequisites not yet completed
+- transitive_prerequisites(id) / transitive_dependents(id): closure by BFS
+- find_cycles(): strongly connected components (iterative Tarjan)
+- ready_queue(): backlog features whose prerequisites are all completed
+- topological_order(): remaining work in dependency order (Kahn)
+"""
+
+import heapq
+from collections import deque
+from typing import Iterable, Optional
+
+# Handle both package and standalone imports
+try:
+    from .models import FeatureContext, FeatureStatus
+except ImportError:
+    from models import FeatureContext, FeatureStatus
+
+
+# Sort key for features without a priority: after P0-P2
+_NO_PRIORITY = "P~"
+
+
+class DependencyGraph:
+    """Adjacency index of feature dependencies with incremental updates."""
+
+    def __init__(self, features: Iterable[FeatureContext] = ()):
+        self.status: dict[str, FeatureStatus] = {}
+        self.priority: dict[str, str] = {}
+
+        # Ordered sets (dict keys) so results follow declaration order
+        self.prerequisites: dict[str, dict[str, None]] = {}
+        self.dependents: dict[str, dict[str, None]] = {}
+
+        # Edges each feature declared, and how many declarations back each edge
+        self._declared: dict[str, list[tuple[str, str]]] = {}
+        self._edge_refs: dict[tuple[str, str], int] = {}
+        self._unmet: dict[str, int] = {}
+
+        for ctx in features:
+            self.update(ctx)
+
+    def update(self, ctx: FeatureContext) -> None:
+        """Add a feature or apply a change to its status or dependencies."""
+        feature_id = ctx.feature_id
+        self._set_status(feature_id, ctx.status)
+        self.priority[feature_id] = ctx.priority
+
+        edges = [(feature_id, dep_id) for dep_id in ctx.depends_on]
+        edges.extend((blocked_id, feature_id) for blocked_id in ctx.blocked_by)
+        self._replace_edges(feature_id, edges)
+
+    def remove(self, feature_id: str) -> None:
+        """Drop a feature; edges other features declare to it remain (unmet)."""
+        self._replace_edges(feature_id, [])
+        self._set_status(feature_id, None)
+        self.priority.pop(feature_id, None)
+
+    def is_ready(self, feature_id: str) -> bool:
+        """Return True if every prerequisite of the feature is completed."""
+        return self._unmet.get(feature_id, 0) == 0
+
+    def unmet_dependencies(self, feature_id: str) -> list[str]:
+        """Return direct prerequisites that are not completed (or unknown)."""
+        if self.is_ready(feature_id):
+            return []
+        return [
+            dep_id for dep_id in self.prerequisites.get(feature_id, ())
+            if self.status.get(dep_id) != FeatureStatus.COMPLETED
+        ]
+
+    def transitive_prerequisites(self, feature_id: str) -> set[str]:
+        """Return every feature the given one depends on, directly or not."""
+        return self._reachable(feature_id, self.prerequisites)
+
+    def transitive_dependents(self, feature_id: str) -> set[str]:
+        """Return every feature that depends on the given one, directly or not."""
+        return self._reachable(feature_id, self.dependents)
+
+    def find_cycles(self) -> list[list[str]]:
+        """Return each dependency cycle as a sorted list of feature IDs.
+
+        Uses an iterative Tarjan SCC pass, so deep chains do not hit the
+        recursion limit. Self-dependencies are reported as one-item cycles.
+        """
+        index: dict[str, int] = {}
+        low: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        cycles: list[list[str]] = []
+
+        for root in sorted(self.prerequisites):
+            if root in index:
+                continue
+
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.prerequisites.get(root, ())))]
+
+            while work:
+                node, successors = work[-1]
+                for succ in successors:
+                    if succ not in index:
+                        index[succ] = low[succ] = len(index)
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(self.prerequisites.get(succ, ()))))
+                        break
+                    if succ in on_stack:
+                        low[node] = min(low[node], index[succ])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+
+                    if low[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in self.prerequisites.get(node, ()):
+                            cycles.append(sorted(component))
+
+        return sorted(cycles)
+
+    def ready_queue(self) -> list[str]:
+        """Return backlog features that can start now, highest priority first."""
+        ready = [
+            feature_id for feature_id, status in self.status.items()
+            if status == FeatureStatus.BACKLOG and self.is_ready(feature_id)
+        ]
+        return sorted(ready, key=self._sort_key)
+
+    def topological_order(self, statuses: Optional[Iterable[FeatureStatus]] = None) -> list[str]:
+        """Return features in an order that respects their dependencies.
+
+        Among features whose prerequisites are already placed, the highest
+        priority comes first. Completed prerequisites and unknown IDs impose
+        no ordering; features on a cycle (see find_cycles) are left out.
+
+        Args:
+            statuses: Statuses to include (default: backlog and in progress)
+        """
+        wanted = set(statuses) if statuses is not None else {
+            FeatureStatus.BACKLOG, FeatureStatus.IN_PROGRESS,
+        }
+        nodes = {fid for fid, status in self.status.items() if status in wanted}
+
+        in_degree = {
+            fid: sum(1 for dep_id in self.prerequisites.get(fid, ()) if dep_id in nodes)
+            for fid in nodes
+        }
+        heap = [(self._sort_key(fid), fid) for fid, degree in in_degree.items() if degree == 0]
+        heapq.heapify(heap)
+
+        order = []
+        while heap:
+            _, feature_id = heapq.heappop(heap)
+            order.append(feature_id)
+            for dependent in self.dependents.get(feature_id, ()):
+                if dependent in in_degree:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        heapq.heappush(heap, (self._sort_key(dependent), dependent))
+        return order
+
+    def _sort_key(self, feature_id: str) -> tuple[str, str]:
+        return (self.priority.get(feature_id) or _NO_PRIORITY, feature_id)
+
+    def _reachable(self, feature_id: str, adjacency: dict[str, dict[str, None]]) -> set[str]:
+        seen: set[str] = set()
+        queue = deque(adjacency.get(feature_id, ()))
+        while queue:
+            node = queue.popleft()
+            if node in seen:
+                continue
+            seen.add(node)
+            queue.extend(n for n in adjacency.get(node, ()) if n not in seen)
+        seen.discard(feature_id)
+        return seen
+
+    def _set_status(self, feature_id: str, status: Optional[FeatureStatus]) -> None:
+        """Record a status change and adjust dependents' unmet counts."""
+        was_completed = self.status.get(feature_id) == FeatureStatus.COMPLETED
+        if status is None:
+            self.status.pop(feature_id, None)
+        else:
+            self.status[feature_id] = status
+
+        delta = int(was_completed) - int(status == FeatureStatus.COMPLETED)
+        if delta:
+            for dependent in self.dependents.get(feature_id, ()):
+                self._unmet[dependent] = self._unmet.get(dependent, 0) + delta
+
+    def _replace_edges(self, feature_id: str, edges: list[tuple[str, str]]) -> None:
+        """Swap the edges declared by a feature, keeping reference counts."""
+        for edge in self._declared.pop(feature_id, []):
+            self._edge_refs[edge] -= 1
+            if self._edge_refs[edge] == 0:
+                del self._edge_refs[edge]
+                self._unlink(*edge)
+
+        declared = list(dict.fromkeys(edges))
+        if declared:
+            self._declared[feature_id] = declared
+        for edge in declared:
+            refs = self._edge_refs.get(edge, 0)
+            self._edge_refs[edge] = refs + 1
+            if refs == 0:
+                self._link(*edge)
+
+    def _link(self, dependent: str, prerequisite: str) -> None:
+        self.prerequisites.setdefault(dependent, {})[prerequisite] = None
+        self.dependents.setdefault(prerequisite, {})[dependent] = None
+        if self.status.get(prerequisite) != FeatureStatus.COMPLETED:
+            self._unmet[dependent] = self._unmet.get(dependent, 0) + 1
+
+    def _unlink(self, dependent: str, prerequisite: str) -> None:
+        for adjacency, key, value in (
+            (self.prerequisites, dependent, prerequisite),
+            (self.dependents, prerequisite, dependent),
+        ):
+            neighbours = adjacency[key]
+            del neighbours[value]
+            if not neighbours:
+                del adjacency[key]
+        if self.status.get(prerequisite) != FeatureStatus.COMPLETED:
+            self._unmet[dependent] -= 1
@@ -1,9 +1,11 @@
 """Data models for feature-workflow plugin."""
 
+import os
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Any, Collection, Optional
 from datetime import date
 
 
@@ -47,10 +49,70 @@ class FeatureContext:
             or all_features[dep_id].status != FeatureStatus.COMPLETED
         ]
 
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict (dates as ISO strings)."""
+        return {
+            "id": self.feature_id,
+            "status": self.status.value,
+            "name": self.name,
+            "type": self.type,
+            "priority": self.priority,
+            "effort": self.effort,
+            "impact": self.impact,
+            "created": _format_iso(self.created),
+            "started": _format_iso(self.started),
+            "shipped": _format_iso(self.shipped),
+            "dependsOn": list(self.depends_on),
+            "blockedBy": list(self.blocked_by),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], feature_dir: Path) -> "FeatureContext":
+        """Rebuild a FeatureContext from the output of to_dict()."""
+        return cls(
+            feature_id=data["id"],
+            feature_dir=feature_dir,
+            status=FeatureStatus(data["status"]),
+            name=data.get("name", ""),
+            type=data.get("type", ""),
+            priority=data.get("priority", ""),
+            effort=data.get("effort", ""),
+            impact=data.get("impact", ""),
+            created=_parse_date(data.get("created")),
+            started=_parse_date(data.get("started")),
+            shipped=_parse_date(data.get("shipped")),
+            depends_on=list(data.get("dependsOn", [])),
+            blocked_by=list(data.get("blockedBy", [])),
+        )
+
     @classmethod
     def from_directory(cls, feature_dir: Path) -> Optional["FeatureContext"]:
         """Create FeatureContext from a feature directory.
 
+        Lists the directory once with os.scandir instead of probing each
+        file with exists().
+
+        Returns None if the directory is not a valid feature (no idea.md).
+        """
+        try:
+            with os.scandir(feature_dir) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            return None
+
+        return cls.from_entries(feature_dir, names)
+
+    @classmethod
+    def from_entries(cls, feature_dir: Path, names: Collection[str]) -> Optional["FeatureContext"]:
+        """Create FeatureContext from an already-listed set of entry names.
+
+        Status is derived from the names alone, and only files known to be
+        present are opened, so no stat calls are made.
+
+        Args:
+            feature_dir: The feature directory
+            names: File names present in feature_dir
+
         Returns None if the directory is not a valid feature (no idea.md).
         """
         # Handle both package and standalone imports
@@ -59,30 +121,29 @@ class FeatureContext:
         except ImportError:
             from frontmatter import parse_frontmatter
 
-        idea_file = feature_dir / "idea.md"
-        plan_file = feature_dir / "plan.md"
-        shipped_file = feature_dir / "shipped.md"
-
         # Not a valid feature without idea.md
-        if not idea_file.exists():
+        if "idea.md" not in names:
             return None
 
+        has_plan = "plan.md" in names
+        has_shipped = "shipped.md" in names
+
         # Determine status based on file presence
-        if shipped_file.exists():
+        if has_shipped:
             status = FeatureStatus.COMPLETED
-        elif plan_file.exists():
+        elif has_plan:
             status = FeatureStatus.IN_PROGRESS
         else:
             status = FeatureStatus.BACKLOG
 
         # Parse idea.md frontmatter
-        idea_fm = parse_frontmatter(idea_file)
+        idea_fm = parse_frontmatter(feature_dir / "idea.md")
 
         # Parse plan.md frontmatter if exists
-        plan_fm = parse_frontmatter(plan_file) if plan_file.exists() else {}
+        plan_fm = parse_frontmatter(feature_dir / "plan.md") if has_plan else {}
 
         # Parse shipped.md frontmatter if exists
-        shipped_fm = parse_frontmatter(shipped_file) if shipped_file.exists() else {}
+        shipped_fm = parse_frontmatter(feature_dir / "shipped.md") if has_shipped else {}
 
         # Parse dates
         created = _parse_date(idea_fm.get("created"))
@@ -114,6 +175,144 @@ class FeatureContext:
         )
 
 
+class CompactFeature:
+    """Memory-lean, read-only counterpart of FeatureContext.
+
+    For jobs that hold tens of thousands of features at once. Instances have
+    no per-instance __dict__, repetitive strings (type, priority, effort,
+    impact and the features directory shared by a project) are interned,
+    equal dates are shared, dependencies are tuples, and feature_dir is
+    built on access. The attribute names match FeatureContext, so the
+    dashboard renderer and dependency graph accept either.
+    """
+
+    __slots__ = (
+        "feature_id", "features_root", "status", "name", "type", "priority",
+        "effort", "impact", "created", "started", "shipped", "depends_on", "blocked_by",
+    )
+
+    def __init__(
+        self,
+        feature_id: str,
+        features_root: str,
+        status: FeatureStatus,
+        name: str = "",
+        type: str = "",
+        priority: str = "",
+        effort: str = "",
+        impact: str = "",
+        created: Optional[date] = None,
+        started: Optional[date] = None,
+        shipped: Optional[date] = None,
+        depends_on: Collection[str] = (),
+        blocked_by: Collection[str] = (),
+    ):
+        self.feature_id = feature_id
+        self.features_root = _intern(features_root)
+        self.status = status
+        self.name = name
+        self.type = _intern(type)
+        self.priority = _intern(priority)
+        self.effort = _intern(effort)
+        self.impact = _intern(impact)
+        self.created = _shared_date(created)
+        self.started = _shared_date(started)
+        self.shipped = _shared_date(shipped)
+        self.depends_on = tuple(_intern(dep_id) for dep_id in depends_on)
+        self.blocked_by = tuple(_intern(dep_id) for dep_id in blocked_by)
+
+    @property
+    def feature_dir(self) -> Path:
+        """The feature directory, built on demand."""
+        return Path(self.features_root, self.feature_id)
+
+    # Same logic as FeatureContext; both only read the shared attributes
+    has_unmet_dependencies = FeatureContext.has_unmet_dependencies
+    to_dict = FeatureContext.to_dict
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], features_root: str) -> "CompactFeature":
+        """Build from the output of to_dict() (e.g. a feature cache entry)."""
+        return cls(
+            feature_id=data["id"],
+            features_root=features_root,
+            status=FeatureStatus(data["status"]),
+            name=data.get("name", ""),
+            type=data.get("type", ""),
+            priority=data.get("priority", ""),
+            effort=data.get("effort", ""),
+            impact=data.get("impact", ""),
+            created=_parse_date(data.get("created")),
+            started=_parse_date(data.get("started")),
+            shipped=_parse_date(data.get("shipped")),
+            depends_on=data.get("dependsOn", ()),
+            blocked_by=data.get("blockedBy", ()),
+        )
+
+    @classmethod
+    def from_context(cls, ctx: FeatureContext) -> "CompactFeature":
+        """Convert a FeatureContext."""
+        return cls(
+            feature_id=ctx.feature_id,
+            features_root=str(ctx.feature_dir.parent),
+            status=ctx.status,
+            name=ctx.name,
+            type=ctx.type,
+            priority=ctx.priority,
+            effort=ctx.effort,
+            impact=ctx.impact,
+            created=ctx.created,
+            started=ctx.started,
+            shipped=ctx.shipped,
+            depends_on=ctx.depends_on,
+            blocked_by=ctx.blocked_by,
+        )
+
+    def to_context(self) -> FeatureContext:
+        """Convert back to a regular FeatureContext."""
+        return FeatureContext(
+            feature_id=self.feature_id,
+            feature_dir=self.feature_dir,
+            status=self.status,
+            name=self.name,
+            type=self.type,
+            priority=self.priority,
+            effort=self.effort,
+            impact=self.impact,
+            created=self.created,
+            started=self.started,
+            shipped=self.shipped,
+            depends_on=list(self.depends_on),
+            blocked_by=list(self.blocked_by),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactFeature):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+
+    __hash__ = None  # mutable, like the dataclass
+
+    def __repr__(self) -> str:
+        return f"CompactFeature(feature_id={self.feature_id!r}, status={self.status})"
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string; other frontmatter values (numbers, lists) pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# One shared object per distinct date (backlogs repeat the same few days)
+_DATES: dict[date, date] = {}
+
+
+def _shared_date(value: Optional[date]) -> Optional[date]:
+    """Return a canonical instance of value, or None."""
+    if value is None:
+        return None
+    return _DATES.setdefault(value, value)
+
+
 def _parse_date(value: Optional[str]) -> Optional[date]:
     """Parse a date string (YYYY-MM-DD) into a date object."""
     if not value:
@@ -125,3 +324,8 @@ def _parse_date(value: Optional[str]) -> Optional[date]:
         return date.fromisoformat(str(value).strip())
     except (ValueError, TypeError):
         return None
+
+
+def _format_iso(value: Optional[date]) -> Optional[str]:
+    """Format a date as YYYY-MM-DD, passing None through."""
+    return value.isoformat() if value else None
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""Full-text search over feature documents.
+
+Backlog lookups ("is dark mode already tracked?") would otherwise open every
+idea.md. This module keeps an inverted index of the frontmatter and body of
+each feature's idea.md, plan.md and shipped.md in
+docs/features/.search-index.json:
+
+    {
+      "version": 1,
+      "docs": {"dark-mode": {"files": {...stat signature...}, "terms": ["dark", ...]}},
+      "postings": {"dark": {"dark-mode": 7.0}, ...}
+    }
+
+Terms in the feature ID and name count triple, other frontmatter values
+(type, affectedAreas, ...) double, and body text once. A feature is
+re-tokenized only when its stat signature changes. Whatever regenerates
+the dashboard after a feature write (the daemon, the hook in-process, or
+run_dashboard.py) also updates the index for the features written, so the
+hook itself never reads feature bodies.
+
+Queries are ranked by summed term weight times inverse document frequency.
+Query words also match longer indexed terms as prefixes ("auth" finds
+"authentication") at half weight.
+
+Usage:
+    python3 search.py <project_root> <query> [--limit N] [--no-refresh]
+"""
+
+import json
+import math
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+# Handle both package and standalone imports
+try:
+    from .frontmatter import parse_frontmatter_string
+    from .feature_cache import FEATURE_FILES, ensure_gitignore, list_feature_dirs, scan_feature_dir
+except ImportError:
+    from frontmatter import parse_frontmatter_string
+    from feature_cache import FEATURE_FILES, ensure_gitignore, list_feature_dirs, scan_feature_dir
+
+
+SEARCH_INDEX_FILENAME = ".search-index.json"
+SEARCH_INDEX_VERSION = 1
+
+TITLE_WEIGHT = 3.0
+FRONTMATTER_WEIGHT = 2.0
+BODY_WEIGHT = 1.0
+PREFIX_FACTOR = 0.5
+
+# Shortest query word that is also matched as a prefix
+MIN_PREFIX_LENGTH = 3
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+FRONTMATTER_BLOCK = re.compile(r"\A\s*---[ \t]*\n(?:.*?\n)?[ \t]*---[ \t]*(?:\n|\Z)", re.DOTALL)
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in into is it its of on or "
+    "so that the this to was we were will with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric terms, dropping stopwords."""
+    return [
+        token for token in TOKEN_PATTERN.findall(text.lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+class SearchIndex:
+    """Inverted index from terms to weighted feature IDs."""
+
+    def __init__(
+        self,
+        docs: Optional[dict[str, dict[str, Any]]] = None,
+        postings: Optional[dict[str, dict[str, float]]] = None,
+    ):
+        self.docs: dict[str, dict[str, Any]] = docs or {}
+        self.postings: dict[str, dict[str, float]] = postings or {}
+
+    def add(self, feature_id: str, files: dict[str, Any], weights: dict[str, float]) -> None:
+        """Index a feature's term weights, replacing any previous entry."""
+        self.remove(feature_id)
+        self.docs[feature_id] = {"files": files, "terms": sorted(weights)}
+        for term, weight in weights.items():
+            self.postings.setdefault(term, {})[feature_id] = weight
+
+    def remove(self, feature_id: str) -> None:
+        """Drop a feature and its postings."""
+        doc = self.docs.pop(feature_id, None)
+        if doc is None:
+            return
+        for term in doc["terms"]:
+            posting = self.postings.get(term)
+            if posting is None:
+                continue
+            posting.pop(feature_id, None)
+            if not posting:
+                del self.postings[term]
+
+    def search(self, query: str, limit: Optional[int] = 10) -> list[tuple[str, float]]:
+        """Return (feature_id, score) pairs, best match first."""
+        total = len(self.docs)
+        scores: dict[str, float] = {}
+
+        for word in dict.fromkeys(tokenize(query)):
+            matches = [(word, 1.0)] if word in self.postings else []
+            if len(word) >= MIN_PREFIX_LENGTH:
+                matches.extend(
+                    (term, PREFIX_FACTOR) for term in self.postings
+                    if term != word and term.startswith(word)
+                )
+
+            for term, factor in matches:
+                posting = self.postings[term]
+                idf = math.log(1 + total / len(posting))
+                for feature_id, weight in posting.items():
+                    scores[feature_id] = scores.get(feature_id, 0.0) + weight * idf * factor
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked if limit is None else ranked[:limit]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the on-disk format."""
+        return {"version": SEARCH_INDEX_VERSION, "docs": self.docs, "postings": self.postings}
+
+
+def index_feature(feature_dir: Path, names: Optional[set[str]] = None) -> dict[str, float]:
+    """Return term weights for one feature directory.
+
+    Args:
+        feature_dir: Path to docs/features/[id]
+        names: Entry names in the directory, if already listed
+    """
+    weights: dict[str, float] = {}
+
+    def add(text: str, weight: float) -> None:
+        for term in tokenize(text):
+            weights[term] = weights.get(term, 0.0) + weight
+
+    add(feature_dir.name.replace("-", " "), TITLE_WEIGHT)
+
+    for filename in FEATURE_FILES:
+        if names is not None and filename not in names:
+            continue
+        try:
+            content = (feature_dir / filename).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            continue
+
+        for key, value in parse_frontmatter_string(content).items():
+            text = " ".join(value) if isinstance(value, list) else value
+            add(text, TITLE_WEIGHT if key == "name" else FRONTMATTER_WEIGHT)
+
+        block = FRONTMATTER_BLOCK.match(content)
+        add(content[block.end():] if block else content, BODY_WEIGHT)
+
+    return weights
+
+
+def update_index(features_dir: Path, changed_feature: Optional[str] = None) -> SearchIndex:
+    """Bring the persisted search index up to date and return it.
+
+    Args:
+        features_dir: Path to docs/features
+        changed_feature: ID of the only feature known to have changed. Other
+            indexed features are trusted without a stat check.
+
+    Returns:
+        The refreshed index (written back to disk if anything changed)
+    """
+    index = load_search_index(features_dir)
+    dirty = False
+
+    if changed_feature is not None and changed_feature in index.docs:
+        to_check = [changed_feature]
+    else:
+        to_check = list_feature_dirs(features_dir) if features_dir.is_dir() else []
+        if changed_feature is None:
+            # Full validation: forget features whose directories are gone
+            for feature_id in set(index.docs) - set(to_check):
+                index.remove(feature_id)
+                dirty = True
+        else:
+            # Unknown feature: index it plus anything else new
+            to_check = [fid for fid in to_check if fid not in index.docs or fid == changed_feature]
+
+    for feature_id in to_check:
+        feature_dir = features_dir / feature_id
+        names, signature = scan_feature_dir(feature_dir)
+        doc = index.docs.get(feature_id)
+
+        if signature is None:
+            if doc is not None:
+                index.remove(feature_id)
+                dirty = True
+            continue
+        if doc is not None and doc["files"] == signature:
+            continue
+
+        index.add(feature_id, signature, index_feature(feature_dir, names))
+        dirty = True
+
+    if dirty:
+        save_search_index(features_dir, index)
+    return index
+
+
+def update_written(features_dir: Path, feature_ids: Iterable[str]) -> None:
+    """Update the index after writes to feature_ids. Failures are non-fatal.
+
+    A single feature is re-indexed on its own; several written together
+    (a coalesced burst) get a full validation.
+    """
+    ids = set(feature_ids)
+    try:
+        update_index(features_dir, changed_feature=next(iter(ids)) if len(ids) == 1 else None)
+    except Exception as e:
+        print(f"[search] Warning: Search index update error: {e}", file=sys.stderr)
+
+
+def search(
+    project_root: Path,
+    query: str,
+    limit: Optional[int] = 10,
+    refresh: bool = True,
+) -> list[tuple[str, float]]:
+    """Search a project's features.
+
+    Args:
+        project_root: Path to the project root directory
+        query: Free-text query
+        limit: Maximum number of results (None for all)
+        refresh: Validate the index against the feature directories first,
+            picking up edits made outside Claude
+
+    Returns:
+        (feature_id, score) pairs, best match first
+    """
+    features_dir = project_root / "docs" / "features"
+    index = update_index(features_dir) if refresh else load_search_index(features_dir)
+    return index.search(query, limit)
+
+
+def load_search_index(features_dir: Path) -> SearchIndex:
+    """Read the persisted index, returning an empty one if missing or corrupt."""
+    try:
+        data = json.loads((features_dir / SEARCH_INDEX_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return SearchIndex()
+
+    if not isinstance(data, dict) or data.get("version") != SEARCH_INDEX_VERSION:
+        return SearchIndex()
+
+    docs = data.get("docs")
+    postings = data.get("postings")
+    if not isinstance(docs, dict) or not isinstance(postings, dict):
+        return SearchIndex()
+    return SearchIndex(docs, postings)
+
+
+def save_search_index(features_dir: Path, index: SearchIndex) -> None:
+    """Atomically write the index. Failures are non-fatal."""
+    ensure_gitignore(features_dir)
+    index_path = features_dir / SEARCH_INDEX_FILENAME
+    tmp_path = index_path.with_name(f"{SEARCH_INDEX_FILENAME}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(index.to_dict(), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, index_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = sys.argv[1:]
+    limit: Optional[int] = 10
+    refresh = True
+
+    if "--no-refresh" in args:
+        args.remove("--no-refresh")
+        refresh = False
+    if "--limit" in args:
+        i = args.index("--limit")
+        try:
+            limit = int(args[i + 1])
+        except (IndexError, ValueError):
+            print("Error: --limit needs an integer", file=sys.stderr)
+            return 1
+        del args[i:i + 2]
+
+    if len(args) < 2:
+        print("Usage: python3 search.py <project_root> <query> [--limit N] [--no-refresh]", file=sys.stderr)
+        return 1
+
+    project_root = Path(args[0])
+    if not project_root.is_dir():
+        print(f"Error: {project_root} is not a directory", file=sys.stderr)
+        return 1
+
+    for feature_id, score in search(project_root, " ".join(args[1:]), limit, refresh):
+        print(f"{feature_id}\t{score:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
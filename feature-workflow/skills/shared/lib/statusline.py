@@ -10,6 +10,13 @@ Usage:
 
     # Clear context
     python3 statusline.py clear
+
+Reads are the hot path: the statusline asks for the context on every
+refresh. get_context never creates directories, the iTerm session mapping is
+re-read only when its file changes (the statusline script rewrites it on
+every refresh, and a new Claude session in the same tab changes it), and
+a long-running statusline process can hold a ContextWatcher, which
+re-reads the .feature file only when its mtime changes.
 """
 
 import os
@@ -18,13 +25,31 @@ from pathlib import Path
 from typing import Optional
 
 
-def get_sessions_dir() -> Path:
-    """Get the Claude sessions directory, creating if needed."""
+# (sessions dir, ITERM_SESSION_ID) -> ((mtime_ns, size) of the mapping file, mapped session ID)
+_iterm_sessions: dict[tuple[str, str], tuple[tuple[int, int], str]] = {}
+
+
+def get_sessions_dir(create: bool = True) -> Path:
+    """Get the Claude sessions directory.
+
+    Args:
+        create: Create the directory if needed. Readers pass False: a
+            missing directory just means no context has been set.
+    """
     sessions_dir = Path.home() / ".claude" / "sessions"
-    sessions_dir.mkdir(parents=True, exist_ok=True)
+    if create:
+        sessions_dir.mkdir(parents=True, exist_ok=True)
     return sessions_dir
 
 
+def _read_stripped(path: Path) -> Optional[str]:
+    """Return the stripped file content, or None if it cannot be read."""
+    try:
+        return path.read_text().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 def get_session_id() -> Optional[str]:
     """Get the current session ID from environment or iTerm mapping.
 
@@ -36,14 +61,29 @@ def get_session_id() -> Optional[str]:
     if session_id:
         return session_id
 
-    # Fallback: iTerm session mapping
+    # Fallback: iTerm session mapping, rewritten by the statusline script;
+    # one stat per call, re-read only when the file changes
     iterm_session_id = os.environ.get("ITERM_SESSION_ID")
     if iterm_session_id:
-        session_file = get_sessions_dir() / f"iterm-{iterm_session_id}.session"
-        if session_file.exists():
-            session_id = session_file.read_text().strip()
-            if session_id:
-                return session_id
+        sessions_dir = get_sessions_dir(create=False)
+        key = (str(sessions_dir), iterm_session_id)
+        mapping = sessions_dir / f"iterm-{iterm_session_id}.session"
+        try:
+            st = os.stat(mapping)
+        except OSError:
+            _iterm_sessions.pop(key, None)
+            return None
+
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _iterm_sessions.get(key)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        session_id = _read_stripped(mapping)
+        if session_id:
+            _iterm_sessions[key] = (signature, session_id)
+            return session_id
+        _iterm_sessions.pop(key, None)
 
     return None
 
@@ -100,10 +140,55 @@ def get_context() -> Optional[str]:
     if not session_id:
         return None
 
-    feature_file = get_sessions_dir() / f"{session_id}.feature"
-    if feature_file.exists():
-        return feature_file.read_text().strip()
-    return None
+    return _read_stripped(get_sessions_dir(create=False) / f"{session_id}.feature")
+
+
+class ContextWatcher:
+    """Serve the feature context from memory for a long-running process.
+
+    Each get() costs one stat of the .feature file; the file is only read
+    again when its mtime or size changes. Without an explicit session ID,
+    the session is resolved again on each get(), so a watcher follows the
+    iTerm mapping when a new session starts in the same tab.
+    """
+
+    def __init__(self, session_id: Optional[str] = None):
+        self._follow = not session_id
+        self.session_id: Optional[str] = None
+        self.path: Optional[Path] = None
+        self._signature: Optional[tuple[int, int]] = None
+        self._value: Optional[str] = None
+        self._resolve(session_id or get_session_id())
+
+    def _resolve(self, session_id: Optional[str]) -> None:
+        if session_id == self.session_id:
+            return
+        self.session_id = session_id
+        self.path = (
+            get_sessions_dir(create=False) / f"{session_id}.feature"
+            if session_id
+            else None
+        )
+        self._signature = self._value = None
+
+    def get(self) -> Optional[str]:
+        """Return the current feature context, re-reading only on change."""
+        if self._follow:
+            self._resolve(get_session_id())
+        if self.path is None:
+            return None
+
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._signature = self._value = None
+            return None
+
+        signature = (st.st_mtime_ns, st.st_size)
+        if signature != self._signature:
+            self._value = _read_stripped(self.path)
+            self._signature = signature
+        return self._value
 
 
 def main() -> int:
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""Portfolio view across many projects using feature-workflow.
+
+Scans a list of project roots (paths or glob patterns) in a process pool,
+one project per task. Each worker loads features through the project's own
+feature cache (docs/features/.dashboard-cache.json), so unchanged projects
+cost a directory listing plus a cache read. Results come back as plain
+dicts and are held as CompactFeature records.
+
+Writes two files to the output directory:
+- WORKSPACE.md: per-project counts, then In Progress / Backlog / Completed
+  tables across all projects (skipped when only the timestamp would change)
+- workspace.json: roll-up with totals and every project's feature records
+
+Usage:
+    python3 workspace.py [--output DIR] [--workers N] <project_root_or_glob>...
+"""
+
+import glob
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Optional
+
+# Handle both package and standalone imports
+try:
+    from .models import CompactFeature, FeatureStatus
+    from .feature_cache import load_features
+    from .dashboard import (
+        BLOCKED_BY_COLUMN, EFFORT_COLUMN, NAME_COLUMN, PRIORITY_COLUMN, SHIPPED_COLUMN,
+        STARTED_COLUMN, Column, DashboardData, Section, render_table,
+    )
+    from .dashboard_writer import write_if_changed
+    from .feature_index import write_json_if_changed
+except ImportError:
+    from models import CompactFeature, FeatureStatus
+    from feature_cache import load_features
+    from dashboard import (
+        BLOCKED_BY_COLUMN, EFFORT_COLUMN, NAME_COLUMN, PRIORITY_COLUMN, SHIPPED_COLUMN,
+        STARTED_COLUMN, Column, DashboardData, Section, render_table,
+    )
+    from dashboard_writer import write_if_changed
+    from feature_index import write_json_if_changed
+
+
+WORKSPACE_DASHBOARD = "WORKSPACE.md"
+WORKSPACE_ROLLUP = "workspace.json"
+ROLLUP_VERSION = 1
+
+# Plain IDs: the per-project ./<id>/ links would not resolve from here
+PLAIN_ID_COLUMN = Column("ID", lambda ctx, data: ctx.feature_id)
+
+# Cross-project tables; each row is prefixed with a Project column
+WORKSPACE_SECTIONS: tuple[Section, ...] = (
+    Section(
+        "In Progress",
+        FeatureStatus.IN_PROGRESS,
+        "*No features in progress*",
+        (PLAIN_ID_COLUMN, NAME_COLUMN, PRIORITY_COLUMN, STARTED_COLUMN),
+    ),
+    Section(
+        "Backlog",
+        FeatureStatus.BACKLOG,
+        "*No features in backlog*",
+        (PLAIN_ID_COLUMN, NAME_COLUMN, PRIORITY_COLUMN, EFFORT_COLUMN, BLOCKED_BY_COLUMN),
+    ),
+    Section(
+        "Completed",
+        FeatureStatus.COMPLETED,
+        "*No completed features*",
+        (PLAIN_ID_COLUMN, NAME_COLUMN, SHIPPED_COLUMN),
+    ),
+)
+
+
+@dataclass
+class ProjectSummary:
+    """Features of one project in the workspace."""
+
+    root: Path
+    features: list[CompactFeature] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.root.name
+
+    @cached_property
+    def data(self) -> DashboardData:
+        """Grouped features and dependency lookups for this project."""
+        return DashboardData(self.features)
+
+
+def expand_roots(patterns: list[str]) -> list[Path]:
+    """Resolve paths and glob patterns to project roots with docs/features.
+
+    Returns:
+        Unique, sorted project roots
+    """
+    roots = set()
+    for pattern in patterns:
+        for match in glob.glob(os.path.expanduser(pattern)) or [pattern]:
+            path = Path(match).resolve()
+            if (path / "docs" / "features").is_dir():
+                roots.add(path)
+    return sorted(roots)
+
+
+def scan_project(root: str) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """Load one project's features (runs in a worker process).
+
+    Returns:
+        Tuple of (feature dicts from FeatureContext.to_dict, error message)
+    """
+    try:
+        features = load_features(Path(root) / "docs" / "features")
+    except Exception as e:
+        return [], f"{type(e).__name__}: {e}"
+    return [ctx.to_dict() for ctx in features], None
+
+
+def aggregate(roots: list[Path], workers: Optional[int] = None) -> list[ProjectSummary]:
+    """Scan every project root, in parallel when there is more than one.
+
+    Args:
+        roots: Project roots (see expand_roots)
+        workers: Worker processes (default: CPU count)
+
+    Returns:
+        One summary per root, in the order given
+    """
+    workers = min(workers or os.cpu_count() or 1, len(roots))
+    paths = [str(root) for root in roots]
+
+    if workers <= 1:
+        results = [scan_project(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(paths) // (workers * 4))
+            results = list(executor.map(scan_project, paths, chunksize=chunksize))
+
+    summaries = []
+    for root, (records, error) in zip(roots, results):
+        features_root = str(root / "docs" / "features")
+        features = [CompactFeature.from_dict(record, features_root) for record in records]
+        summaries.append(ProjectSummary(root, features, error))
+    return summaries
+
+
+def render_workspace(projects: list[ProjectSummary]) -> str:
+    """Generate the markdown content for WORKSPACE.md."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    data = {project.root: project.data for project in projects}
+
+    lines = [
+        "# Workspace Dashboard",
+        "",
+        "*Auto-generated by workspace.py. Do not edit directly.*",
+        f"*Last updated: {timestamp}*",
+        "",
+        "## Projects",
+        "",
+    ]
+
+    rows = []
+    for project in projects:
+        counts = data[project.root].by_status
+        rows.append([
+            project.name,
+            str(len(counts[FeatureStatus.IN_PROGRESS])),
+            str(len(counts[FeatureStatus.BACKLOG])),
+            str(len(counts[FeatureStatus.COMPLETED])),
+            f"error: {project.error}" if project.error else "",
+        ])
+    lines.extend(render_table(["Project", "In Progress", "Backlog", "Completed", "Notes"], rows))
+
+    for section in WORKSPACE_SECTIONS:
+        lines.extend(["", f"## {section.title}", ""])
+        rows = [
+            [project.name] + [col.value(ctx, data[project.root]) for col in section.columns]
+            for project in projects
+            for ctx in data[project.root].by_status[section.status]
+        ]
+        if rows:
+            lines.extend(render_table(["Project"] + [col.header for col in section.columns], rows))
+        else:
+            lines.append(section.empty_message)
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def build_rollup(projects: list[ProjectSummary]) -> dict[str, Any]:
+    """Build the JSON roll-up: totals plus per-project feature records."""
+    totals = {status.value: 0 for status in FeatureStatus}
+    entries = []
+
+    for project in projects:
+        data = project.data
+        counts = {status.value: len(data.by_status[status]) for status in FeatureStatus}
+        for status, count in counts.items():
+            totals[status] += count
+
+        features = []
+        for ctx in project.features:
+            record = ctx.to_dict()
+            record["unmetDependencies"] = data.unmet_dependencies[ctx.feature_id]
+            features.append(record)
+
+        entries.append({
+            "name": project.name,
+            "root": str(project.root),
+            "counts": counts,
+            "error": project.error,
+            "features": features,
+        })
+
+    return {"version": ROLLUP_VERSION, "totals": totals, "projects": entries}
+
+
+def write_workspace(output_dir: Path, projects: list[ProjectSummary], force: bool = False) -> None:
+    """Write WORKSPACE.md and workspace.json into output_dir."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if write_if_changed(output_dir / WORKSPACE_DASHBOARD, render_workspace(projects), force=force):
+        print(f"[workspace] Generated {WORKSPACE_DASHBOARD}", file=sys.stderr)
+    else:
+        print(f"[workspace] {WORKSPACE_DASHBOARD} unchanged, skipped write", file=sys.stderr)
+
+    write_json_if_changed(output_dir / WORKSPACE_ROLLUP, build_rollup(projects))
+
+
+def generate_workspace(
+    patterns: list[str],
+    output_dir: Path,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> list[ProjectSummary]:
+    """Scan the matching projects and write the workspace dashboard and roll-up."""
+    projects = aggregate(expand_roots(patterns), workers=workers)
+    write_workspace(output_dir, projects, force=force)
+
+    feature_count = sum(len(project.features) for project in projects)
+    print(f"[workspace] {len(projects)} projects, {feature_count} features", file=sys.stderr)
+    for project in projects:
+        if project.error:
+            print(f"[workspace] Warning: {project.root}: {project.error}", file=sys.stderr)
+    return projects
+
+
+def main() -> int:
+    """CLI entry point."""
+    args = sys.argv[1:]
+    output_dir = Path.cwd()
+    workers: Optional[int] = None
+
+    for flag in ("--output", "--workers"):
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 >= len(args):
+                print(f"Error: {flag} needs a value", file=sys.stderr)
+                return 1
+            value = args[i + 1]
+            del args[i:i + 2]
+            if flag == "--output":
+                output_dir = Path(value)
+            else:
+                try:
+                    workers = int(value)
+                except ValueError:
+                    print("Error: --workers needs an integer", file=sys.stderr)
+                    return 1
+
+    if not args:
+        print(
+            "Usage: python3 workspace.py [--output DIR] [--workers N] <project_root_or_glob>...",
+            file=sys.stderr,
+        )
+        return 1
+
+    try:
+        projects = generate_workspace(args, output_dir, workers=workers)
+    except Exception as e:
+        print(f"Error generating workspace dashboard: {e}", file=sys.stderr)
+        return 1
+
+    if not projects:
+        print("Error: no project roots with docs/features matched", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,10 @@
 """Pytest fixtures for feature-workflow shared library tests."""
 
+import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
+from typing import Callable
 
 import pytest
 
@@ -10,6 +13,57 @@ LIB_DIR = Path(__file__).parent.parent / "lib"
 if str(LIB_DIR) not in sys.path:
     sys.path.insert(0, str(LIB_DIR))
 
+# Plugin hook scripts live outside the shared lib
+HOOKS_DIR = Path(__file__).parents[3] / "hooks"
+
+
+@pytest.fixture(autouse=True)
+def isolate_daemon_socket(tmp_path: Path, monkeypatch) -> None:
+    """Point the dashboard daemon client at a per-test socket path.
+
+    Keeps a daemon running on the developer's machine out of the tests.
+    """
+    monkeypatch.setenv("FEATURE_WORKFLOW_SOCKET", str(tmp_path / "daemon.sock"))
+
+
+@pytest.fixture
+def load_hook() -> Callable[[str], ModuleType]:
+    """Return a loader that imports a hook script from hooks/ by name."""
+    def _load(name: str) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(f"hook_{name}", HOOKS_DIR / f"{name}.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return _load
+
+
+@pytest.fixture
+def make_features() -> Callable[[Path, int], Path]:
+    """Return a factory that fills a project with synthetic features.
+
+    Every third feature is in progress and every fifth is completed, so all
+    three dashboard sections are populated.
+    """
+    def _make(project_root: Path, count: int) -> Path:
+        features_dir = project_root / "docs" / "features"
+        features_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(count):
+            feature_dir = features_dir / f"feature-{i:05d}"
+            feature_dir.mkdir()
+            (feature_dir / "idea.md").write_text(
+                f"---\nid: feature-{i:05d}\nname: Feature {i}\ntype: Feature\n"
+                f"priority: P{i % 3}\neffort: Small\nimpact: Medium\n"
+                f"created: 2024-01-{i % 28 + 1:02d}\n---\n\n# Feature {i}\n"
+            )
+            if i % 3 == 0 or i % 5 == 0:
+                (feature_dir / "plan.md").write_text("---\nstarted: 2024-02-01\n---\n\n# Plan\n")
+            if i % 5 == 0:
+                (feature_dir / "shipped.md").write_text("---\nshipped: 2024-03-01\n---\n\n# Shipped\n")
+        return project_root
+
+    return _make
+
 
 @pytest.fixture
 def temp_project(tmp_path: Path) -> Path:
@@ -0,0 +1,147 @@
+"""Tests for archiving old completed features out of DASHBOARD.md."""
+
+import json
+from datetime import date
+from pathlib import Path
+
+from archive import ARCHIVE_DAYS_ENV_VAR, KEEP_COMPLETED_ENV_VAR, ArchivePolicy
+from dashboard import DashboardData, generate_dashboard, render_dashboard
+from models import FeatureContext, FeatureStatus
+
+
+def _shipped(feature_id: str, shipped) -> FeatureContext:
+    """Build an in-memory completed FeatureContext."""
+    return FeatureContext(
+        feature_id=feature_id,
+        feature_dir=Path(feature_id),
+        status=FeatureStatus.COMPLETED,
+        name=feature_id.title(),
+        shipped=shipped,
+    )
+
+
+COMPLETED = [
+    _shipped("a", date(2023, 3, 1)),
+    _shipped("b", date(2024, 6, 1)),
+    _shipped("c", None),
+    _shipped("d", date(2024, 12, 1)),
+    _shipped("e", date(2023, 11, 1)),
+]
+
+
+def _write_shipped(project_root: Path, feature_id: str, shipped: str) -> None:
+    """Create a completed feature directory shipped on the given date."""
+    feature_dir = project_root / "docs" / "features" / feature_id
+    feature_dir.mkdir()
+    (feature_dir / "idea.md").write_text(f"---\nid: {feature_id}\nname: {feature_id.title()}\n---\n")
+    (feature_dir / "plan.md").write_text("---\nstarted: 2023-01-01\n---\n")
+    (feature_dir / "shipped.md").write_text(f"---\nshipped: {shipped}\n---\n")
+
+
+class TestArchivePolicy:
+    """Tests for ArchivePolicy.split."""
+
+    def test_disabled_by_default(self):
+        """Test that the default policy keeps everything."""
+        kept, archived = ArchivePolicy().split(COMPLETED)
+        assert kept == COMPLETED
+        assert archived == {}
+
+    def test_max_age(self):
+        """Test that features shipped before the cutoff go to their year."""
+        kept, archived = ArchivePolicy(max_age_days=365).split(COMPLETED, today=date(2025, 1, 1))
+
+        assert [ctx.feature_id for ctx in kept] == ["b", "c", "d"]
+        assert {year: [ctx.feature_id for ctx in items] for year, items in archived.items()} == {
+            2023: ["a", "e"],
+        }
+
+    def test_keep_completed(self):
+        """Test that only the most recently shipped are kept, in original order."""
+        kept, archived = ArchivePolicy(keep_completed=2).split(COMPLETED)
+
+        assert [ctx.feature_id for ctx in kept] == ["b", "c", "d"]
+        assert list(archived) == [2023]
+
+    def test_from_env(self, monkeypatch):
+        """Test that limits come from the environment and bad values disable them."""
+        monkeypatch.setenv(ARCHIVE_DAYS_ENV_VAR, "90")
+        monkeypatch.setenv(KEEP_COMPLETED_ENV_VAR, "lots")
+
+        assert ArchivePolicy.from_env() == ArchivePolicy(max_age_days=90, keep_completed=0)
+
+
+class TestArchiveRender:
+    """Tests for archive shards and links on the dashboard."""
+
+    def test_dashboard_links_shards(self):
+        """Test that the Completed section links each year's shard."""
+        content = render_dashboard(DashboardData(COMPLETED, ArchivePolicy(keep_completed=1)))
+
+        assert "| [d](./d/) | D | 2024-12-01 |" in content
+        assert "[a](./a/)" not in content
+        assert (
+            "*Older completed features: [2023](./.archive/DASHBOARD-2023.md) (2), "
+            "[2024](./.archive/DASHBOARD-2024.md) (1)*"
+        ) in content
+
+    def test_shards_written(self, temp_project: Path, monkeypatch):
+        """Test that generation writes one shard per year with relative links."""
+        monkeypatch.setenv(KEEP_COMPLETED_ENV_VAR, "1")
+        _write_shipped(temp_project, "old", "2022-05-01")
+        _write_shipped(temp_project, "new", "2024-05-01")
+
+        generate_dashboard(temp_project)
+
+        features_dir = temp_project / "docs" / "features"
+        shard = (features_dir / ".archive" / "DASHBOARD-2022.md").read_text()
+        assert shard.startswith("# Completed Features: 2022")
+        assert "| [old](../old/) | Old | 2022-05-01 |" in shard
+        assert "[old](./old/)" not in (features_dir / "DASHBOARD.md").read_text()
+
+    def test_unchanged_shard_not_rewritten(self, temp_project: Path, monkeypatch):
+        """Test that a shard is only rewritten when its features change."""
+        monkeypatch.setenv(KEEP_COMPLETED_ENV_VAR, "1")
+        _write_shipped(temp_project, "old", "2022-05-01")
+        _write_shipped(temp_project, "new", "2024-05-01")
+        generate_dashboard(temp_project)
+        shard = temp_project / "docs" / "features" / ".archive" / "DASHBOARD-2022.md"
+        before = shard.read_text()
+
+        _write_shipped(temp_project, "newer", "2024-06-01")
+        generate_dashboard(temp_project, feature_id="newer")
+
+        assert shard.read_text() == before
+        assert (shard.parent / "DASHBOARD-2024.md").exists()
+
+    def test_stale_shards_removed(self, temp_project: Path, monkeypatch):
+        """Test that disabling the archive removes its shards again."""
+        monkeypatch.setenv(KEEP_COMPLETED_ENV_VAR, "1")
+        _write_shipped(temp_project, "old", "2022-05-01")
+        _write_shipped(temp_project, "new", "2024-05-01")
+        generate_dashboard(temp_project)
+
+        monkeypatch.delenv(KEEP_COMPLETED_ENV_VAR)
+        generate_dashboard(temp_project)
+
+        features_dir = temp_project / "docs" / "features"
+        assert list((features_dir / ".archive").iterdir()) == []
+        assert "[old](./old/)" in (features_dir / "DASHBOARD.md").read_text()
+
+    def test_feature_named_archive(self, temp_project: Path, monkeypatch):
+        """Test that a feature called "archive" is neither overwritten nor confused with shards."""
+        monkeypatch.setenv(KEEP_COMPLETED_ENV_VAR, "1")
+        _write_shipped(temp_project, "archive", "2022-05-01")
+        _write_shipped(temp_project, "new", "2024-05-01")
+        features_dir = temp_project / "docs" / "features"
+        own_file = features_dir / "archive" / "DASHBOARD-notes.md"
+        own_file.write_text("kept")
+
+        generate_dashboard(temp_project)
+        monkeypatch.delenv(KEEP_COMPLETED_ENV_VAR)
+        generate_dashboard(temp_project)
+
+        assert own_file.read_text() == "kept"
+        assert "[archive](./archive/)" in (features_dir / "DASHBOARD.md").read_text()
+        index = json.loads((features_dir / "index.json").read_text())
+        assert [record["id"] for record in index["features"]] == ["archive", "new"]
@@ -0,0 +1,219 @@
+"""Tests for the streaming [AUDIT:id:seq] capture parser."""
+
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import audit_capture
+from audit_capture import (
+    MAX_MISSING,
+    MAX_UNEXPECTED,
+    CaptureParser,
+    capture,
+    iter_mapped,
+    iter_stream,
+    parse_data,
+    write_capture,
+)
+
+
+LOG = (
+    b"2024-01-02T03:04:05Z INFO [AUDIT:auth-001:1] Entry - user: {\"id\": 3}\n"
+    b"unrelated output\n"
+    b"[AUDIT:auth-001:3] Validation result: true\n"
+    b"\x1b[32m[AUDIT:auth-001:2] late arrival\x1b[0m\r\n"
+    b"[AUDIT:other-002:1] someone else\n"
+    b"[AUDIT:auth-001:5] done [AUDIT:auth-001:9]"
+)
+
+
+def _capture_json(audit_id: str, source: Path, **kwargs) -> dict:
+    out = io.StringIO()
+    capture(audit_id, source, out, **kwargs)
+    return json.loads(out.getvalue())
+
+
+class TestCaptureParser:
+    """Tests for CaptureParser bookkeeping."""
+
+    def test_gaps_tracked_incrementally(self):
+        """Test that gaps open on jumps and close on late arrivals."""
+        parser = CaptureParser("a")
+        parser.feed(b"[AUDIT:a:1] x")
+        parser.feed(b"[AUDIT:a:4] x")
+        assert parser.gaps == [(2, 3)]
+
+        parser.feed(b"[AUDIT:a:2] x")
+        assert parser.gaps == [(3, 3)]
+        assert parser.out_of_order == [{"sequence": 2, "after": 4}]
+
+        parser.feed(b"[AUDIT:a:10] x")
+        parser.feed(b"[AUDIT:a:7] x")
+        parser.feed(b"[AUDIT:a:3] x")
+        assert parser.gaps == [(5, 6), (8, 9)]
+        assert parser.missing_sequences() == [5, 6, 8, 9]
+        assert parser.missing_sequences(3) == [5, 6, 8]
+
+    def test_huge_sequence_bounded(self):
+        """Test that a stray huge sequence number costs one interval, not one entry per gap."""
+        parser = CaptureParser("a")
+        tracemalloc.start()
+        for line in (b"[AUDIT:a:1] x", b"[AUDIT:a:50000000] stray", b"[AUDIT:a:25000000] x"):
+            parser.feed(line)
+        out = io.StringIO()
+        write_capture(out, [], parser, {})
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert parser.gaps == [(2, 24999999), (25000001, 49999999)]
+        assert parser.missing_count() == 49999997
+        result = json.loads(out.getvalue())
+        assert len(result["missingSequences"]) == MAX_MISSING
+        assert result["missingCount"] == 49999997
+        assert peak < 1024 * 1024
+
+    def test_unexpected_capped(self):
+        """Test that unexpected lines beyond the limit are counted, not kept."""
+        parser = CaptureParser("a")
+        for i in range(MAX_UNEXPECTED + 50):
+            parser.feed(f"[AUDIT:other:{i}] x".encode())
+
+        assert len(parser.unexpected) == MAX_UNEXPECTED
+        assert parser.unexpected_count == MAX_UNEXPECTED + 50
+
+    def test_repeated_loop_not_out_of_order(self):
+        """Test that a code path logging 1,2,1,2 is not reported as out of order."""
+        parser = CaptureParser("a")
+        for line in (b"[AUDIT:a:1] x", b"[AUDIT:a:2] x", b"[AUDIT:a:1] x", b"[AUDIT:a:2] x"):
+            parser.feed(line)
+        assert parser.out_of_order == []
+        assert parser.log_count == 4
+
+    def test_expected_sequences(self):
+        """Test that a manifest turns unknown sequences into unexpected logs."""
+        parser = CaptureParser("a", expected=[1, 2, 3])
+        assert parser.feed(b"[AUDIT:a:7] stray") is None
+        parser.feed(b"[AUDIT:a:1] x")
+
+        assert parser.missing_sequences() == [2, 3]
+        assert parser.unexpected[0]["reason"] == "unexpected-sequence"
+
+    def test_non_audit_lines_ignored(self):
+        """Test that lines without a well-formed marker yield nothing."""
+        parser = CaptureParser("a")
+        assert parser.feed(b"plain") is None
+        assert parser.feed(b"[AUDIT:broken] x") is None
+        assert parser.log_count == 0
+
+
+class TestParseData:
+    """Tests for parse_data."""
+
+    @pytest.mark.parametrize("message,expected", [
+        ("true", True),
+        ("Validation result: false", False),
+        ('Entry - user: {"id": 3, "ok": true}', {"id": 3, "ok": True}),
+        ("items [1, 2]", [1, 2]),
+        ("Entry - credentials: { email: x }", None),
+    ])
+    def test_values(self, message: str, expected):
+        """Test JSON values are recovered from common log shapes."""
+        assert parse_data(message) == expected
+
+
+class TestCapture:
+    """Tests for file and stream capture."""
+
+    def test_mapped_file(self, tmp_path: Path):
+        """Test the capture built from a memory-mapped file."""
+        log = tmp_path / "run.log"
+        log.write_bytes(LOG)
+        result = _capture_json("auth-001", log, captureId="capture-001", method="paste")
+
+        assert result["captureId"] == "capture-001"
+        assert [r["sequence"] for r in result["logs"]] == [1, 3, 2, 5]
+        first = result["logs"][0]
+        assert first["timestamp"] == "2024-01-02T03:04:05Z"
+        assert first["data"] == {"id": 3}
+        assert result["logs"][2]["raw"] == "[AUDIT:auth-001:2] late arrival"
+        assert result["missingSequences"] == [4]
+        assert result["outOfOrder"] == [{"sequence": 2, "after": 3}]
+        assert [u["auditId"] for u in result["unexpectedLogs"]] == ["other-002"]
+
+    def test_stream_matches_mapped(self, tmp_path: Path):
+        """Test that stdin-style streaming gives the same records as mmap."""
+        log = tmp_path / "run.log"
+        log.write_bytes(LOG)
+
+        mapped = list(iter_mapped(log, CaptureParser("auth-001")))
+        streamed = list(iter_stream(io.BytesIO(LOG), CaptureParser("auth-001")))
+        # Tiny chunks split lines and markers across reads
+        chunked = list(iter_stream(io.BytesIO(LOG), CaptureParser("auth-001"), chunk_size=7))
+        assert mapped == streamed == chunked
+
+    def test_empty_file(self, tmp_path: Path):
+        """Test that an empty log gives an empty capture."""
+        log = tmp_path / "empty.log"
+        log.write_bytes(b"")
+        result = _capture_json("auth-001", log)
+
+        assert result["logs"] == []
+        assert result["missingSequences"] == []
+
+    def test_cli(self, tmp_path: Path, monkeypatch):
+        """Test the CLI with an injections manifest and an output file."""
+        log = tmp_path / "run.log"
+        log.write_bytes(LOG)
+        injections = tmp_path / "injections.json"
+        injections.write_text(json.dumps({"injections": [{"id": n} for n in (1, 2, 3, 4)]}))
+        output = tmp_path / "capture.json"
+
+        monkeypatch.setattr(sys, "argv", [
+            "audit_capture.py", "auth-001", str(log), "--injections", str(injections),
+            "--output", str(output), "--scenario", "login",
+        ])
+        assert audit_capture.main() == 0
+
+        result = json.loads(output.read_text())
+        assert result["scenario"] == "login"
+        assert result["missingSequences"] == [4]
+        assert {u["reason"] for u in result["unexpectedLogs"]} == {"other-audit", "unexpected-sequence"}
+        assert list(tmp_path.glob("*.tmp")) == []
+
+
+@pytest.mark.benchmark
+class TestCaptureBenchmark:
+    """Benchmark: scan throughput over a large, mostly unrelated log."""
+
+    def test_large_log(self, tmp_path: Path, capsys):
+        """Test and report capture time for a ~200 MB log with sparse audit lines."""
+        noise = b"2024-01-02T03:04:05Z DEBUG worker-7 processed request id=12345 status=200\n" * 1000
+        chunk = noise + b"[AUDIT:ci-001:1] tick {\"n\": 1}\n"
+        log = tmp_path / "ci.log"
+        with log.open("wb") as f:
+            for _ in range(2800):
+                f.write(chunk)
+        size = log.stat().st_size
+
+        start = time.perf_counter()
+        parser = CaptureParser("ci-001")
+        count = sum(1 for _ in iter_mapped(log, parser))
+        mapped = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with log.open("rb") as f:
+            streamed = sum(1 for _ in iter_stream(f, CaptureParser("ci-001")))
+        stream = time.perf_counter() - start
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] {size / 2**20:.0f} MiB log: mmap {size / 2**20 / mapped:.0f} MiB/s, "
+                f"chunked stream {size / 2**20 / stream:.0f} MiB/s"
+            )
+
+        assert count == streamed == 2800
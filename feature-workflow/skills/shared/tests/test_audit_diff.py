@@ -0,0 +1,195 @@
+"""Tests for the capture-to-capture diff engine."""
+
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import audit_diff
+from audit_capture import capture
+from audit_diff import compare, diff_captures, digest_capture, format_key, read_capture, stable_keys
+
+
+def _write_capture(path: Path, audit_id: str, log: str, **header) -> Path:
+    """Run a log through audit_capture so the file has its real layout."""
+    source = path.with_suffix(".log")
+    source.write_text(log)
+    out = io.StringIO()
+    capture(audit_id, source, out, **header)
+    path.write_text(out.getvalue())
+    return path
+
+
+BASELINE = (
+    "[AUDIT:a:1] Entry - user: {\"id\": 1}\n"
+    "[AUDIT:a:2] loop 1\n"
+    "[AUDIT:a:2] loop 2\n"
+    "[AUDIT:a:3] valid: true\n"
+    "[AUDIT:a:4] saved\n"
+)
+
+
+@pytest.fixture
+def captures(tmp_path: Path) -> tuple[Path, Path]:
+    """Create a baseline and a second run that differs in every way."""
+    base = _write_capture(tmp_path / "capture-001.json", "a", BASELINE, captureId="capture-001", scenario="ok")
+    other = _write_capture(tmp_path / "capture-002.json", "a", (
+        "2024-05-06T07:08:09Z [AUDIT:a:3] valid: false\n"
+        "[AUDIT:a:1] Entry - user: {\"id\": 1}\n"
+        "[AUDIT:a:2] loop 1\n"
+        "[AUDIT:a:5] error path\n"
+    ), captureId="capture-002", scenario="bad password")
+    return base, other
+
+
+class TestReadCapture:
+    """Tests for reading capture files."""
+
+    def test_streamed_layout(self, captures: tuple[Path, Path]):
+        """Test that audit_capture.py output is read record by record."""
+        header, records = read_capture(captures[0])
+        assert header["captureId"] == "capture-001"
+        assert "logs" not in header
+        assert [r["sequence"] for r in records] == [1, 2, 2, 3, 4]
+
+    def test_whole_document_fallback(self, tmp_path: Path):
+        """Test that a hand-written, pretty-printed capture is also accepted."""
+        path = tmp_path / "manual.json"
+        path.write_text(json.dumps({"auditId": "a", "logs": [{"sequence": 1, "message": "x", "data": None}]}, indent=2))
+        header, records = read_capture(path)
+        assert header == {"auditId": "a"}
+        assert [r["sequence"] for r in records] == [1]
+
+    def test_not_a_capture(self, tmp_path: Path):
+        """Test that JSON without logs is rejected."""
+        path = tmp_path / "other.json"
+        path.write_text("[]")
+        with pytest.raises(ValueError):
+            read_capture(path)
+
+
+class TestCompare:
+    """Tests for aligning two captures."""
+
+    def test_classification(self, captures: tuple[Path, Path]):
+        """Test missing, new, changed and moved sequences, counting repeats separately."""
+        diff = compare(digest_capture(captures[0]), digest_capture(captures[1]))
+
+        assert [format_key(k) for k in diff.missing] == ["2#2", "4"]
+        assert [format_key(k) for k in diff.new] == ["5"]
+        assert [format_key(k) for k in diff.changed] == ["3"]
+        assert [format_key(k) for k in diff.moved] == ["3"]
+        assert diff.unchanged == 2
+        assert not diff.identical
+
+    def test_identical_ignores_timestamps(self, tmp_path: Path):
+        """Test that captures differing only in timestamps are identical."""
+        base = _write_capture(tmp_path / "a.json", "a", BASELINE)
+        stamped = "".join(f"2024-01-01T00:00:0{i}Z {line}\n" for i, line in enumerate(BASELINE.splitlines()))
+        other = _write_capture(tmp_path / "b.json", "a", stamped)
+        assert compare(digest_capture(base), digest_capture(other)).identical
+
+    def test_key_order_ignored(self, tmp_path: Path):
+        """Test that data equal as JSON but logged with reordered keys is unchanged."""
+        base = _write_capture(tmp_path / "a.json", "a", '[AUDIT:a:1] user: {"id": 1, "role": "admin"}\n')
+        other = _write_capture(tmp_path / "b.json", "a", '[AUDIT:a:1] user: {"role": "admin", "id": 1}\n')
+        assert compare(digest_capture(base), digest_capture(other)).identical
+
+    def test_different_audits(self, tmp_path: Path):
+        """Test that captures of different audits share no sequences."""
+        base = _write_capture(tmp_path / "a.json", "a", BASELINE)
+        other = _write_capture(tmp_path / "b.json", "b", BASELINE.replace(":a:", ":b:"))
+        diff = compare(digest_capture(base), digest_capture(other))
+        assert len(diff.missing) == len(diff.new) == 5
+
+    @pytest.mark.parametrize("order,moved", [
+        ([0, 1, 2, 3], 0),
+        ([3, 0, 1, 2], 1),
+        ([1, 0, 3, 2], 2),
+        ([3, 2, 1, 0], 3),
+    ])
+    def test_stable_keys(self, order: list[int], moved: int):
+        """Test that keys outside a longest same-order run are reported as moved."""
+        stable = stable_keys({key: key for key in range(4)}, order)
+        assert len(set(range(4)) - stable) == moved
+        assert [key for key in order if key in stable] == sorted(stable)
+
+
+class TestDiffCaptures:
+    """Tests for multi-capture diffs and the CLI."""
+
+    def test_examples(self, captures: tuple[Path, Path]):
+        """Test that changed payloads are read back for display."""
+        [diff] = diff_captures(list(captures))
+        assert diff.examples == {diff.changed[0]: ("true", "false")}
+
+    def test_cli(self, captures: tuple[Path, Path], monkeypatch, capsys):
+        """Test text and JSON output against several captures."""
+        base, other = captures
+        monkeypatch.setattr(sys, "argv", ["audit_diff.py", str(base), str(other), str(base)])
+        assert audit_diff.main() == 0
+        out = capsys.readouterr().out
+        assert "capture-001 (ok) -> capture-002 (bad password)" in out
+        assert "    3: true -> false" in out
+        assert "identical (5 logs)" in out
+
+        monkeypatch.setattr(sys, "argv", ["audit_diff.py", str(base), str(other), "--json"])
+        assert audit_diff.main() == 0
+        [result] = json.loads(capsys.readouterr().out)
+        assert result["missing"] == ["2#2", "4"]
+        assert result["examples"][0]["sequence"] == "3"
+
+        monkeypatch.setattr(sys, "argv", ["audit_diff.py", str(base)])
+        assert audit_diff.main() == 1
+
+
+@pytest.mark.benchmark
+class TestAuditDiffBenchmark:
+    """Benchmark: diffing large captures."""
+
+    def test_large_captures(self, tmp_path: Path, capsys):
+        """Test and report time and peak memory diffing two 50k-log captures."""
+        count = 50_000
+
+        def write(path: Path, flip: int) -> Path:
+            with path.with_suffix(".log").open("w") as f:
+                for i in range(count):
+                    sequence = i % 1000 + 1
+                    value = i % flip == 0 if flip else False
+                    f.write(f"[AUDIT:big:{sequence}] state: {{\"i\": {i}, \"flag\": {json.dumps(value)}}}\n")
+            out = io.StringIO()
+            capture("big", path.with_suffix(".log"), out)
+            path.write_text(out.getvalue())
+            return path
+
+        base, other = write(tmp_path / "base.json", 0), write(tmp_path / "other.json", 1000)
+        size = base.stat().st_size
+
+        start = time.perf_counter()
+        [diff] = diff_captures([base, other])
+        elapsed = time.perf_counter() - start
+
+        tracemalloc.start()
+        diff_captures([base, other])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        tracemalloc.start()
+        whole = [json.loads(base.read_text()), json.loads(other.read_text())]
+        load_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del whole
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] 2 x {count} logs ({size / 2**20:.0f} MiB each): diff {elapsed * 1000:.0f} ms, "
+                f"peak {peak / 2**20:.1f} MiB (loading both whole: {load_peak / 2**20:.1f} MiB)"
+            )
+
+        assert len(diff.changed) == count // 1000
+        assert not diff.missing and not diff.new and not diff.moved
+        assert peak < load_peak
@@ -0,0 +1,286 @@
+"""Tests for the batched audit injection/revert engine."""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import audit_inject
+from audit_inject import apply_file, load_manifest, manifest_path, revert_file, run
+
+
+SOURCE = """def login(user):
+    check(user)
+    return session(user)
+"""
+
+
+def _injection(id_: int, line: int, position: str = "after", file: str = "src/auth.py") -> dict:
+    return {
+        "id": id_,
+        "file": file,
+        "line": line,
+        "position": position,
+        "injectedContent": f"print('[AUDIT:a:{id_}]')  # AUDIT-INJECTED",
+    }
+
+
+class TestApplyFile:
+    """Tests for apply_file."""
+
+    def test_positions_in_one_pass(self, tmp_path: Path):
+        """Test that line numbers refer to the original file for every injection."""
+        path = tmp_path / "auth.py"
+        path.write_text(SOURCE)
+        injections = [_injection(1, 1), _injection(2, 3, "before"), _injection(3, 3)]
+
+        assert apply_file(path, injections) == 3
+        assert path.read_text().splitlines() == [
+            "def login(user):",
+            "print('[AUDIT:a:1]')  # AUDIT-INJECTED",
+            "    check(user)",
+            "    print('[AUDIT:a:2]')  # AUDIT-INJECTED",
+            "    return session(user)",
+            "    print('[AUDIT:a:3]')  # AUDIT-INJECTED",
+        ]
+        assert [inj["injectedLine"] for inj in injections] == [2, 4, 6]
+        assert all(inj["status"] == "injected" for inj in injections)
+
+    def test_replace_records_original(self, tmp_path: Path):
+        """Test that replace keeps the displaced line for revert."""
+        path = tmp_path / "auth.py"
+        path.write_text(SOURCE)
+        injection = _injection(1, 2, "replace")
+
+        apply_file(path, [injection])
+
+        assert injection["originalContent"] == "    check(user)"
+        assert "check(user)" not in path.read_text()
+
+    def test_invalid_entries_fail_alone(self, tmp_path: Path):
+        """Test that a bad line number fails only its own injection."""
+        path = tmp_path / "auth.py"
+        path.write_text(SOURCE)
+        bad, good = _injection(1, 99), _injection(2, 1)
+
+        assert apply_file(path, [bad, good]) == 1
+        assert bad["status"] == "failed"
+        assert "outside" in bad["error"]
+        assert good["status"] == "injected"
+
+    def test_already_injected_skipped(self, tmp_path: Path):
+        """Test that applying twice does not inject twice."""
+        path = tmp_path / "auth.py"
+        path.write_text(SOURCE)
+        injections = [_injection(1, 1)]
+        apply_file(path, injections)
+        before = path.read_text()
+
+        assert apply_file(path, injections) == 0
+        assert path.read_text() == before
+
+    def test_retry_after_partial_failure(self, tmp_path: Path):
+        """Test that a fixed entry lands at its original line next to earlier injections."""
+        path = tmp_path / "auth.py"
+        path.write_text(SOURCE)
+        injections = [_injection(1, 1), _injection(2, 3)]
+        injections[1]["injectedContent"] = ""
+
+        assert apply_file(path, injections) == 1
+        assert injections[1]["status"] == "failed"
+
+        injections[1]["injectedContent"] = "print('[AUDIT:a:2]')  # AUDIT-INJECTED"
+        assert apply_file(path, injections) == 1
+        assert path.read_text().splitlines() == [
+            "def login(user):",
+            "print('[AUDIT:a:1]')  # AUDIT-INJECTED",
+            "    check(user)",
+            "    return session(user)",
+            "    print('[AUDIT:a:2]')  # AUDIT-INJECTED",
+        ]
+        assert [inj["injectedLine"] for inj in injections] == [2, 5]
+
+        assert revert_file(path, injections) == 2
+        assert path.read_text() == SOURCE
+
+    def test_retry_without_final_newline(self, tmp_path: Path):
+        """Test that a retry keeps a missing final newline missing."""
+        path = tmp_path / "auth.py"
+        path.write_bytes(b"a = 1\nb = 2")
+        injections = [_injection(1, 2), _injection(2, 1, "before")]
+        injections[1]["position"] = "sideways"
+
+        apply_file(path, injections)
+        injections[1]["position"] = "before"
+        apply_file(path, injections)
+
+        assert path.read_bytes() == (
+            b"print('[AUDIT:a:2]')  # AUDIT-INJECTED\na = 1\nb = 2\nprint('[AUDIT:a:1]')  # AUDIT-INJECTED"
+        )
+
+    def test_retry_refused_when_injections_lost(self, tmp_path: Path):
+        """Test that a retry does not guess when earlier injected lines are gone."""
+        path = tmp_path / "auth.py"
+        path.write_text(SOURCE)
+        injections = [_injection(1, 1), _injection(2, 3, "sideways")]
+        apply_file(path, injections)
+        path.write_text(SOURCE)
+
+        injections[1]["position"] = "after"
+        assert apply_file(path, injections) == 0
+        assert "revert it first" in injections[1]["error"]
+        assert path.read_text() == SOURCE
+
+    def test_crlf_and_missing_final_newline(self, tmp_path: Path):
+        """Test that line endings and a missing final newline are preserved."""
+        path = tmp_path / "auth.py"
+        original = b"a = 1\r\nb = 2"
+        path.write_bytes(original)
+        injections = [_injection(1, 2)]
+
+        apply_file(path, injections)
+        assert path.read_bytes() == b"a = 1\r\nb = 2\r\nprint('[AUDIT:a:1]')  # AUDIT-INJECTED"
+
+        revert_file(path, injections)
+        assert path.read_bytes() == original
+
+
+class TestRevertFile:
+    """Tests for revert_file."""
+
+    def test_round_trip(self, tmp_path: Path):
+        """Test that revert restores the file byte for byte."""
+        path = tmp_path / "auth.py"
+        path.write_text(SOURCE)
+        injections = [_injection(1, 1), _injection(2, 2, "replace"), _injection(3, 3, "before")]
+
+        apply_file(path, injections)
+        assert revert_file(path, injections) == 3
+
+        assert path.read_text() == SOURCE
+        assert all(inj["status"] == "removed" for inj in injections)
+
+    def test_shifted_file(self, tmp_path: Path):
+        """Test that injected lines are found by content after edits above them."""
+        path = tmp_path / "auth.py"
+        path.write_text(SOURCE)
+        injections = [_injection(1, 2)]
+        apply_file(path, injections)
+
+        path.write_text("# new header\n# more\n" + path.read_text())
+        revert_file(path, injections)
+
+        assert path.read_text() == "# new header\n# more\n" + SOURCE
+
+    def test_missing_line_kept_for_retry(self, tmp_path: Path):
+        """Test that a line that cannot be found stays injected with an error."""
+        path = tmp_path / "auth.py"
+        path.write_text(SOURCE)
+        injections = [_injection(1, 1)]
+        apply_file(path, injections)
+        path.write_text(SOURCE)
+
+        assert revert_file(path, injections) == 0
+        assert injections[0]["status"] == "injected"
+        assert injections[0]["error"] == "injected line not found"
+
+
+class TestRun:
+    """Tests for run and the CLI."""
+
+    def test_parallel_files(self, tmp_path: Path):
+        """Test that each file is handled once across the worker pool."""
+        for name in ("a.py", "b.py", "c.py"):
+            (tmp_path / name).write_text(SOURCE)
+        manifest = {"injections": [
+            _injection(i, 1 + i % 3, file=f"{'abc'[i % 3]}.py") for i in range(9)
+        ]}
+
+        assert run(tmp_path, manifest, workers=3) == {"a.py": 3, "b.py": 3, "c.py": 3}
+        assert run(tmp_path, manifest, revert=True, workers=3) == {"a.py": 3, "b.py": 3, "c.py": 3}
+        assert all((tmp_path / name).read_text() == SOURCE for name in ("a.py", "b.py", "c.py"))
+
+    def test_equivalent_paths_grouped(self, tmp_path: Path):
+        """Test that differently spelled paths to one file are rewritten together."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "auth.py").write_text(SOURCE)
+        manifest = {"injections": [
+            _injection(1, 1),
+            _injection(2, 3, file="./src/auth.py"),
+            _injection(3, 2, file="src/../src/auth.py"),
+        ]}
+
+        assert run(tmp_path, manifest, workers=3) == {"src/auth.py": 3}
+        text = (tmp_path / "src" / "auth.py").read_text()
+        assert all(f"[AUDIT:a:{i}]" in text for i in (1, 2, 3))
+
+        assert run(tmp_path, manifest, revert=True) == {"src/auth.py": 3}
+        assert (tmp_path / "src" / "auth.py").read_text() == SOURCE
+
+    def test_cli(self, tmp_path: Path, monkeypatch, capsys):
+        """Test that the CLI updates the manifest and reports failures."""
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "auth.py").write_text(SOURCE)
+        path = manifest_path(tmp_path, "a")
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({"auditId": "a", "injections": [
+            _injection(1, 1), _injection(2, 1, file="src/missing.py"),
+        ]}))
+
+        monkeypatch.setattr(sys, "argv", ["audit_inject.py", "apply", "a", "--root", str(tmp_path)])
+        assert audit_inject.main() == 1
+
+        manifest = load_manifest(path)
+        assert [inj["status"] for inj in manifest["injections"]] == ["injected", "failed"]
+        assert "src/auth.py\t1 injected" in capsys.readouterr().out
+
+        monkeypatch.setattr(sys, "argv", ["audit_inject.py", "revert", "a", "--root", str(tmp_path)])
+        assert audit_inject.main() == 1
+        assert (tmp_path / "src" / "auth.py").read_text() == SOURCE
+        assert not list((tmp_path / "src").glob(".*.tmp"))
+
+
+@pytest.mark.benchmark
+class TestInjectBenchmark:
+    """Benchmark: one pass per file vs one read-modify-write per injection."""
+
+    FILES = 50
+    PER_FILE = 20
+
+    def test_batched_vs_per_injection(self, tmp_path: Path, capsys):
+        """Test and report apply time for 1,000 injections across 50 files."""
+        body = "".join(f"    value_{i} = compute({i})\n" for i in range(2000))
+
+        def manifest() -> dict:
+            return {"injections": [
+                _injection(f * self.PER_FILE + n, 1 + n * 97, file=f"mod_{f}.py")
+                for f in range(self.FILES) for n in range(self.PER_FILE)
+            ]}
+
+        def reset() -> None:
+            for f in range(self.FILES):
+                (tmp_path / f"mod_{f}.py").write_text(body)
+
+        reset()
+        one_by_one = manifest()
+        start = time.perf_counter()
+        # Highest line first, as the manual Edit workflow does
+        for injection in sorted(one_by_one["injections"], key=lambda inj: -inj["line"]):
+            apply_file(tmp_path / injection["file"], [injection])
+        single = time.perf_counter() - start
+
+        reset()
+        batched = manifest()
+        start = time.perf_counter()
+        run(tmp_path, batched)
+        batch = time.perf_counter() - start
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] {self.FILES * self.PER_FILE} injections: per-injection "
+                f"{single * 1000:.0f} ms, batched {batch * 1000:.0f} ms"
+            )
+
+        assert (tmp_path / "mod_0.py").read_text().count("AUDIT-INJECTED") == self.PER_FILE
@@ -0,0 +1,246 @@
+"""Tests for the indexed audit registry."""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import audit_state
+from audit_state import AuditIndex, load_active, load_index, rebuild_index, set_audit
+
+
+def _write_registry(root: Path, audits: list[dict]) -> Path:
+    path = root / "docs" / "audits" / "registry.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"audits": audits}, indent=2))
+    return path
+
+
+def _write_manifest(root: Path, audit_id: str, injections: list[dict]) -> Path:
+    path = root / "docs" / "audits" / audit_id / "injections.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({"auditId": audit_id, "injections": injections}))
+    return path
+
+
+def _touch(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def audits(tmp_path: Path) -> Path:
+    """Create a registry with one active and one completed audit."""
+    _write_registry(tmp_path, [
+        {"id": "auth-001", "name": "Login", "status": "in-progress"},
+        {"id": "old-001", "name": "Old", "status": "completed"},
+    ])
+    _write_manifest(tmp_path, "auth-001", [
+        {"id": 1, "file": "src/auth.ts", "status": "injected"},
+        {"id": 2, "file": "./src/auth.ts", "status": "injected"},
+        {"id": 3, "file": "src/session.ts", "status": "removed"},
+    ])
+    _write_manifest(tmp_path, "old-001", [{"id": 1, "file": "src/auth.ts", "status": "removed"}])
+    return tmp_path
+
+
+class TestLoadIndex:
+    """Tests for building and validating the index."""
+
+    def test_lookups(self, audits: Path):
+        """Test status and file lookups against the registry and manifests."""
+        index = load_index(audits)
+
+        assert index.active_ids() == ["auth-001"]
+        assert index.ids_with_status("completed") == ["old-001"]
+        assert index.files("auth-001") == {"src/auth.ts": 2, "src/session.ts": 0}
+        assert index.audits_for_file("src/auth.ts") == ["auth-001"]
+        assert index.audits_for_file("src/auth.ts", active_only=False) == ["auth-001", "old-001"]
+        assert index.audits_for_file("src/other.ts") == []
+        assert (audits / "docs" / "audits" / ".registry-index.json").exists()
+
+    def test_memoized_until_registry_changes(self, audits: Path):
+        """Test that loads reuse the index until registry.json is edited directly."""
+        first = load_index(audits)
+        assert load_index(audits) is first
+
+        registry = _write_registry(audits, [
+            {"id": "auth-001", "name": "Login", "status": "completed"},
+            {"id": "old-001", "name": "Old", "status": "completed"},
+        ])
+        _touch(registry)
+        assert load_index(audits).active_ids() == []
+
+    def test_active_manifest_changes_detected(self, audits: Path):
+        """Test that an active audit's manifest is revalidated on load."""
+        load_index(audits)
+        manifest = _write_manifest(audits, "auth-001", [{"id": 1, "file": "src/new.ts", "status": "injected"}])
+        _touch(manifest)
+
+        index = load_index(audits)
+        assert index.audits_for_file("src/new.ts") == ["auth-001"]
+        assert index.audits_for_file("src/auth.ts") == []
+
+    def test_on_disk_index_reused(self, audits: Path, monkeypatch):
+        """Test that a new process uses the stored index without reading manifests."""
+        load_index(audits)
+        audit_state._loaded.clear()
+
+        def fail(path):
+            raise AssertionError(f"re-read {path}")
+
+        monkeypatch.setattr(audit_state, "read_manifest_files", fail)
+        assert load_index(audits).active_ids() == ["auth-001"]
+
+    def test_active_view(self, audits: Path):
+        """Test that the active view is stored separately and holds only active audits."""
+        load_index(audits)
+        audit_state._loaded.clear()
+        (audits / "docs" / "audits" / ".registry-index.json").unlink()
+
+        view = load_active(audits)
+        assert list(view.audits) == ["auth-001"]
+        assert view.audits_for_file("src/auth.ts") == ["auth-001"]
+        assert not (audits / "docs" / "audits" / ".registry-index.json").exists()
+
+    def test_missing_or_corrupt(self, tmp_path: Path):
+        """Test that missing or corrupt files give an empty index."""
+        assert load_index(tmp_path).active_ids() == []
+
+        registry = _write_registry(tmp_path, [])
+        registry.write_text("{not json")
+        _write_manifest(tmp_path, "x", [])
+        (tmp_path / "docs" / "audits" / "x" / "injections.json").write_text("[]")
+        assert load_index(tmp_path).audits == {}
+
+
+class TestSetAudit:
+    """Tests for registry writes."""
+
+    def test_incremental_matches_rebuild(self, audits: Path):
+        """Test that updates through set_audit leave the same index a rebuild gives."""
+        load_index(audits)
+        _write_manifest(audits, "new-001", [{"id": 1, "file": "src/api.ts", "status": "injected"}])
+        set_audit(audits, "new-001", name="API", status="in-progress")
+        set_audit(audits, "auth-001", status="completed")
+
+        index = load_index(audits)
+        assert index.active_ids() == ["new-001"]
+        assert index.audits_for_file("src/api.ts") == ["new-001"]
+
+        rebuilt = rebuild_index(audits / "docs" / "audits")
+        assert index.to_dict() == rebuilt.to_dict()
+        assert load_active(audits).to_dict() == rebuilt.active_view().to_dict()
+
+        registry = json.loads((audits / "docs" / "audits" / "registry.json").read_text())
+        assert [a["id"] for a in registry["audits"]] == ["auth-001", "old-001", "new-001"]
+        assert registry["audits"][2]["createdAt"]
+
+    def test_creates_registry(self, tmp_path: Path):
+        """Test that the first audit creates docs/audits/registry.json."""
+        entry = set_audit(tmp_path, "first-001", status="in-progress")
+        assert entry["id"] == "first-001"
+        assert load_index(tmp_path).active_ids() == ["first-001"]
+
+
+class TestAuditIndex:
+    """Tests for AuditIndex bookkeeping."""
+
+    def test_put_moves_between_lists(self):
+        """Test that re-putting an audit moves it and drops empty lists."""
+        index = AuditIndex()
+        index.put_audit({"id": "a", "status": "in-progress"})
+        index.put_manifest("a", None, {"x.py": 1})
+        index.put_audit({"id": "a", "status": "completed"})
+        index.put_manifest("a", None, {"y.py": 0})
+
+        assert index.by_status == {"completed": ["a"]}
+        assert index.by_file == {"y.py": ["a"]}
+
+
+class TestCli:
+    """Tests for the CLI."""
+
+    def test_set_active_and_file(self, audits: Path, monkeypatch, capsys):
+        """Test the set, active and file commands."""
+        def run(*args: str) -> int:
+            monkeypatch.setattr(sys, "argv", ["audit_state.py", "--root", str(audits), *args])
+            return audit_state.main()
+
+        assert run("set", "old-001", "in-progress") == 0
+        capsys.readouterr()
+
+        assert run("active") == 0
+        active = json.loads(capsys.readouterr().out)
+        assert [a["id"] for a in active] == ["auth-001", "old-001"]
+        assert active[0]["files"]["src/auth.ts"] == 2
+
+        assert run("file", str(audits / "src" / "auth.ts")) == 0
+        assert capsys.readouterr().out.splitlines() == ["auth-001\tin-progress\t2", "old-001\tin-progress\t0"]
+
+        assert run("file") == 1
+
+
+@pytest.mark.benchmark
+class TestAuditStateBenchmark:
+    """Benchmark: active-audit lookup with a long audit history."""
+
+    def test_thousands_of_audits(self, tmp_path: Path, capsys):
+        """Test and report lookup time against a registry of 5,000 audits."""
+        audits = []
+        for i in range(5000):
+            audit_id = f"audit-{i:04d}"
+            status = "in-progress" if i % 1000 == 0 else "completed"
+            audits.append({"id": audit_id, "name": f"Audit {i}", "status": status, "findingsCount": 3})
+            _write_manifest(tmp_path, audit_id, [
+                {"id": n, "file": f"src/module_{(i + n) % 300}.ts", "status": "injected" if status != "completed" else "removed"}
+                for n in range(1, 8)
+            ])
+        _write_registry(tmp_path, audits)
+        audits_dir = tmp_path / "docs" / "audits"
+        target = "src/module_3.ts"
+
+        def legacy() -> list[str]:
+            registry = json.loads((audits_dir / "registry.json").read_text())
+            found = []
+            for audit in registry["audits"]:
+                if audit["status"] != "in-progress":
+                    continue
+                manifest = json.loads((audits_dir / audit["id"] / "injections.json").read_text())
+                if any(inj["file"] == target for inj in manifest["injections"]):
+                    found.append(audit["id"])
+            return found
+
+        rounds = 50
+        start = time.perf_counter()
+        for _ in range(rounds):
+            expected = legacy()
+        legacy_ms = (time.perf_counter() - start) / rounds * 1000
+
+        start = time.perf_counter()
+        load_index(tmp_path)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            audit_state._loaded.clear()
+            assert load_active(tmp_path).audits_for_file(target) == expected
+        stored_ms = (time.perf_counter() - start) / rounds * 1000
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            assert load_active(tmp_path).audits_for_file(target) == expected
+        warm_ms = (time.perf_counter() - start) / rounds * 1000
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] 5000 audits: read+filter {legacy_ms:.2f} ms, first build {build_ms:.0f} ms, "
+                f"stored active view {stored_ms:.2f} ms, memoized {warm_ms:.3f} ms"
+            )
+
+        assert expected == ["audit-0000", "audit-3000"]
+        assert stored_ms < legacy_ms
+        assert warm_ms < legacy_ms
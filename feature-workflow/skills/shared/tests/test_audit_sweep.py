@@ -0,0 +1,146 @@
+"""Tests for the leftover audit-marker sweep."""
+
+import json
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import audit_sweep
+from audit_sweep import list_files, sweep, walk_files
+
+
+TRACKED = "print('[AUDIT:a:1]')  # AUDIT-INJECTED"
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Create a project with one tracked injection, one orphan and ignored files."""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "auth.py").write_text(f"def f():\n    {TRACKED}\n    return 1\n")
+    (tmp_path / "src" / "old.py").write_text("x = 1\nconsole.log('[AUDIT:b:2]', x); // AUDIT-INJECTED\n")
+    (tmp_path / "src" / "clean.py").write_text("x = 2\n")
+    (tmp_path / "build").mkdir()
+    (tmp_path / "build" / "out.js").write_text("console.log('[AUDIT:a:1]')\n")
+    (tmp_path / "blob.bin").write_bytes(b"\0\0[AUDIT:a:1]")
+    (tmp_path / ".gitignore").write_text("build/\n*.log\n")
+    (tmp_path / "debug.log").write_text("[AUDIT:a:1] captured\n")
+
+    manifest = tmp_path / "docs" / "audits" / "a" / "injections.json"
+    manifest.parent.mkdir(parents=True)
+    manifest.write_text(json.dumps({"auditId": "a", "injections": [
+        {"id": 1, "file": "src/auth.py", "line": 1, "injectedContent": TRACKED, "status": "injected"},
+    ]}))
+    return tmp_path
+
+
+class TestListFiles:
+    """Tests for candidate file listing."""
+
+    def test_walk_honours_gitignore(self, repo: Path):
+        """Test that the fallback walk skips ignored files and directories."""
+        files = sorted(walk_files(repo))
+        assert "build/out.js" not in files
+        assert "debug.log" not in files
+        assert "src/auth.py" in files
+
+    def test_negation_and_nested(self, tmp_path: Path):
+        """Test negated patterns and .gitignore files in subdirectories."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / ".gitignore").write_text("*.gen.py\n!keep.gen.py\n")
+        (tmp_path / "pkg" / ".gitignore").write_text("/local.py\n")
+        for name in ("a.gen.py", "keep.gen.py", "pkg/local.py", "pkg/ok.py"):
+            (tmp_path / name).write_text("")
+
+        assert sorted(walk_files(tmp_path)) == [".gitignore", "keep.gen.py", "pkg/.gitignore", "pkg/ok.py"]
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_git_listing(self, repo: Path):
+        """Test that git ls-files is used inside a checkout, untracked files included."""
+        subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+        files = list_files(repo)
+
+        assert "src/old.py" in files
+        assert "build/out.js" not in files
+
+
+class TestSweep:
+    """Tests for sweep classification."""
+
+    def test_tracked_and_orphaned(self, repo: Path):
+        """Test that hits are matched against injections.json."""
+        scanned, hits = sweep(repo, workers=2)
+
+        by_file = {hit.file: hit for hit in hits}
+        assert set(by_file) == {"src/auth.py", "src/old.py"}
+        assert by_file["src/auth.py"].status == "tracked"
+        assert by_file["src/auth.py"].injection_id == 1
+        assert by_file["src/old.py"].status == "orphaned"
+        assert (by_file["src/old.py"].audit_id, by_file["src/old.py"].sequence) == ("b", 2)
+        assert by_file["src/old.py"].line == 2
+
+    def test_dot_prefixed_manifest_path(self, repo: Path):
+        """Test that a manifest path written as ./src/auth.py still matches."""
+        manifest = repo / "docs" / "audits" / "a" / "injections.json"
+        data = json.loads(manifest.read_text())
+        data["injections"][0]["file"] = "./src/auth.py"
+        manifest.write_text(json.dumps(data))
+
+        _, hits = sweep(repo)
+        assert sorted((hit.file, hit.status) for hit in hits) == [
+            ("src/auth.py", "tracked"), ("src/old.py", "orphaned"),
+        ]
+
+    def test_removed_injection_is_orphaned(self, repo: Path):
+        """Test that a line whose manifest says removed is reported."""
+        manifest = repo / "docs" / "audits" / "a" / "injections.json"
+        data = json.loads(manifest.read_text())
+        data["injections"][0]["status"] = "removed"
+        manifest.write_text(json.dumps(data))
+
+        _, hits = sweep(repo)
+        assert {hit.status for hit in hits} == {"orphaned"}
+
+    def test_cli_exit_code(self, repo: Path, monkeypatch, capsys):
+        """Test that the CLI fails on orphans and passes once they are gone."""
+        monkeypatch.setattr(sys, "argv", ["audit_sweep.py", "--root", str(repo), "--json"])
+        assert audit_sweep.main() == 1
+        report = json.loads(capsys.readouterr().out)
+        assert [hit["file"] for hit in report["orphaned"]] == ["src/old.py"]
+
+        (repo / "src" / "old.py").write_text("x = 1\n")
+        assert audit_sweep.main() == 0
+
+
+@pytest.mark.benchmark
+class TestSweepBenchmark:
+    """Benchmark: sweep time over a large tree."""
+
+    COUNT = 20_000
+
+    def test_large_tree(self, tmp_path: Path, capsys):
+        """Test and report sweep time for 20k source files with a few markers."""
+        body = "".join(f"value_{i} = compute({i})\n" for i in range(100))
+        for d in range(self.COUNT // 500):
+            directory = tmp_path / f"pkg_{d:03d}"
+            directory.mkdir()
+            for f in range(500):
+                (directory / f"mod_{f:03d}.py").write_text(body)
+        (tmp_path / "pkg_000" / "mod_000.py").write_text(body + "print('[AUDIT:x:1]')\n")
+
+        start = time.perf_counter()
+        scanned, hits = sweep(tmp_path, workers=1)
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scanned, hits = sweep(tmp_path)
+        pooled = time.perf_counter() - start
+
+        with capsys.disabled():
+            print(f"\n[bench] {scanned} files: 1 worker {serial * 1000:.0f} ms, pool {pooled * 1000:.0f} ms")
+
+        assert scanned == self.COUNT
+        assert len(hits) == 1
@@ -0,0 +1,99 @@
+"""Tests for debounced, coalescing dashboard regeneration."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from coalesce import DEBOUNCE_ENV_VAR, DIRTY_FILENAME, coalesce, get_debounce_window
+
+
+class TestGetDebounceWindow:
+    """Tests for get_debounce_window."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that coalescing is off unless configured."""
+        monkeypatch.delenv(DEBOUNCE_ENV_VAR, raising=False)
+        assert get_debounce_window() == 0.0
+
+    def test_milliseconds(self, monkeypatch):
+        """Test that the window is read in milliseconds."""
+        monkeypatch.setenv(DEBOUNCE_ENV_VAR, "250")
+        assert get_debounce_window() == 0.25
+
+    def test_invalid_value(self, monkeypatch):
+        """Test that garbage disables coalescing."""
+        monkeypatch.setenv(DEBOUNCE_ENV_VAR, "soon")
+        assert get_debounce_window() == 0.0
+
+
+class TestCoalesce:
+    """Tests for coalesce."""
+
+    def test_single_writer_regenerates(self, temp_project: Path):
+        """Test that a lone writer does the work and clears the marker."""
+        features_dir = temp_project / "docs" / "features"
+        calls: list[set[str]] = []
+
+        assert coalesce(features_dir, "feature-a", 0.01, calls.append) is True
+        assert calls == [{"feature-a"}]
+        assert not (features_dir / DIRTY_FILENAME).exists()
+
+    def test_burst_regenerates_once(self, temp_project: Path):
+        """Test that concurrent writers in one window merge into one regeneration."""
+        features_dir = temp_project / "docs" / "features"
+        calls: list[set[str]] = []
+        results: list[bool] = []
+        start = threading.Barrier(3)
+
+        def writer(feature_id: str) -> None:
+            start.wait()
+            results.append(coalesce(features_dir, feature_id, 0.2, calls.append))
+
+        threads = [threading.Thread(target=writer, args=(f,)) for f in ("a", "b", "c")]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sorted(results) == [False, False, True]
+        assert calls == [{"a", "b", "c"}]
+
+    def test_sequential_writers_each_regenerate(self, temp_project: Path):
+        """Test that writes outside each other's window are not merged."""
+        features_dir = temp_project / "docs" / "features"
+        calls: list[set[str]] = []
+
+        coalesce(features_dir, "a", 0.01, calls.append)
+        coalesce(features_dir, "b", 0.01, calls.append)
+
+        assert calls == [{"a"}, {"b"}]
+
+    def test_failed_regeneration_keeps_marker(self, temp_project: Path):
+        """Test that features survive a failed regeneration for the next writer."""
+        features_dir = temp_project / "docs" / "features"
+        calls: list[set[str]] = []
+
+        def fail(feature_ids: set[str]) -> None:
+            raise RuntimeError("disk full")
+
+        with pytest.raises(RuntimeError):
+            coalesce(features_dir, "a", 0.01, fail)
+        assert (features_dir / DIRTY_FILENAME).exists()
+
+        assert coalesce(features_dir, "b", 0.01, calls.append) is True
+        assert calls == [{"a", "b"}]
+        assert not (features_dir / DIRTY_FILENAME).exists()
+
+
+class TestHookCoalescing:
+    """Tests for the PostToolUse hook with coalescing enabled."""
+
+    def test_hook_regenerates_with_debounce(self, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that the in-process hook path still writes the dashboard."""
+        hook = load_hook("post_tool_use")
+        monkeypatch.setenv(DEBOUNCE_ENV_VAR, "10")
+        project_root = feature_in_backlog.parent.parent.parent
+
+        assert hook.regenerate_in_process(hook.get_plugin_root(), str(project_root), "test-feature")
+        assert "test-feature" in (project_root / "docs" / "features" / "DASHBOARD.md").read_text()
@@ -0,0 +1,126 @@
+"""Tests for the dashboard daemon and its socket client."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import daemon
+from daemon_client import get_socket_path, send_request
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    """Poll predicate until it returns truthy or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture
+def running_daemon():
+    """Run a daemon on the per-test socket and stop it afterwards."""
+    socket_path = get_socket_path()
+    thread = threading.Thread(target=daemon.serve, args=(socket_path, 0.05), daemon=True)
+    thread.start()
+    assert _wait_for(lambda: send_request({"op": "ping"}) is not None)
+
+    yield socket_path
+
+    send_request({"op": "shutdown"})
+    thread.join(timeout=5)
+
+
+class TestDaemonClient:
+    """Tests for daemon_client without a running daemon."""
+
+    def test_no_daemon_returns_none(self):
+        """Test that requests fail fast when nothing is listening."""
+        assert send_request({"op": "ping"}) is None
+
+    def test_stale_socket_returns_none(self):
+        """Test that a leftover socket file is treated as no daemon."""
+        get_socket_path().write_text("")
+        assert send_request({"op": "ping"}) is None
+
+
+class TestDashboardDaemon:
+    """Tests for the daemon request protocol."""
+
+    def test_changed_renders_dashboard(self, running_daemon, feature_in_backlog: Path):
+        """Test that a changed message regenerates DASHBOARD.md."""
+        project_root = feature_in_backlog.parent.parent.parent
+        response = send_request({
+            "op": "changed",
+            "project_root": str(project_root),
+            "feature_id": "test-feature",
+        })
+
+        assert response == {"ok": True, "features": 1}
+        content = (project_root / "docs" / "features" / "DASHBOARD.md").read_text()
+        assert "test-feature" in content
+
+    def test_changed_updates_in_memory_state(self, running_daemon, feature_in_backlog: Path):
+        """Test that a status change reported by the hook reaches the dashboard."""
+        project_root = feature_in_backlog.parent.parent.parent
+        send_request({"op": "render", "project_root": str(project_root)})
+
+        (feature_in_backlog / "plan.md").write_text("---\nstarted: 2024-01-20\n---\n")
+        send_request({"op": "changed", "project_root": str(project_root), "feature_id": "test-feature"})
+
+        content = (project_root / "docs" / "features" / "DASHBOARD.md").read_text()
+        assert "*No features in backlog*" in content
+        assert "2024-01-20" in content
+
+    def test_ping_lists_projects(self, running_daemon, temp_project: Path):
+        """Test that ping reports the projects the daemon has loaded."""
+        send_request({"op": "render", "project_root": str(temp_project)})
+
+        response = send_request({"op": "ping"})
+        assert response["ok"] is True
+        assert str(temp_project.resolve()) in response["projects"]
+
+    def test_watcher_picks_up_external_changes(self, running_daemon, multiple_features: Path):
+        """Test that edits made outside the hooks are rendered by the watcher."""
+        features_dir = multiple_features / "docs" / "features"
+        send_request({"op": "render", "project_root": str(multiple_features)})
+
+        new_dir = features_dir / "pulled-feature"
+        new_dir.mkdir()
+        (new_dir / "idea.md").write_text("---\nname: Pulled Feature\n---\n")
+
+        dashboard = features_dir / "DASHBOARD.md"
+        assert _wait_for(lambda: "pulled-feature" in dashboard.read_text())
+
+    def test_rejects_unknown_op(self, running_daemon):
+        """Test that unknown operations return an error response."""
+        response = send_request({"op": "bogus"})
+        assert response["ok"] is False
+        assert "unknown op" in response["error"]
+
+    def test_rejects_missing_project(self, running_daemon, tmp_path: Path):
+        """Test that a non-directory project root is rejected."""
+        response = send_request({"op": "render", "project_root": str(tmp_path / "missing")})
+        assert response["ok"] is False
+
+    def test_shutdown_removes_socket(self, running_daemon):
+        """Test that shutdown stops the server and cleans up the socket."""
+        send_request({"op": "shutdown"})
+        assert _wait_for(lambda: not running_daemon.exists())
+
+
+class TestHookUsesDaemon:
+    """Tests for the PostToolUse hook's daemon client path."""
+
+    def test_post_hook_notifies_daemon(self, running_daemon, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that the hook hands the change to the daemon instead of regenerating."""
+        hook = load_hook("post_tool_use")
+        monkeypatch.setattr(hook, "regenerate_in_process", lambda *args: pytest.fail("regenerated locally"))
+
+        project_root = feature_in_backlog.parent.parent.parent
+        assert hook.notify_daemon(hook.get_plugin_root(), str(project_root), "test-feature")
+        assert (project_root / "docs" / "features" / "DASHBOARD.md").exists()
+        assert (project_root / "docs" / "features" / ".search-index.json").exists()
@@ -1,5 +1,7 @@
 """Tests for dashboard generation."""
 
+import time
+import tracemalloc
 from pathlib import Path
 
 import pytest
@@ -11,6 +13,16 @@ if str(LIB_DIR) not in sys.path:
     sys.path.insert(0, str(LIB_DIR))
 
 from run_dashboard import generate_dashboard
+from dashboard import (
+    DEFAULT_SECTIONS,
+    Column,
+    DashboardData,
+    Section,
+    iter_dashboard,
+    render_dashboard,
+)
+from dashboard_writer import write_lines_if_changed
+from models import CompactFeature, FeatureContext, FeatureStatus
 
 
 class TestGenerateDashboard:
@@ -152,3 +164,201 @@ priority: P1
 
         assert "valid-feature" in content
         assert "random-dir" not in content
+
+    def test_unchanged_dashboard_not_rewritten(self, multiple_features: Path):
+        """Test that regenerating without feature changes leaves the file alone."""
+        generate_dashboard(multiple_features)
+        dashboard_path = multiple_features / "docs" / "features" / "DASHBOARD.md"
+        before = dashboard_path.read_text()
+        mtime = dashboard_path.stat().st_mtime_ns
+
+        generate_dashboard(multiple_features)
+
+        assert dashboard_path.read_text() == before
+        assert dashboard_path.stat().st_mtime_ns == mtime
+
+    def test_changed_feature_rewrites_dashboard(self, multiple_features: Path):
+        """Test that a feature change still regenerates the dashboard."""
+        generate_dashboard(multiple_features)
+        features_dir = multiple_features / "docs" / "features"
+        (features_dir / "backlog-feature" / "plan.md").write_text("---\nstarted: 2024-02-01\n---\n")
+
+        generate_dashboard(multiple_features)
+
+        content = (features_dir / "DASHBOARD.md").read_text()
+        assert "2024-02-01" in content
+
+
+def _feature(feature_id: str, status: FeatureStatus, depends_on=None) -> FeatureContext:
+    """Build an in-memory FeatureContext for renderer tests."""
+    return FeatureContext(
+        feature_id=feature_id,
+        feature_dir=Path(feature_id),
+        status=status,
+        name=feature_id.title(),
+        depends_on=list(depends_on or []),
+    )
+
+
+class TestDashboardData:
+    """Tests for the shared render data."""
+
+    def test_unmet_dependencies(self):
+        """Test blocked status against completed, open and unknown dependencies."""
+        data = DashboardData([
+            _feature("a", FeatureStatus.COMPLETED),
+            _feature("b", FeatureStatus.IN_PROGRESS),
+            _feature("c", FeatureStatus.BACKLOG, depends_on=["a", "b", "ghost"]),
+        ])
+
+        assert data.unmet_dependencies["c"] == ["b", "ghost"]
+        assert data.unmet_dependencies["a"] == []
+
+    def test_matches_has_unmet_dependencies(self):
+        """Test that the single-pass map agrees with the per-feature check."""
+        features = [
+            _feature("a", FeatureStatus.COMPLETED),
+            _feature("b", FeatureStatus.BACKLOG, depends_on=["a", "c"]),
+            _feature("c", FeatureStatus.BACKLOG, depends_on=["b"]),
+        ]
+        data = DashboardData(features)
+
+        for ctx in features:
+            assert data.unmet_dependencies[ctx.feature_id] == ctx.has_unmet_dependencies(data.all_features)
+
+    def test_blocked_by_declared_on_prerequisite(self):
+        """Test that a blockedBy entry on the prerequisite also blocks the dependent."""
+        prerequisite = _feature("a", FeatureStatus.BACKLOG)
+        prerequisite.blocked_by = ["b"]
+        data = DashboardData([prerequisite, _feature("b", FeatureStatus.BACKLOG)])
+
+        assert data.unmet_dependencies["b"] == ["a"]
+        assert data.graph.ready_queue() == ["a"]
+
+
+class TestRenderDashboard:
+    """Tests for the section/column renderer."""
+
+    def test_blocked_by_column(self):
+        """Test that the backlog table shows unmet dependencies."""
+        content = render_dashboard(DashboardData([
+            _feature("a", FeatureStatus.IN_PROGRESS),
+            _feature("b", FeatureStatus.BACKLOG, depends_on=["a"]),
+        ]))
+
+        assert "| ID | Name | Priority | Effort | Added | Blocked By |" in content
+        assert "| [b](./b/) | B |  |  |  | a |" in content
+
+    def test_custom_sections(self):
+        """Test that callers can plug in their own columns and sections."""
+        sections = (
+            Section(
+                "Shipped",
+                FeatureStatus.COMPLETED,
+                "*Nothing shipped*",
+                (Column("Feature", lambda ctx, data: ctx.feature_id),),
+            ),
+        )
+        content = render_dashboard(DashboardData([_feature("a", FeatureStatus.COMPLETED)]), sections)
+
+        assert "## Shipped" in content
+        assert "| Feature |" in content
+        assert "|---------|" in content
+        assert "## Backlog" not in content
+
+    def test_default_sections_order(self):
+        """Test the default layout order."""
+        assert [s.title for s in DEFAULT_SECTIONS] == ["In Progress", "Backlog", "Completed"]
+
+    def test_compact_features_render_identically(self):
+        """Test that CompactFeature works wherever FeatureContext does."""
+        features = [
+            _feature("a", FeatureStatus.COMPLETED),
+            _feature("b", FeatureStatus.BACKLOG, depends_on=["a", "c"]),
+            _feature("c", FeatureStatus.IN_PROGRESS),
+        ]
+        compact = [CompactFeature.from_context(ctx) for ctx in features]
+
+        def without_timestamp(text: str) -> list[str]:
+            return [line for line in text.splitlines() if not line.startswith("*Last updated")]
+
+        assert without_timestamp(render_dashboard(DashboardData(compact))) == without_timestamp(
+            render_dashboard(DashboardData(features))
+        )
+
+
+    def test_iter_dashboard_matches_render(self):
+        """Test that the streamed lines join to the rendered document."""
+        data = DashboardData([
+            _feature("a", FeatureStatus.COMPLETED),
+            _feature("b", FeatureStatus.BACKLOG, depends_on=["a"]),
+        ])
+        lines = list(iter_dashboard(data))
+
+        assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+        assert "".join(lines).splitlines()[4:] == render_dashboard(data).splitlines()[4:]
+
+
+class TestEntryPointParity:
+    """Tests that all dashboard entry points share one renderer."""
+
+    def test_package_and_script_output_match(self, multiple_features: Path):
+        """Test that lib.generate_dashboard and run_dashboard produce the same tables."""
+        import importlib
+        shared_dir = str(LIB_DIR.parent)
+        if shared_dir not in sys.path:
+            sys.path.insert(0, shared_dir)
+        lib = importlib.import_module("lib")
+
+        dashboard_path = multiple_features / "docs" / "features" / "DASHBOARD.md"
+        generate_dashboard(multiple_features, force=True)
+        script_output = dashboard_path.read_text().splitlines()[4:]
+
+        lib.generate_dashboard(multiple_features, force=True)
+        package_output = dashboard_path.read_text().splitlines()[4:]
+
+        assert package_output == script_output
+
+
+@pytest.mark.benchmark
+class TestStreamingBenchmark:
+    """Benchmark: peak memory of string vs streamed dashboard writes."""
+
+    COUNT = 50_000
+
+    def test_streaming_peak_memory(self, temp_project: Path, capsys):
+        """Test and report peak traced memory writing a 50k-feature dashboard."""
+        features = [
+            _feature(f"feature-{i:05d}", (FeatureStatus.COMPLETED, FeatureStatus.BACKLOG)[i % 2])
+            for i in range(self.COUNT)
+        ]
+        data = DashboardData(features)
+        path = temp_project / "docs" / "features" / "DASHBOARD.md"
+
+        def peak(write) -> tuple[int, float]:
+            path.unlink(missing_ok=True)
+            tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                write()
+                _, peak_bytes = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return peak_bytes, time.perf_counter() - start
+
+        string_peak, string_time = peak(
+            lambda: path.write_text(render_dashboard(data), encoding="utf-8")
+        )
+        stream_peak, stream_time = peak(
+            lambda: write_lines_if_changed(path, lambda: iter_dashboard(data), force=True)
+        )
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] {self.COUNT} features: join+write_text peak {string_peak / 2**20:.1f} MiB "
+                f"({string_time * 1000:.0f} ms), streamed peak {stream_peak / 2**20:.1f} MiB "
+                f"({stream_time * 1000:.0f} ms)"
+            )
+
+        assert "feature-49999" in path.read_text()
+        assert stream_peak < string_peak / 4
@@ -0,0 +1,163 @@
+"""Tests for skip-if-unchanged dashboard writes."""
+
+import io
+from pathlib import Path
+
+import pytest
+
+from dashboard_writer import (
+    content_hash,
+    hash_lines,
+    read_stored_hash,
+    stamp_hash,
+    stamp_lines,
+    write_if_changed,
+    write_lines_if_changed,
+)
+
+
+CONTENT = """# Feature Dashboard
+
+*Auto-generated by hooks. Do not edit directly.*
+*Last updated: 2024-01-25 14:30:00*
+
+## In Progress
+*No features in progress*
+"""
+
+
+class TestContentHash:
+    """Tests for content_hash."""
+
+    def test_ignores_timestamp(self):
+        """Test that only the timestamp differing gives the same hash."""
+        later = CONTENT.replace("2024-01-25 14:30:00", "2024-02-01 09:00:00")
+        assert content_hash(CONTENT) == content_hash(later)
+
+    def test_detects_body_change(self):
+        """Test that a body change gives a different hash."""
+        changed = CONTENT.replace("*No features in progress*", "| a | b |")
+        assert content_hash(CONTENT) != content_hash(changed)
+
+
+class TestStampHash:
+    """Tests for stamp_hash/read_stored_hash."""
+
+    def test_stamp_after_timestamp(self, tmp_path: Path):
+        """Test that the stamp is placed after the timestamp and read back."""
+        digest = content_hash(CONTENT)
+        stamped = stamp_hash(CONTENT, digest)
+
+        lines = stamped.splitlines()
+        assert lines[3].startswith("*Last updated:")
+        assert lines[4] == f"<!-- content-hash: {digest} -->"
+
+        path = tmp_path / "DASHBOARD.md"
+        path.write_text(stamped)
+        assert read_stored_hash(path) == digest
+
+    def test_missing_file(self, tmp_path: Path):
+        """Test that a missing dashboard has no stored hash."""
+        assert read_stored_hash(tmp_path / "DASHBOARD.md") is None
+
+
+class TestWriteIfChanged:
+    """Tests for write_if_changed."""
+
+    def test_first_write(self, tmp_path: Path):
+        """Test that a new dashboard is written."""
+        path = tmp_path / "DASHBOARD.md"
+        assert write_if_changed(path, CONTENT) is True
+        assert path.exists()
+
+    def test_skips_unchanged(self, tmp_path: Path):
+        """Test that a timestamp-only change does not rewrite the file."""
+        path = tmp_path / "DASHBOARD.md"
+        write_if_changed(path, CONTENT)
+        before = path.read_text()
+
+        later = CONTENT.replace("2024-01-25 14:30:00", "2024-02-01 09:00:00")
+        assert write_if_changed(path, later) is False
+        assert path.read_text() == before
+
+    def test_writes_changed(self, tmp_path: Path):
+        """Test that a body change rewrites the file with the new timestamp."""
+        path = tmp_path / "DASHBOARD.md"
+        write_if_changed(path, CONTENT)
+
+        changed = CONTENT.replace("14:30:00", "15:00:00").replace("*No features in progress*", "| a |")
+        assert write_if_changed(path, changed) is True
+        assert "15:00:00" in path.read_text()
+
+    def test_force(self, tmp_path: Path):
+        """Test that force rewrites an unchanged dashboard."""
+        path = tmp_path / "DASHBOARD.md"
+        write_if_changed(path, CONTENT)
+        assert write_if_changed(path, CONTENT, force=True) is True
+
+
+class TestWriteLinesIfChanged:
+    """Tests for the streaming write path."""
+
+    def test_matches_string_path(self, tmp_path: Path):
+        """Test that streaming writes the same bytes as stamping the whole string."""
+        path = tmp_path / "DASHBOARD.md"
+        assert write_lines_if_changed(path, lambda: io.StringIO(CONTENT)) is True
+
+        assert path.read_text() == stamp_hash(CONTENT, content_hash(CONTENT))
+        assert hash_lines(io.StringIO(CONTENT)) == content_hash(CONTENT)
+
+    def test_skips_unchanged(self, tmp_path: Path):
+        """Test that an unchanged stream is hashed once and never written."""
+        path = tmp_path / "DASHBOARD.md"
+        write_if_changed(path, CONTENT)
+        calls = []
+
+        def render():
+            calls.append(1)
+            return io.StringIO(CONTENT.replace("14:30:00", "15:00:00"))
+
+        assert write_lines_if_changed(path, render) is False
+        assert len(calls) == 1
+        assert "14:30:00" in path.read_text()
+
+    def test_no_temp_file_left(self, tmp_path: Path):
+        """Test that the temp file is renamed over the dashboard."""
+        path = tmp_path / "DASHBOARD.md"
+        write_if_changed(path, CONTENT)
+        write_if_changed(path, CONTENT.replace("*No features in progress*", "| a |"))
+
+        assert [p.name for p in tmp_path.iterdir()] == ["DASHBOARD.md"]
+
+    def test_mode_preserved(self, tmp_path: Path):
+        """Test that rewriting the dashboard keeps its file mode."""
+        path = tmp_path / "DASHBOARD.md"
+        write_if_changed(path, CONTENT)
+        path.chmod(0o640)
+
+        assert write_if_changed(path, CONTENT.replace("*No features in progress*", "| a |")) is True
+        assert path.stat().st_mode & 0o7777 == 0o640
+
+    def test_failed_render_keeps_old_file(self, tmp_path: Path):
+        """Test that an error mid-stream leaves the old dashboard intact."""
+        path = tmp_path / "DASHBOARD.md"
+        write_if_changed(path, CONTENT)
+        before = path.read_text()
+        calls = []
+
+        def render():
+            calls.append(1)
+            yield "# Feature Dashboard\n"
+            if len(calls) > 1:
+                raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            write_lines_if_changed(path, render)
+
+        assert path.read_text() == before
+        assert [p.name for p in tmp_path.iterdir()] == ["DASHBOARD.md"]
+
+    def test_stamp_leads_without_timestamp(self):
+        """Test that the stamp comes first when the header has no timestamp."""
+        lines = list(stamp_lines(["# Title\n", "body\n"], "0" * 64))
+        assert lines == [f"<!-- content-hash: {'0' * 64} -->\n", "# Title\n", "body\n"]
@@ -0,0 +1,235 @@
+"""Tests for the persistent feature-state cache."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+import feature_cache
+from feature_cache import CACHE_FILENAME, LOCAL_FILES, load_features
+from models import FeatureContext, FeatureStatus
+
+
+@pytest.fixture
+def parse_counter(monkeypatch):
+    """Count feature parses (FeatureContext.from_entries) made by the cache."""
+    calls: list[str] = []
+    original = FeatureContext.from_entries.__func__
+
+    def counting(cls, feature_dir, names):
+        calls.append(feature_dir.name)
+        return original(cls, feature_dir, names)
+
+    monkeypatch.setattr(feature_cache.FeatureContext, "from_entries", classmethod(counting))
+    return calls
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward so its stat signature changes."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestLoadFeatures:
+    """Tests for load_features."""
+
+    def test_writes_cache_file(self, multiple_features: Path):
+        """Test that the first scan writes a cache with all features."""
+        features_dir = multiple_features / "docs" / "features"
+        features = load_features(features_dir)
+
+        assert [f.feature_id for f in features] == [
+            "backlog-feature", "done-feature", "progress-feature",
+        ]
+        data = json.loads((features_dir / CACHE_FILENAME).read_text())
+        assert set(data["features"]) == {"backlog-feature", "done-feature", "progress-feature"}
+        assert data["features"]["done-feature"]["context"]["status"] == "completed"
+
+    def test_gitignore_completed(self, multiple_features: Path):
+        """Test that writing the cache adds missing machine-local entries to .gitignore."""
+        features_dir = multiple_features / "docs" / "features"
+        gitignore = features_dir / ".gitignore"
+        gitignore.write_text("notes/\n/.dashboard.lock")
+
+        load_features(features_dir)
+        lines = gitignore.read_text().splitlines()
+        assert lines[:2] == ["notes/", "/.dashboard.lock"]
+        assert sorted(lines[2:]) == sorted(set(LOCAL_FILES) - {".dashboard.lock"})
+
+        before = gitignore.read_text()
+        (features_dir / CACHE_FILENAME).unlink()
+        load_features(features_dir)
+        assert gitignore.read_text() == before
+
+    def test_unchanged_features_not_reparsed(self, multiple_features: Path, parse_counter):
+        """Test that a second scan reuses cached records."""
+        features_dir = multiple_features / "docs" / "features"
+        first = load_features(features_dir)
+        parse_counter.clear()
+
+        second = load_features(features_dir)
+
+        assert parse_counter == []
+        assert second == first
+
+    def test_changed_signature_reparsed(self, multiple_features: Path, parse_counter):
+        """Test that a modified file triggers a re-parse of that feature only."""
+        features_dir = multiple_features / "docs" / "features"
+        load_features(features_dir)
+        parse_counter.clear()
+
+        idea = features_dir / "backlog-feature" / "idea.md"
+        idea.write_text(idea.read_text().replace("Backlog Feature", "Renamed Feature", 1))
+        _bump_mtime(idea)
+
+        features = {f.feature_id: f for f in load_features(features_dir)}
+        assert parse_counter == ["backlog-feature"]
+        assert features["backlog-feature"].name == "Renamed Feature"
+
+    def test_status_change_detected(self, multiple_features: Path):
+        """Test that adding shipped.md moves a feature to completed."""
+        features_dir = multiple_features / "docs" / "features"
+        load_features(features_dir)
+
+        (features_dir / "progress-feature" / "shipped.md").write_text("---\nshipped: 2024-02-01\n---\n")
+
+        features = {f.feature_id: f for f in load_features(features_dir)}
+        assert features["progress-feature"].status == FeatureStatus.COMPLETED
+
+    def test_changed_feature_still_validates_others(self, multiple_features: Path, parse_counter):
+        """Test that features other than the named one are still checked by signature."""
+        features_dir = multiple_features / "docs" / "features"
+        load_features(features_dir)
+        parse_counter.clear()
+
+        # Modify one feature, but report another as the changed one
+        idea = features_dir / "done-feature" / "idea.md"
+        idea.write_text(idea.read_text() + "\nMore notes.\n")
+        _bump_mtime(idea)
+
+        load_features(features_dir, changed_feature="backlog-feature")
+        assert sorted(parse_counter) == ["backlog-feature", "done-feature"]
+
+    def test_stale_cache_from_concurrent_run_repaired(self, multiple_features: Path):
+        """Test that an old record written back by a racing run is not trusted.
+
+        Two hook runs read the same cache; the run for another feature writes
+        last and restores the old record of the feature that gained plan.md.
+        """
+        features_dir = multiple_features / "docs" / "features"
+        load_features(features_dir)
+        stale = (features_dir / CACHE_FILENAME).read_text()
+
+        (features_dir / "backlog-feature" / "plan.md").write_text("---\nstarted: 2024-03-01\n---\n")
+        load_features(features_dir, changed_feature="backlog-feature")
+        (features_dir / CACHE_FILENAME).write_text(stale)
+
+        features = {f.feature_id: f for f in load_features(features_dir, changed_feature="done-feature")}
+        assert features["backlog-feature"].status == FeatureStatus.IN_PROGRESS
+
+    def test_new_feature_picked_up_with_changed_feature(self, multiple_features: Path):
+        """Test that uncached directories are parsed even when trusting the cache."""
+        features_dir = multiple_features / "docs" / "features"
+        load_features(features_dir)
+
+        new_dir = features_dir / "new-feature"
+        new_dir.mkdir()
+        (new_dir / "idea.md").write_text("---\nname: New Feature\n---\n")
+
+        features = load_features(features_dir, changed_feature="backlog-feature")
+        assert "new-feature" in [f.feature_id for f in features]
+
+    def test_removed_feature_dropped(self, multiple_features: Path):
+        """Test that deleted feature directories leave the cache."""
+        features_dir = multiple_features / "docs" / "features"
+        load_features(features_dir)
+
+        backlog_dir = features_dir / "backlog-feature"
+        (backlog_dir / "idea.md").unlink()
+        backlog_dir.rmdir()
+
+        features = load_features(features_dir)
+        assert "backlog-feature" not in [f.feature_id for f in features]
+        data = json.loads((features_dir / CACHE_FILENAME).read_text())
+        assert "backlog-feature" not in data["features"]
+
+    def test_corrupt_cache_ignored(self, multiple_features: Path):
+        """Test that an unreadable cache falls back to a full scan."""
+        features_dir = multiple_features / "docs" / "features"
+        (features_dir / CACHE_FILENAME).write_text("{not json")
+
+        features = load_features(features_dir)
+        assert len(features) == 3
+
+    def test_use_cache_false(self, multiple_features: Path):
+        """Test that use_cache=False neither reads nor writes the cache."""
+        features_dir = multiple_features / "docs" / "features"
+        features = load_features(features_dir, use_cache=False)
+
+        assert len(features) == 3
+        assert not (features_dir / CACHE_FILENAME).exists()
+
+
+class TestContextSerialization:
+    """Tests for FeatureContext.to_dict/from_dict round-trips."""
+
+    def test_round_trip(self, feature_completed: Path):
+        """Test that a parsed context survives serialization."""
+        ctx = FeatureContext.from_directory(feature_completed)
+        restored = FeatureContext.from_dict(ctx.to_dict(), feature_completed)
+        assert restored == ctx
+
+
+class TestParallelScan:
+    """Tests for thread-pool scanning."""
+
+    def test_parallel_matches_sequential(self, make_features, tmp_path: Path):
+        """Test that a pooled scan returns the same sorted result."""
+        features_dir = make_features(tmp_path, 50) / "docs" / "features"
+
+        sequential = load_features(features_dir, use_cache=False, workers=1)
+        parallel = load_features(features_dir, use_cache=False, workers=8)
+
+        assert parallel == sequential
+        assert [f.feature_id for f in parallel] == sorted(f.feature_id for f in parallel)
+
+    def test_parallel_with_cache(self, make_features, tmp_path: Path):
+        """Test that pooled validation reuses the cache like the sequential path."""
+        features_dir = make_features(tmp_path, 20) / "docs" / "features"
+        first = load_features(features_dir, workers=4)
+        assert load_features(features_dir, workers=4) == first
+
+    def test_workers_from_environment(self, monkeypatch):
+        """Test that the default worker count comes from the environment."""
+        monkeypatch.setenv(feature_cache.WORKERS_ENV_VAR, "6")
+        assert feature_cache.get_scan_workers() == 6
+        monkeypatch.setenv(feature_cache.WORKERS_ENV_VAR, "zero")
+        assert feature_cache.get_scan_workers() == 1
+
+
+@pytest.mark.benchmark
+class TestScanBenchmark:
+    """Benchmark: sequential vs pooled cold scans over synthetic trees."""
+
+    @pytest.mark.parametrize("count", [100, 1_000, 10_000])
+    def test_scan_scaling(self, make_features, tmp_path: Path, capsys, count: int):
+        """Test and report cold-scan time for sequential and pooled scans."""
+        features_dir = make_features(tmp_path, count) / "docs" / "features"
+
+        timings = {}
+        results = {}
+        for workers in (1, 8):
+            start = time.perf_counter()
+            results[workers] = load_features(features_dir, use_cache=False, workers=workers)
+            timings[workers] = time.perf_counter() - start
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] cold scan of {count} features: "
+                f"sequential {timings[1] * 1000:.1f} ms, 8 workers {timings[8] * 1000:.1f} ms"
+            )
+
+        assert len(results[1]) == count
+        assert results[8] == results[1]
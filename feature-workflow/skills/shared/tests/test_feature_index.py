@@ -0,0 +1,102 @@
+"""Tests for the machine-readable feature index (docs/features/index.json)."""
+
+import json
+import os
+from pathlib import Path
+
+from dashboard import generate_dashboard, write_dashboard
+from feature_index import INDEX_FILENAME, build_index, read_index, write_index
+from models import FeatureContext
+
+
+class TestGenerateIndex:
+    """Tests for index.json written by dashboard generation."""
+
+    def test_index_written_with_dashboard(self, multiple_features: Path):
+        """Test that generation writes index.json with every feature."""
+        features_dir = multiple_features / "docs" / "features"
+        generate_dashboard(multiple_features)
+
+        index = json.loads((features_dir / INDEX_FILENAME).read_text())
+        assert index["counts"] == {"backlog": 1, "in_progress": 1, "completed": 1}
+        assert [f["id"] for f in index["features"]] == [
+            "backlog-feature", "done-feature", "progress-feature",
+        ]
+
+    def test_records_have_context_fields(self, multiple_features: Path):
+        """Test that each record carries every FeatureContext field and mtimes."""
+        features_dir = multiple_features / "docs" / "features"
+        generate_dashboard(multiple_features)
+
+        records = {f["id"]: f for f in read_index(features_dir)["features"]}
+        done = records["done-feature"]
+        ctx = FeatureContext.from_directory(features_dir / "done-feature")
+
+        for key, value in ctx.to_dict().items():
+            assert done[key] == value
+        assert done["unmetDependencies"] == []
+        assert set(done["mtimes"]) == {"idea.md", "plan.md", "shipped.md"}
+        assert done["mtimes"]["idea.md"] == (features_dir / "done-feature" / "idea.md").stat().st_mtime_ns / 1e9
+        assert set(records["backlog-feature"]["mtimes"]) == {"idea.md"}
+
+    def test_unmet_dependencies(self, temp_project: Path):
+        """Test that dependencies not yet completed are listed."""
+        features_dir = temp_project / "docs" / "features"
+        for feature_id, body in (("auth", "name: Auth"), ("sso", "name: SSO\ndependsOn: [auth]")):
+            (features_dir / feature_id).mkdir()
+            (features_dir / feature_id / "idea.md").write_text(f"---\n{body}\n---\n")
+
+        generate_dashboard(temp_project)
+
+        records = {f["id"]: f for f in read_index(features_dir)["features"]}
+        assert records["sso"]["dependsOn"] == ["auth"]
+        assert records["sso"]["unmetDependencies"] == ["auth"]
+
+    def test_index_updated_when_only_mtime_changes(self, multiple_features: Path):
+        """Test that a body edit updates mtimes even if DASHBOARD.md is unchanged."""
+        features_dir = multiple_features / "docs" / "features"
+        generate_dashboard(multiple_features)
+
+        idea = features_dir / "backlog-feature" / "idea.md"
+        idea.write_text(idea.read_text() + "\nMore notes.\n")
+        st = idea.stat()
+        os.utime(idea, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        generate_dashboard(multiple_features, feature_id="backlog-feature")
+
+        records = {f["id"]: f for f in read_index(features_dir)["features"]}
+        assert records["backlog-feature"]["mtimes"]["idea.md"] == idea.stat().st_mtime_ns / 1e9
+
+    def test_write_dashboard_without_entries(self, multiple_features: Path):
+        """Test that mtimes are stat'ed directly when no cache entries are given."""
+        features_dir = multiple_features / "docs" / "features"
+        features = [
+            FeatureContext.from_directory(features_dir / name)
+            for name in ("backlog-feature", "done-feature", "progress-feature")
+        ]
+        write_dashboard(multiple_features, features)
+
+        records = {f["id"]: f for f in read_index(features_dir)["features"]}
+        assert set(records["progress-feature"]["mtimes"]) == {"idea.md", "plan.md"}
+
+
+class TestWriteIndex:
+    """Tests for write_index and read_index."""
+
+    def test_unchanged_index_not_rewritten(self, tmp_path: Path):
+        """Test that identical content skips the write."""
+        index = build_index([], {})
+        assert write_index(tmp_path, index) is True
+        assert write_index(tmp_path, index) is False
+
+    def test_no_temp_files_left(self, tmp_path: Path):
+        """Test that the atomic write leaves only index.json behind."""
+        write_index(tmp_path, build_index([], {}))
+        assert [p.name for p in tmp_path.iterdir()] == [INDEX_FILENAME]
+
+    def test_read_missing_or_corrupt(self, tmp_path: Path):
+        """Test that unreadable or stale indexes read as None."""
+        assert read_index(tmp_path) is None
+        (tmp_path / INDEX_FILENAME).write_text("{not json")
+        assert read_index(tmp_path) is None
+        (tmp_path / INDEX_FILENAME).write_text('{"version": 0}')
+        assert read_index(tmp_path) is None
@@ -48,6 +48,26 @@ name: Test
         result = parse_frontmatter_string(content)
         assert result == {}
 
+    def test_leading_blank_lines(self):
+        """Test that blank lines before the opening delimiter are allowed."""
+        content = """
+
+---
+name: Test
+---
+"""
+        assert parse_frontmatter_string(content) == {"name": "Test"}
+
+    def test_delimiters_after_content_ignored(self):
+        """Test that '---' rules later in the document are not frontmatter."""
+        content = """# Heading
+
+---
+name: Not Frontmatter
+---
+"""
+        assert parse_frontmatter_string(content) == {}
+
     def test_quoted_values(self):
         """Test parsing quoted string values."""
         content = """---
@@ -165,3 +185,26 @@ priority: P0
         file_path.write_text("# Just content\n\nNo frontmatter here.")
         result = parse_frontmatter(file_path)
         assert result == {}
+
+    def test_stops_at_closing_delimiter(self, tmp_path: Path):
+        """Test that the body after the closing delimiter is never decoded."""
+        file_path = tmp_path / "plan.md"
+        body = b"x" * 256 * 1024 + b"\xff\xfe not utf-8\n"
+        file_path.write_bytes(b"---\nstarted: 2024-01-20\n---\n\n" + body)
+
+        result = parse_frontmatter(file_path)
+        assert result == {"started": "2024-01-20"}
+
+    def test_gives_up_without_opening_delimiter(self, tmp_path: Path):
+        """Test that a file not starting with '---' is not scanned further."""
+        file_path = tmp_path / "notes.md"
+        file_path.write_bytes(b"# Notes\n" + b"y" * 256 * 1024 + b"\xff\n---\nname: x\n---\n")
+
+        assert parse_frontmatter(file_path) == {}
+
+    def test_file_without_trailing_newline(self, tmp_path: Path):
+        """Test a closing delimiter on the last line with no newline."""
+        file_path = tmp_path / "shipped.md"
+        file_path.write_text("---\nshipped: 2024-01-10\n---")
+
+        assert parse_frontmatter(file_path) == {"shipped": "2024-01-10"}
@@ -0,0 +1,192 @@
+"""Tests for the feature dependency graph."""
+
+import time
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from graph import DependencyGraph
+from models import FeatureContext, FeatureStatus
+
+BACKLOG = FeatureStatus.BACKLOG
+IN_PROGRESS = FeatureStatus.IN_PROGRESS
+COMPLETED = FeatureStatus.COMPLETED
+
+
+def _feature(feature_id, status=BACKLOG, depends_on=(), blocked_by=(), priority="P1") -> FeatureContext:
+    """Build an in-memory FeatureContext for graph tests."""
+    return FeatureContext(
+        feature_id=feature_id,
+        feature_dir=Path(feature_id),
+        status=status,
+        priority=priority,
+        depends_on=list(depends_on),
+        blocked_by=list(blocked_by),
+    )
+
+
+class TestEdges:
+    """Tests for edge construction and unmet dependencies."""
+
+    def test_depends_on_edges(self):
+        """Test that dependsOn creates prerequisite and dependent links."""
+        graph = DependencyGraph([_feature("a", COMPLETED), _feature("b", depends_on=["a", "c"])])
+
+        assert list(graph.prerequisites["b"]) == ["a", "c"]
+        assert list(graph.dependents["a"]) == ["b"]
+        assert graph.unmet_dependencies("b") == ["c"]
+
+    def test_blocked_by_is_reverse_edge(self):
+        """Test that A.blockedBy = [B] makes B depend on A."""
+        graph = DependencyGraph([_feature("a", blocked_by=["b"]), _feature("b")])
+
+        assert graph.unmet_dependencies("b") == ["a"]
+        assert graph.unmet_dependencies("a") == []
+
+    def test_edge_declared_from_both_ends(self):
+        """Test that a synced pair yields one edge that survives losing one side."""
+        a = _feature("a", blocked_by=["b"])
+        graph = DependencyGraph([a, _feature("b", depends_on=["a"])])
+        assert graph.unmet_dependencies("b") == ["a"]
+
+        graph.update(replace(a, blocked_by=[]))
+        assert graph.unmet_dependencies("b") == ["a"]
+
+        graph.update(_feature("b"))
+        assert graph.unmet_dependencies("b") == []
+        assert graph.is_ready("b")
+
+
+class TestIncrementalUpdate:
+    """Tests for update/remove keeping readiness counts correct."""
+
+    def test_completion_unblocks_dependents(self):
+        """Test that completing a prerequisite makes its dependent ready."""
+        a = _feature("a", IN_PROGRESS)
+        graph = DependencyGraph([a, _feature("b", depends_on=["a"])])
+        assert graph.ready_queue() == []
+
+        graph.update(replace(a, status=COMPLETED))
+        assert graph.ready_queue() == ["b"]
+
+        graph.update(replace(a, status=IN_PROGRESS))
+        assert graph.ready_queue() == []
+
+    def test_remove_leaves_dependents_blocked(self):
+        """Test that removing a completed prerequisite blocks its dependents again."""
+        graph = DependencyGraph([_feature("a", COMPLETED), _feature("b", depends_on=["a"])])
+        graph.remove("a")
+
+        assert graph.unmet_dependencies("b") == ["a"]
+
+    def test_incremental_matches_rebuild(self):
+        """Test that a sequence of updates ends in the same state as a rebuild."""
+        features = {
+            fid: _feature(fid, depends_on=deps)
+            for fid, deps in (("a", []), ("b", ["a"]), ("c", ["a", "b"]), ("d", ["c"]))
+        }
+        graph = DependencyGraph(features.values())
+
+        features["a"] = replace(features["a"], status=COMPLETED)
+        features["b"] = replace(features["b"], status=COMPLETED, depends_on=[])
+        features["d"] = replace(features["d"], depends_on=["b"])
+        for fid in ("a", "b", "d"):
+            graph.update(features[fid])
+
+        rebuilt = DependencyGraph(features.values())
+        for fid in features:
+            assert graph.unmet_dependencies(fid) == rebuilt.unmet_dependencies(fid)
+        assert graph.ready_queue() == rebuilt.ready_queue() == ["c", "d"]
+
+
+class TestQueries:
+    """Tests for closure, cycle and ordering queries."""
+
+    def test_transitive_closure(self):
+        """Test transitive prerequisites and dependents over a chain."""
+        graph = DependencyGraph([
+            _feature("a"), _feature("b", depends_on=["a"]),
+            _feature("c", depends_on=["b"]), _feature("d", depends_on=["c"]),
+        ])
+
+        assert graph.transitive_prerequisites("d") == {"a", "b", "c"}
+        assert graph.transitive_dependents("a") == {"b", "c", "d"}
+        assert graph.transitive_dependents("d") == set()
+
+    def test_find_cycles(self):
+        """Test that cycles and self-dependencies are reported."""
+        graph = DependencyGraph([
+            _feature("a", depends_on=["b"]), _feature("b", depends_on=["c"]),
+            _feature("c", depends_on=["a"]), _feature("d", depends_on=["a"]),
+            _feature("e", depends_on=["e"]),
+        ])
+
+        assert graph.find_cycles() == [["a", "b", "c"], ["e"]]
+
+    def test_no_cycles(self):
+        """Test that an acyclic graph reports no cycles."""
+        graph = DependencyGraph([_feature("a"), _feature("b", depends_on=["a"])])
+        assert graph.find_cycles() == []
+
+    def test_ready_queue_priority_order(self):
+        """Test that ready backlog items come highest priority first."""
+        graph = DependencyGraph([
+            _feature("low", priority="P2"), _feature("high", priority="P0"),
+            _feature("none", priority=""), _feature("blocked", depends_on=["low"], priority="P0"),
+            _feature("active", IN_PROGRESS, priority="P0"),
+        ])
+
+        assert graph.ready_queue() == ["high", "low", "none"]
+
+    def test_topological_order(self):
+        """Test that prerequisites precede dependents and cycles are left out."""
+        graph = DependencyGraph([
+            _feature("done", COMPLETED),
+            _feature("b", depends_on=["a", "done"], priority="P0"),
+            _feature("a", priority="P2"),
+            _feature("c", priority="P1"),
+            _feature("x", depends_on=["y"]), _feature("y", depends_on=["x"]),
+        ])
+
+        assert graph.topological_order() == ["c", "a", "b"]
+
+
+@pytest.mark.benchmark
+class TestGraphBenchmark:
+    """Benchmark: build and query a 10k-node graph."""
+
+    def test_large_graph(self, capsys):
+        """Test and report graph operations over 10k features with long chains."""
+        count = 10_000
+        features = [
+            _feature(
+                f"f{i}",
+                COMPLETED if i % 7 == 0 else BACKLOG,
+                depends_on=[f"f{i - 1}"] + ([f"f{i // 2}"] if i > 1 else []) if i else [],
+                priority=f"P{i % 3}",
+            )
+            for i in range(count)
+        ]
+
+        start = time.perf_counter()
+        graph = DependencyGraph(features)
+        built = time.perf_counter()
+        cycles = graph.find_cycles()
+        order = graph.topological_order()
+        ready = graph.ready_queue()
+        closure = graph.transitive_prerequisites(f"f{count - 1}")
+        queried = time.perf_counter()
+        graph.update(replace(features[5000], status=COMPLETED))
+        updated = time.perf_counter()
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] graph of {count} features: build {(built - start) * 1000:.1f} ms, "
+                f"queries {(queried - built) * 1000:.1f} ms, update {(updated - queried) * 1e6:.0f} us"
+            )
+
+        assert cycles == []
+        assert len(order) == sum(1 for f in features if f.status != COMPLETED)
+        assert len(closure) == count - 1
+        assert ready
@@ -0,0 +1,109 @@
+"""Tests for the hooks' bounded stdin payload reader."""
+
+import io
+import json
+import time
+
+import pytest
+
+
+@pytest.fixture
+def hook_input(load_hook):
+    """Load hooks/hook_input.py."""
+    return load_hook("hook_input")
+
+
+def _payload(content_size: int, file_path: str = "/p/docs/features/x/idea.md", first: str = "file_path") -> bytes:
+    """Build a Write payload whose content is content_size bytes long."""
+    tool_input = {"file_path": file_path, "content": "x" * content_size}
+    if first == "content":
+        tool_input = {"content": tool_input["content"], "file_path": file_path}
+    return json.dumps({
+        "session_id": "abc",
+        "hook_event_name": "PreToolUse",
+        "tool_name": "Write",
+        "tool_input": tool_input,
+    }).encode("utf-8")
+
+
+class TestReadHookInput:
+    """Tests for read_hook_input."""
+
+    def test_small_payload_fully_decoded(self, hook_input):
+        """Test that payloads under the head size are decoded as usual."""
+        data = hook_input.read_hook_input(io.BytesIO(_payload(100)))
+        assert data["session_id"] == "abc"
+        assert data["tool_input"]["content"] == "x" * 100
+
+    def test_large_payload_fast_path(self, hook_input):
+        """Test that large payloads yield only the keys the hooks need."""
+        stream = io.BytesIO(_payload(5 * hook_input.HEAD_BYTES))
+        data = hook_input.read_hook_input(stream)
+
+        assert data == {
+            "tool_name": "Write",
+            "hook_event_name": "PreToolUse",
+            "tool_input": {"file_path": "/p/docs/features/x/idea.md"},
+        }
+        # The remainder of stdin was drained
+        assert stream.read() == b""
+
+    def test_escaped_file_path(self, hook_input):
+        """Test that JSON escapes in the path are decoded."""
+        path = 'C:\\repo\\docs\\features\\"quoted"\\idea.md'
+        data = hook_input.read_hook_input(io.BytesIO(_payload(2 * hook_input.HEAD_BYTES, path)))
+        assert data["tool_input"]["file_path"] == path
+
+    def test_key_inside_content_not_matched(self, hook_input):
+        """Test that a file_path key embedded in the written content is ignored."""
+        stream = io.BytesIO(json.dumps({
+            "tool_name": "Write",
+            "tool_input": {
+                "content": '{"file_path": "/decoy"}' + "x" * 2 * hook_input.HEAD_BYTES,
+                "file_path": "/real",
+            },
+        }).encode("utf-8"))
+
+        assert hook_input.read_hook_input(stream)["tool_input"]["file_path"] == "/real"
+
+    def test_falls_back_when_path_follows_content(self, hook_input):
+        """Test that a file_path past the head is found by a full decode."""
+        raw = _payload(2 * hook_input.HEAD_BYTES, first="content")
+        data = hook_input.read_hook_input(io.BytesIO(raw))
+
+        assert data["tool_input"]["file_path"] == "/p/docs/features/x/idea.md"
+        assert "content" in data["tool_input"]
+
+    def test_text_stream(self, hook_input):
+        """Test that text streams (no .buffer) are accepted."""
+        data = hook_input.read_hook_input(io.StringIO(_payload(2 * hook_input.HEAD_BYTES).decode()))
+        assert data["tool_name"] == "Write"
+
+    def test_invalid_json(self, hook_input):
+        """Test that malformed small payloads raise JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            hook_input.read_hook_input(io.BytesIO(b"{not json"))
+
+
+@pytest.mark.benchmark
+class TestHookInputBenchmark:
+    """Benchmark: full json.load vs bounded scan across payload sizes."""
+
+    @pytest.mark.parametrize("size", [1_000, 100_000, 1_000_000, 10_000_000])
+    def test_payload_sizes(self, hook_input, capsys, size: int):
+        """Test and report parse time for Write payloads of increasing size."""
+        raw = _payload(size)
+
+        start = time.perf_counter()
+        full = json.load(io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8"))
+        decoded = time.perf_counter()
+        fast = hook_input.read_hook_input(io.BytesIO(raw))
+        scanned = time.perf_counter()
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] {size:>10,} byte payload: json.load {(decoded - start) * 1000:.2f} ms, "
+                f"read_hook_input {(scanned - decoded) * 1000:.2f} ms"
+            )
+
+        assert fast["tool_input"]["file_path"] == full["tool_input"]["file_path"]
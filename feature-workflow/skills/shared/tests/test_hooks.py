@@ -0,0 +1,229 @@
+"""Tests for the plugin's PreToolUse/PostToolUse hook scripts."""
+
+import io
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+PLUGIN_ROOT = Path(__file__).parents[3]
+
+
+def _write_payload(file_path: Path, tool_name: str = "Write") -> io.StringIO:
+    """Build a hook stdin payload for a Write/Edit of file_path."""
+    return io.StringIO(json.dumps({
+        "tool_name": tool_name,
+        "tool_input": {"file_path": str(file_path), "content": "..."},
+    }))
+
+
+class TestPostToolUse:
+    """Tests for hooks/post_tool_use.py."""
+
+    def test_regenerates_in_process(self, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that a feature write regenerates the dashboard without a subprocess."""
+        hook = load_hook("post_tool_use")
+        project_root = feature_in_backlog.parent.parent.parent
+        monkeypatch.setattr("sys.stdin", _write_payload(feature_in_backlog / "idea.md"))
+        monkeypatch.setattr(hook, "regenerate_subprocess", lambda *args: pytest.fail("subprocess used"))
+
+        assert hook.main() == 0
+        assert "test-feature" in (project_root / "docs" / "features" / "DASHBOARD.md").read_text()
+
+    def test_subprocess_mode(self, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that subprocess mode still regenerates the dashboard."""
+        hook = load_hook("post_tool_use")
+        project_root = feature_in_backlog.parent.parent.parent
+        monkeypatch.setenv(hook.MODE_ENV_VAR, "subprocess")
+        monkeypatch.setattr("sys.stdin", _write_payload(feature_in_backlog / "idea.md"))
+
+        assert hook.main() == 0
+        assert "test-feature" in (project_root / "docs" / "features" / "DASHBOARD.md").read_text()
+
+    def test_falls_back_to_subprocess(self, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that an in-process failure falls back to the subprocess path."""
+        hook = load_hook("post_tool_use")
+        calls = []
+        monkeypatch.setattr(hook, "regenerate_in_process", lambda *args: False)
+        monkeypatch.setattr(hook, "regenerate_subprocess", lambda *args: calls.append(args) or True)
+        monkeypatch.setattr("sys.stdin", _write_payload(feature_in_backlog / "plan.md", "Edit"))
+
+        assert hook.main() == 0
+        assert len(calls) == 1
+        assert calls[0][2] == "test-feature"
+
+    def test_updates_search_index(self, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that a feature write updates the full-text search index."""
+        hook = load_hook("post_tool_use")
+        features_dir = feature_in_backlog.parent
+        monkeypatch.setattr("sys.stdin", _write_payload(feature_in_backlog / "idea.md"))
+
+        assert hook.main() == 0
+        index = json.loads((features_dir / ".search-index.json").read_text())
+        assert "test-feature" in index["docs"]
+
+    def test_subprocess_mode_updates_search_index(self, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that run_dashboard.py updates the search index in subprocess mode."""
+        hook = load_hook("post_tool_use")
+        features_dir = feature_in_backlog.parent
+        monkeypatch.setenv(hook.MODE_ENV_VAR, "subprocess")
+        monkeypatch.setattr("sys.stdin", _write_payload(feature_in_backlog / "idea.md"))
+
+        assert hook.main() == 0
+        index = json.loads((features_dir / ".search-index.json").read_text())
+        assert "test-feature" in index["docs"]
+
+    def test_search_index_left_to_daemon(self, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that the hook does not index feature bodies itself when the daemon answers."""
+        hook = load_hook("post_tool_use")
+        features_dir = feature_in_backlog.parent
+        monkeypatch.setattr(hook, "notify_daemon", lambda *args: True)
+        monkeypatch.setattr("sys.stdin", _write_payload(feature_in_backlog / "idea.md"))
+
+        assert hook.main() == 0
+        assert not (features_dir / ".search-index.json").exists()
+
+    def test_ignores_non_feature_files(self, load_hook, tmp_path: Path, monkeypatch):
+        """Test that writes outside docs/features are ignored."""
+        hook = load_hook("post_tool_use")
+        monkeypatch.setattr(hook, "regenerate_in_process", lambda *args: pytest.fail("regenerated"))
+        monkeypatch.setattr("sys.stdin", _write_payload(tmp_path / "src" / "app.py"))
+
+        assert hook.main() == 0
+
+
+class TestPreToolUse:
+    """Tests for hooks/pre_tool_use.py."""
+
+    @pytest.mark.parametrize("name", ["DASHBOARD.md", "index.json", ".archive/DASHBOARD-2023.md"])
+    def test_blocks_generated_files(self, load_hook, temp_project: Path, monkeypatch, capsys, name: str):
+        """Test that direct writes to generated files are blocked."""
+        hook = load_hook("pre_tool_use")
+        monkeypatch.setattr("sys.stdin", _write_payload(temp_project / "docs" / "features" / name))
+
+        assert hook.main() == 2
+        assert f"Direct write to {name}" in capsys.readouterr().err
+
+    def test_allows_feature_files(self, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that writes to feature directories are allowed."""
+        hook = load_hook("pre_tool_use")
+        monkeypatch.setattr("sys.stdin", _write_payload(feature_in_backlog / "index.json"))
+
+        assert hook.main() == 0
+
+
+class TestDispatch:
+    """Tests for hooks/dispatch.py."""
+
+    # Allowed startup cost over a bare interpreter, in milliseconds
+    COLD_START_BUDGET_MS = 30
+
+    def test_pre_phase_from_argument(self, load_hook, temp_project: Path, monkeypatch):
+        """Test that 'pre' blocks writes to generated files."""
+        hook = load_hook("dispatch")
+        monkeypatch.setattr("sys.stdin", _write_payload(temp_project / "docs" / "features" / "DASHBOARD.md"))
+
+        assert hook.main(["pre"]) == 2
+
+    def test_phase_from_payload(self, load_hook, temp_project: Path, monkeypatch):
+        """Test that hook_event_name selects the phase when no argument is given."""
+        hook = load_hook("dispatch")
+        payload = {
+            "hook_event_name": "PreToolUse",
+            "tool_name": "Edit",
+            "tool_input": {"file_path": str(temp_project / "docs" / "features" / "index.json")},
+        }
+        monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(payload)))
+
+        assert hook.main([]) == 2
+
+    def test_post_phase_regenerates(self, load_hook, feature_in_backlog: Path, monkeypatch):
+        """Test that 'post' regenerates the dashboard for feature writes."""
+        hook = load_hook("dispatch")
+        project_root = feature_in_backlog.parent.parent.parent
+        monkeypatch.setattr("sys.stdin", _write_payload(feature_in_backlog / "idea.md"))
+
+        assert hook.main(["post"]) == 0
+        assert "test-feature" in (project_root / "docs" / "features" / "DASHBOARD.md").read_text()
+
+    def test_unrelated_write_skips_handlers(self, load_hook, tmp_path: Path, monkeypatch):
+        """Test that writes outside docs/features never import the handlers."""
+        hook = load_hook("dispatch")
+        monkeypatch.delitem(sys.modules, "pre_tool_use", raising=False)
+        monkeypatch.delitem(sys.modules, "post_tool_use", raising=False)
+
+        for phase in ("pre", "post"):
+            monkeypatch.setattr("sys.stdin", _write_payload(tmp_path / "src" / "app.py"))
+            assert hook.main([phase]) == 0
+
+        assert "pre_tool_use" not in sys.modules
+        assert "post_tool_use" not in sys.modules
+
+    def test_manifest_uses_dispatcher(self):
+        """Test that plugin.json routes both tool hooks through dispatch.py."""
+        manifest = json.loads((PLUGIN_ROOT / ".claude-plugin" / "plugin.json").read_text())
+
+        for event, phase in (("PreToolUse", "pre"), ("PostToolUse", "post")):
+            (entry,) = manifest["hooks"][event]
+            assert entry["matcher"] == "Write|Edit"
+            assert entry["hooks"][0]["command"].endswith(f"/hooks/dispatch.py {phase}")
+
+    def test_cold_start_budget(self, tmp_path: Path):
+        """Test that dispatching an unrelated write stays within the startup budget."""
+        payload = json.dumps({
+            "tool_name": "Write",
+            "tool_input": {"file_path": str(tmp_path / "src" / "app.py"), "content": "x"},
+        })
+        script = str(PLUGIN_ROOT / "hooks" / "dispatch.py")
+
+        def best_of(cmd: list[str]) -> float:
+            timings = []
+            for _ in range(7):
+                start = time.perf_counter()
+                subprocess.run(cmd, input=payload, capture_output=True, text=True, check=True)
+                timings.append(time.perf_counter() - start)
+            return min(timings) * 1000
+
+        baseline = best_of([sys.executable, "-c", "pass"])
+        overhead = max(best_of([sys.executable, script, phase]) for phase in ("pre", "post")) - baseline
+
+        assert overhead < self.COLD_START_BUDGET_MS, f"dispatch.py adds {overhead:.1f} ms"
+
+
+@pytest.mark.benchmark
+class TestRegenerationLatency:
+    """Benchmark: in-process vs subprocess regeneration per edit."""
+
+    ROUNDS = 5
+
+    def test_in_process_saves_latency(self, load_hook, make_features, tmp_path: Path, capsys):
+        """Test that in-process regeneration is faster than spawning an interpreter."""
+        hook = load_hook("post_tool_use")
+        project_root = make_features(tmp_path, 200)
+        feature_id = "feature-00001"
+
+        # Warm the feature cache and the module imports
+        hook.regenerate_in_process(PLUGIN_ROOT, str(project_root), feature_id)
+
+        def best_of(fn) -> float:
+            timings = []
+            for _ in range(self.ROUNDS):
+                start = time.perf_counter()
+                assert fn(PLUGIN_ROOT, str(project_root), feature_id)
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        in_process = best_of(hook.regenerate_in_process)
+        subprocess = best_of(hook.regenerate_subprocess)
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] regeneration per edit (200 features): "
+                f"in-process {in_process * 1000:.1f} ms, subprocess {subprocess * 1000:.1f} ms, "
+                f"saved {(subprocess - in_process) * 1000:.1f} ms"
+            )
+
+        assert in_process < subprocess
@@ -1,11 +1,65 @@
 """Tests for feature-workflow data models."""
 
+import os
+import tracemalloc
+from contextlib import contextmanager
 from datetime import date
 from pathlib import Path
 
 import pytest
 
-from models import FeatureStatus, FeatureContext
+import feature_cache
+from frontmatter import parse_frontmatter
+from models import CompactFeature, FeatureStatus, FeatureContext
+
+
+@contextmanager
+def count_stat_calls(monkeypatch):
+    """Count os.stat calls plus DirEntry.stat calls made through os.scandir."""
+    counter = {"stat": 0}
+    real_stat = os.stat
+    real_scandir = os.scandir
+
+    def counting_stat(*args, **kwargs):
+        counter["stat"] += 1
+        return real_stat(*args, **kwargs)
+
+    class CountingEntry:
+        def __init__(self, entry):
+            self._entry = entry
+            self.name = entry.name
+
+        def is_dir(self, **kwargs):
+            return self._entry.is_dir(**kwargs)
+
+        def stat(self, **kwargs):
+            counter["stat"] += 1
+            return self._entry.stat(**kwargs)
+
+    @contextmanager
+    def counting_scandir(path):
+        with real_scandir(path) as it:
+            yield (CountingEntry(entry) for entry in it)
+
+    with monkeypatch.context() as m:
+        m.setattr(os, "stat", counting_stat)
+        m.setattr(os, "scandir", counting_scandir)
+        yield counter
+
+
+def _legacy_probe(feature_dir: Path) -> None:
+    """Replay the exists()-per-file pattern used before os.scandir.
+
+    Kept as the "before" reference for the stat-call benchmark.
+    """
+    idea, plan, shipped = (feature_dir / n for n in ("idea.md", "plan.md", "shipped.md"))
+    if not idea.exists():
+        return
+    if not shipped.exists():
+        plan.exists()
+    for path in (idea, plan if plan.exists() else None, shipped if shipped.exists() else None):
+        if path is not None and path.exists():
+            parse_frontmatter(path)
 
 
 class TestFeatureStatus:
@@ -245,3 +299,179 @@ name: Feature A
 
         unmet = dep_ctx.has_unmet_dependencies(all_features)
         assert unmet == []
+
+
+class TestFromEntries:
+    """Tests for FeatureContext.from_entries."""
+
+    def test_status_from_names(self, feature_completed: Path):
+        """Test that status is derived from the listed names."""
+        names = {"idea.md", "plan.md", "shipped.md"}
+        ctx = FeatureContext.from_entries(feature_completed, names)
+        assert ctx.status == FeatureStatus.COMPLETED
+        assert ctx.shipped == date(2024, 1, 25)
+
+    def test_unlisted_files_ignored(self, feature_completed: Path):
+        """Test that only listed files are parsed."""
+        ctx = FeatureContext.from_entries(feature_completed, {"idea.md"})
+        assert ctx.status == FeatureStatus.BACKLOG
+        assert ctx.started is None
+
+    def test_no_idea(self, feature_in_backlog: Path):
+        """Test that a listing without idea.md is not a feature."""
+        assert FeatureContext.from_entries(feature_in_backlog, {"plan.md"}) is None
+
+    def test_missing_directory(self, tmp_path: Path):
+        """Test that from_directory handles a directory that does not exist."""
+        assert FeatureContext.from_directory(tmp_path / "missing") is None
+
+    def test_no_stat_calls(self, feature_completed: Path, monkeypatch):
+        """Test that from_directory makes no stat calls."""
+        with count_stat_calls(monkeypatch) as counter:
+            FeatureContext.from_directory(feature_completed)
+        assert counter["stat"] == 0
+
+
+class TestCompactFeature:
+    """Tests for the slotted CompactFeature variant."""
+
+    def test_round_trip_with_context(self, feature_completed: Path):
+        """Test that converting to compact and back preserves every field."""
+        ctx = FeatureContext.from_directory(feature_completed)
+        compact = CompactFeature.from_context(ctx)
+
+        assert compact.to_context() == ctx
+        assert compact.to_dict() == ctx.to_dict()
+        assert compact.feature_dir == feature_completed
+
+    def test_from_dict(self, feature_in_progress: Path):
+        """Test that cache entries convert directly to compact features."""
+        ctx = FeatureContext.from_directory(feature_in_progress)
+        compact = CompactFeature.from_dict(ctx.to_dict(), str(feature_in_progress.parent))
+
+        assert compact == CompactFeature.from_context(ctx)
+
+    def test_compact_representation(self):
+        """Test slots, tuples and shared strings and dates."""
+        a = CompactFeature("a", "/p/docs/features", FeatureStatus.BACKLOG,
+                           priority="P" + "1", created=date(2024, 1, 5), depends_on=["b"])
+        b = CompactFeature("b", "/p/docs/" + "features", FeatureStatus.BACKLOG,
+                           priority="P1", created=date(2024, 1, 5))
+
+        assert not hasattr(a, "__dict__")
+        assert a.depends_on == ("b",)
+        assert b.blocked_by == ()
+        assert a.priority is b.priority
+        assert a.features_root is b.features_root
+        assert a.created is b.created
+
+    def test_non_string_frontmatter(self, temp_project: Path):
+        """Test that numeric or list frontmatter values are kept as parsed."""
+        feature_dir = temp_project / "docs" / "features" / "odd"
+        feature_dir.mkdir(parents=True)
+        (feature_dir / "idea.md").write_text(
+            "---\nname: Odd\ntype: Feature\npriority: [P1, P2]\neffort: 3\n---\n"
+        )
+        ctx = FeatureContext.from_directory(feature_dir)
+        compact = CompactFeature.from_context(ctx)
+
+        assert compact.priority == ctx.priority
+        assert compact.effort == ctx.effort
+        assert compact.to_context() == ctx
+
+    def test_has_unmet_dependencies(self):
+        """Test that dependency checks work across compact features."""
+        done = CompactFeature("done", "/p", FeatureStatus.COMPLETED)
+        todo = CompactFeature("todo", "/p", FeatureStatus.BACKLOG, depends_on=["done", "ghost"])
+
+        assert todo.has_unmet_dependencies({"done": done, "todo": todo}) == ["ghost"]
+
+
+@pytest.mark.benchmark
+class TestMemoryBenchmark:
+    """Benchmark: traced memory of 50k FeatureContext vs CompactFeature."""
+
+    COUNT = 50_000
+
+    def _records(self) -> list[dict]:
+        return [
+            {
+                "id": f"feature-{i:05d}",
+                "status": ("backlog", "in_progress", "completed")[i % 3],
+                "name": f"Feature {i}",
+                "type": "Feature",
+                "priority": f"P{i % 3}",
+                "effort": ("Small", "Medium", "Large")[i % 3],
+                "impact": "Medium",
+                "created": f"2024-01-{i % 28 + 1:02d}",
+                "started": "2024-02-01" if i % 3 else None,
+                "shipped": "2024-03-01" if i % 3 == 2 else None,
+                "dependsOn": [f"feature-{i - 1:05d}"] if i % 4 == 0 and i else [],
+                "blockedBy": [],
+            }
+            for i in range(self.COUNT)
+        ]
+
+    def _measure(self, build) -> tuple[int, list]:
+        tracemalloc.start()
+        try:
+            items = build()
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return current, items
+
+    def test_compact_memory(self, capsys):
+        """Test and report memory held by 50k features in each representation."""
+        records = self._records()
+        root = "/workspace/project/docs/features"
+
+        regular, contexts = self._measure(
+            lambda: [FeatureContext.from_dict(r, Path(root, r["id"])) for r in records]
+        )
+        compact, compacts = self._measure(
+            lambda: [CompactFeature.from_dict(r, "/workspace/project/docs/" + "features") for r in records]
+        )
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] {self.COUNT} features: FeatureContext {regular / 2**20:.1f} MiB, "
+                f"CompactFeature {compact / 2**20:.1f} MiB ({compact / regular:.0%})"
+            )
+
+        assert len(contexts) == len(compacts) == self.COUNT
+        assert compact < regular * 0.6
+
+
+@pytest.mark.benchmark
+class TestStatCallBenchmark:
+    """Benchmark: stat calls per feature before and after os.scandir."""
+
+    def test_stat_calls_per_feature(self, make_features, tmp_path: Path, monkeypatch, capsys):
+        """Test and report stat calls for parsing and for cache validation."""
+        count = 300
+        features_dir = make_features(tmp_path, count) / "docs" / "features"
+        feature_dirs = sorted(p for p in features_dir.iterdir() if p.is_dir())
+
+        with count_stat_calls(monkeypatch) as before:
+            for feature_dir in feature_dirs:
+                _legacy_probe(feature_dir)
+
+        with count_stat_calls(monkeypatch) as after:
+            for feature_dir in feature_dirs:
+                FeatureContext.from_directory(feature_dir)
+
+        feature_cache.load_features(features_dir)
+        with count_stat_calls(monkeypatch) as validate:
+            feature_cache.load_features(features_dir)
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] stat calls per feature: exists() probing {before['stat'] / count:.2f}, "
+                f"scandir parse {after['stat'] / count:.2f}, "
+                f"cache validation {validate['stat'] / count:.2f}"
+            )
+
+        assert after["stat"] < before["stat"]
+        # Cache validation stats each feature file present, and nothing else
+        assert validate["stat"] <= 3 * count
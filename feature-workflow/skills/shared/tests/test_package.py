@@ -0,0 +1,71 @@
+"""Tests for the lazily-importing lib package."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SHARED_DIR = Path(__file__).parent.parent
+
+# Cumulative import budget per module, in microseconds. Without bytecode
+# caching these measure 20-35 ms here, mostly pathlib (which pulls in re)
+# and typing; the eager package took 70-100 ms.
+IMPORT_BUDGET_US = 60_000
+
+# Modules a light import must not drag in
+HEAVY_MODULES = {"lib.models", "lib.dashboard", "lib.feature_cache", "dataclasses", "datetime"}
+
+
+def _importtime(statement: str) -> dict[str, int]:
+    """Run statement under -X importtime and return {module: cumulative us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=SHARED_DIR, capture_output=True, text=True, check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+class TestLazyPackage:
+    """Tests for lib/__init__.py attribute resolution."""
+
+    def test_exports_resolve(self):
+        """Test that every public name resolves to its submodule's object."""
+        import lib
+        from lib import statusline
+
+        for name in lib.__all__:
+            assert getattr(lib, name) is not None
+        assert lib.get_context is statusline.get_context
+
+    def test_unknown_attribute(self):
+        """Test that unknown names raise AttributeError."""
+        import lib
+
+        with pytest.raises(AttributeError):
+            lib.does_not_exist
+
+    def test_dir_lists_exports(self):
+        """Test that dir() includes the lazily-loaded names."""
+        import lib
+
+        assert set(lib.__all__) <= set(dir(lib))
+
+
+class TestImportCost:
+    """Tests that light modules stay cheap to import."""
+
+    @pytest.mark.parametrize("module", ["lib.statusline", "lib.frontmatter"])
+    def test_import_under_budget(self, module: str):
+        """Test that importing a light module skips the heavy ones and stays under budget."""
+        runs = [_importtime(f"import {module}") for _ in range(3)]
+
+        assert not HEAVY_MODULES & set(runs[0])
+        best = min(timings[module] for timings in runs)
+        assert best < IMPORT_BUDGET_US, f"import {module} took {best} us"
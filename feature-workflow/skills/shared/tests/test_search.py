@@ -0,0 +1,215 @@
+"""Tests for the full-text feature search index."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import search
+from search import SEARCH_INDEX_FILENAME, SearchIndex, index_feature, tokenize, update_index
+
+LIB_DIR = Path(__file__).parent.parent / "lib"
+
+
+def _write_feature(features_dir: Path, feature_id: str, idea: str, **files: str) -> Path:
+    """Create a feature directory with idea.md and optional plan/shipped files."""
+    feature_dir = features_dir / feature_id
+    feature_dir.mkdir()
+    (feature_dir / "idea.md").write_text(idea)
+    for name, content in files.items():
+        (feature_dir / f"{name}.md").write_text(content)
+    return feature_dir
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward so its stat signature changes."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def searchable_project(temp_project: Path) -> Path:
+    """Create a project with features about different topics."""
+    features_dir = temp_project / "docs" / "features"
+    _write_feature(
+        features_dir, "dark-mode",
+        "---\nname: Dark Mode Toggle\naffectedAreas: [settings, theme]\n---\n\n"
+        "# Dark Mode\nUsers want a darker colour scheme at night.\n",
+    )
+    _write_feature(
+        features_dir, "user-auth",
+        "---\nname: User Authentication\n---\n\n# Problem\nNo login support.\n",
+        plan="---\nstarted: 2024-01-12\n---\n\n# Plan\nUse OAuth tokens and a session theme.\n",
+    )
+    _write_feature(
+        features_dir, "rate-limit",
+        "---\nname: API Rate Limiting\n---\n\n# Problem\nClients overload the API.\n",
+    )
+    return temp_project
+
+
+class TestTokenize:
+    """Tests for tokenize."""
+
+    def test_lowercases_and_drops_stopwords(self):
+        """Test that terms are lowercase and stopwords are removed."""
+        assert tokenize("The Dark-Mode toggle, for SETTINGS!") == ["dark", "mode", "toggle", "settings"]
+
+
+class TestIndexFeature:
+    """Tests for index_feature."""
+
+    def test_field_weights(self, searchable_project: Path):
+        """Test that name terms outweigh frontmatter, which outweighs body."""
+        weights = index_feature(searchable_project / "docs" / "features" / "dark-mode")
+
+        # "dark": feature ID + name (title weight) + body heading (body weight)
+        assert weights["dark"] == 3.0 + 3.0 + 1.0
+        assert weights["settings"] == 2.0
+        assert weights["scheme"] == 1.0
+        # Frontmatter keys are not indexed
+        assert "affectedareas" not in weights
+        assert "name" not in weights
+
+    def test_plan_and_shipped_indexed(self, searchable_project: Path):
+        """Test that plan.md content is indexed along with idea.md."""
+        weights = index_feature(searchable_project / "docs" / "features" / "user-auth")
+        assert "oauth" in weights
+
+
+class TestSearch:
+    """Tests for ranked search."""
+
+    def test_name_match_ranks_first(self, searchable_project: Path):
+        """Test that a name match outranks a body mention."""
+        results = search.search(searchable_project, "theme")
+        assert [fid for fid, _ in results] == ["dark-mode", "user-auth"]
+
+    def test_prefix_match(self, searchable_project: Path):
+        """Test that partial words match longer terms."""
+        results = search.search(searchable_project, "auth")
+        assert results[0][0] == "user-auth"
+
+    def test_no_matches(self, searchable_project: Path):
+        """Test that unrelated queries return nothing."""
+        assert search.search(searchable_project, "billing") == []
+
+    def test_limit(self, searchable_project: Path):
+        """Test that limit caps the number of results."""
+        assert len(search.search(searchable_project, "theme", limit=1)) == 1
+
+
+class TestUpdateIndex:
+    """Tests for incremental index maintenance."""
+
+    def test_persists_index(self, searchable_project: Path):
+        """Test that the index is written under docs/features."""
+        features_dir = searchable_project / "docs" / "features"
+        update_index(features_dir)
+
+        data = json.loads((features_dir / SEARCH_INDEX_FILENAME).read_text())
+        assert set(data["docs"]) == {"dark-mode", "rate-limit", "user-auth"}
+        assert "dark-mode" in data["postings"]["dark"]
+
+    def test_changed_feature_reindexed(self, searchable_project: Path, monkeypatch):
+        """Test that only the changed feature is re-tokenized."""
+        features_dir = searchable_project / "docs" / "features"
+        update_index(features_dir)
+
+        indexed = []
+        original = search.index_feature
+        monkeypatch.setattr(search, "index_feature", lambda d, n=None: indexed.append(d.name) or original(d, n))
+
+        idea = features_dir / "rate-limit" / "idea.md"
+        idea.write_text(idea.read_text().replace("overload", "throttle"))
+        _bump_mtime(idea)
+        index = update_index(features_dir, changed_feature="rate-limit")
+
+        assert indexed == ["rate-limit"]
+        assert "overload" not in index.postings
+        assert index.search("throttle")[0][0] == "rate-limit"
+
+    def test_new_feature_added(self, searchable_project: Path):
+        """Test that a feature unknown to the index is picked up."""
+        features_dir = searchable_project / "docs" / "features"
+        update_index(features_dir)
+        _write_feature(features_dir, "export", "---\nname: CSV Export\n---\n")
+
+        index = update_index(features_dir, changed_feature="export")
+        assert index.search("csv")[0][0] == "export"
+
+    def test_removed_feature_dropped(self, searchable_project: Path):
+        """Test that a full refresh forgets deleted features."""
+        features_dir = searchable_project / "docs" / "features"
+        update_index(features_dir)
+
+        rate_dir = features_dir / "rate-limit"
+        (rate_dir / "idea.md").unlink()
+        rate_dir.rmdir()
+
+        index = update_index(features_dir)
+        assert "rate-limit" not in index.docs
+        assert "api" not in index.postings
+
+    def test_corrupt_index_rebuilt(self, searchable_project: Path):
+        """Test that an unreadable index is rebuilt from scratch."""
+        features_dir = searchable_project / "docs" / "features"
+        (features_dir / SEARCH_INDEX_FILENAME).write_text("{not json")
+
+        assert len(update_index(features_dir).docs) == 3
+
+
+class TestSearchIndex:
+    """Tests for SearchIndex add/remove."""
+
+    def test_add_replaces_previous_terms(self):
+        """Test that re-adding a feature drops its stale postings."""
+        index = SearchIndex()
+        index.add("a", {}, {"old": 1.0, "shared": 1.0})
+        index.add("b", {}, {"shared": 1.0})
+        index.add("a", {}, {"new": 1.0})
+
+        assert "old" not in index.postings
+        assert index.postings["shared"] == {"b": 1.0}
+        assert index.postings["new"] == {"a": 1.0}
+
+
+class TestCli:
+    """Tests for the search.py command line."""
+
+    def test_prints_ranked_ids(self, searchable_project: Path):
+        """Test that the CLI prints one ranked feature per line."""
+        result = subprocess.run(
+            [sys.executable, str(LIB_DIR / "search.py"), str(searchable_project), "dark", "theme"],
+            capture_output=True, text=True,
+        )
+        assert result.returncode == 0
+        assert result.stdout.splitlines()[0].split("\t")[0] == "dark-mode"
+
+
+@pytest.mark.benchmark
+class TestSearchBenchmark:
+    """Benchmark: query latency against a warm index."""
+
+    def test_query_latency(self, make_features, tmp_path: Path, capsys):
+        """Test and report query time over 5k indexed features."""
+        features_dir = make_features(tmp_path, 5_000) / "docs" / "features"
+        update_index(features_dir)
+
+        start = time.perf_counter()
+        index = search.load_search_index(features_dir)
+        loaded = time.perf_counter()
+        results = index.search("feature 4242")
+        done = time.perf_counter()
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] search over 5000 features: load {(loaded - start) * 1000:.1f} ms, "
+                f"query {(done - loaded) * 1000:.1f} ms"
+            )
+
+        assert results[0][0] == "feature-04242"
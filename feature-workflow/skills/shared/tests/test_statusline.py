@@ -1,12 +1,15 @@
 """Tests for statusline management."""
 
 import os
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+import statusline
 from statusline import (
+    ContextWatcher,
     get_sessions_dir,
     get_session_id,
     set_context,
@@ -25,6 +28,13 @@ class TestGetSessionsDir:
             assert sessions_dir.exists()
             assert sessions_dir == tmp_path / ".claude" / "sessions"
 
+    def test_read_does_not_create(self, tmp_path: Path):
+        """Test that create=False and get_context leave the filesystem alone."""
+        with patch.dict(os.environ, {"HOME": str(tmp_path), "SESSION_ID": "s"}):
+            assert get_sessions_dir(create=False) == tmp_path / ".claude" / "sessions"
+            assert get_context() is None
+        assert not (tmp_path / ".claude").exists()
+
 
 class TestGetSessionId:
     """Tests for get_session_id function."""
@@ -52,6 +62,30 @@ class TestGetSessionId:
                 session_id = get_session_id()
                 assert session_id == "mapped-session-456"
 
+    def test_iterm_mapping_memoized(self, tmp_path: Path, monkeypatch):
+        """Test that the iTerm mapping is re-read only when the file changes."""
+        sessions_dir = tmp_path / ".claude" / "sessions"
+        sessions_dir.mkdir(parents=True)
+        session_file = sessions_dir / "iterm-memo.session"
+        session_file.write_text("mapped")
+
+        reads = []
+        real_read = statusline._read_stripped
+        monkeypatch.setattr(statusline, "_read_stripped", lambda path: reads.append(path) or real_read(path))
+
+        with patch.dict(os.environ, {"HOME": str(tmp_path), "ITERM_SESSION_ID": "memo"}, clear=True):
+            assert get_session_id() == "mapped"
+            assert get_session_id() == "mapped"
+            assert len(reads) == 1
+
+            # The statusline script rewrites the mapping when a new session starts
+            session_file.write_text("new-session")
+            assert get_session_id() == "new-session"
+            assert len(reads) == 2
+
+            session_file.unlink()
+            assert get_session_id() is None
+
     def test_returns_none_when_no_session(self):
         """Test that None is returned when no session ID can be determined."""
         with patch.dict(os.environ, {}, clear=True):
@@ -140,3 +174,99 @@ class TestGetContext:
         with patch.dict(os.environ, {}, clear=True):
             context = get_context()
             assert context is None
+
+
+class TestContextWatcher:
+    """Tests for the mtime-checked in-memory context."""
+
+    def test_rereads_only_on_change(self, tmp_path: Path, monkeypatch):
+        """Test that the file is read again only after it changes."""
+        sessions_dir = tmp_path / ".claude" / "sessions"
+        sessions_dir.mkdir(parents=True)
+        feature_file = sessions_dir / "watch.feature"
+        feature_file.write_text("first")
+
+        reads = []
+        real_read = statusline._read_stripped
+        monkeypatch.setattr(statusline, "_read_stripped", lambda path: reads.append(path) or real_read(path))
+
+        with patch.dict(os.environ, {"HOME": str(tmp_path)}):
+            watcher = ContextWatcher("watch")
+            assert watcher.get() == "first"
+            assert watcher.get() == "first"
+            assert len(reads) == 1
+
+            feature_file.write_text("second-feature")
+            assert watcher.get() == "second-feature"
+            assert len(reads) == 2
+
+            feature_file.unlink()
+            assert watcher.get() is None
+
+    def test_follows_iterm_mapping(self, tmp_path: Path):
+        """Test that a watcher without a session ID follows a rewritten iTerm mapping."""
+        sessions_dir = tmp_path / ".claude" / "sessions"
+        sessions_dir.mkdir(parents=True)
+        mapping = sessions_dir / "iterm-tab.session"
+        mapping.write_text("old-session")
+        (sessions_dir / "old-session.feature").write_text("old-feature")
+        (sessions_dir / "new-session.feature").write_text("new-feature")
+
+        with patch.dict(os.environ, {"HOME": str(tmp_path), "ITERM_SESSION_ID": "tab"}, clear=True):
+            watcher = ContextWatcher()
+            assert watcher.get() == "old-feature"
+
+            mapping.write_text("new-session")
+            assert watcher.get() == "new-feature"
+            assert watcher.session_id == "new-session"
+
+    def test_no_session(self):
+        """Test that a watcher without a session returns None."""
+        with patch.dict(os.environ, {}, clear=True):
+            assert ContextWatcher().get() is None
+
+
+@pytest.mark.benchmark
+class TestGetContextBenchmark:
+    """Benchmark: get_context calls per second, before and after the fast path."""
+
+    CALLS = 20_000
+
+    @staticmethod
+    def _legacy_get_context():
+        """The previous read path: mkdir and exists() on every call.
+
+        Kept as the "before" reference for the benchmark.
+        """
+        session_id = os.environ.get("SESSION_ID")
+        sessions_dir = Path.home() / ".claude" / "sessions"
+        sessions_dir.mkdir(parents=True, exist_ok=True)
+        feature_file = sessions_dir / f"{session_id}.feature"
+        if feature_file.exists():
+            return feature_file.read_text().strip()
+        return None
+
+    def test_calls_per_second(self, tmp_path: Path, capsys):
+        """Test and report get_context throughput."""
+        sessions_dir = tmp_path / ".claude" / "sessions"
+        sessions_dir.mkdir(parents=True)
+        (sessions_dir / "bench.feature").write_text("my-feature")
+
+        def rate(fn) -> float:
+            start = time.perf_counter()
+            for _ in range(self.CALLS):
+                assert fn() == "my-feature"
+            return self.CALLS / (time.perf_counter() - start)
+
+        with patch.dict(os.environ, {"HOME": str(tmp_path), "SESSION_ID": "bench"}):
+            legacy = rate(self._legacy_get_context)
+            current = rate(get_context)
+            watched = rate(ContextWatcher().get)
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] get_context calls/s: legacy {legacy:,.0f}, "
+                f"current {current:,.0f}, ContextWatcher {watched:,.0f}"
+            )
+
+        assert watched > legacy
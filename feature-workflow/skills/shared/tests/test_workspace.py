@@ -0,0 +1,177 @@
+"""Tests for the multi-project workspace dashboard."""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import workspace
+from workspace import (
+    WORKSPACE_DASHBOARD,
+    WORKSPACE_ROLLUP,
+    aggregate,
+    build_rollup,
+    expand_roots,
+    generate_workspace,
+    render_workspace,
+)
+
+
+@pytest.fixture
+def workspace_dir(tmp_path: Path, make_features) -> Path:
+    """Create a workspace with three projects and one unrelated directory."""
+    for name, count in (("alpha", 3), ("beta", 5), ("gamma", 0)):
+        make_features(tmp_path / name, count)
+    (tmp_path / "not-a-project").mkdir()
+    return tmp_path
+
+
+class TestExpandRoots:
+    """Tests for expand_roots."""
+
+    def test_glob_skips_non_projects(self, workspace_dir: Path):
+        """Test that a glob matches only directories with docs/features."""
+        roots = expand_roots([str(workspace_dir / "*")])
+        assert [root.name for root in roots] == ["alpha", "beta", "gamma"]
+
+    def test_duplicates_collapsed(self, workspace_dir: Path):
+        """Test that a root named twice is scanned once."""
+        alpha = str(workspace_dir / "alpha")
+        assert expand_roots([alpha, alpha, str(workspace_dir / "a*")]) == [
+            (workspace_dir / "alpha").resolve()
+        ]
+
+
+class TestAggregate:
+    """Tests for aggregate."""
+
+    def test_parallel_matches_serial(self, workspace_dir: Path):
+        """Test that the process pool returns the same features as a serial scan."""
+        roots = expand_roots([str(workspace_dir / "*")])
+        serial = aggregate(roots, workers=1)
+        parallel = aggregate(roots, workers=2)
+
+        assert [p.root for p in parallel] == roots
+        assert [p.features for p in parallel] == [p.features for p in serial]
+        assert [len(p.features) for p in serial] == [3, 5, 0]
+
+    def test_uses_project_cache(self, workspace_dir: Path):
+        """Test that scanning populates each project's own feature cache."""
+        aggregate(expand_roots([str(workspace_dir / "*")]), workers=1)
+        assert (workspace_dir / "alpha" / "docs" / "features" / ".dashboard-cache.json").exists()
+
+    def test_broken_project_reported(self, workspace_dir: Path, monkeypatch):
+        """Test that a project that fails to load is kept with an error."""
+        def fail(features_dir: Path):
+            if features_dir.parent.parent.name == "beta":
+                raise OSError("disk on fire")
+            return []
+
+        monkeypatch.setattr(workspace, "load_features", fail)
+        projects = aggregate(expand_roots([str(workspace_dir / "*")]), workers=1)
+
+        beta = next(p for p in projects if p.name == "beta")
+        assert beta.features == []
+        assert beta.error == "OSError: disk on fire"
+
+
+class TestRenderWorkspace:
+    """Tests for WORKSPACE.md and workspace.json content."""
+
+    def test_tables_across_projects(self, workspace_dir: Path):
+        """Test that rows from every project appear with a Project column."""
+        content = render_workspace(aggregate(expand_roots([str(workspace_dir / "*")]), workers=1))
+
+        assert "| alpha | 0 | 2 | 1 |  |" in content
+        assert "| gamma | 0 | 0 | 0 |  |" in content
+        assert "| beta | feature-00003 | Feature 3 | P0 | 2024-02-01 |" in content
+        assert "| alpha | feature-00000 | Feature 0 | 2024-03-01 |" in content
+        # IDs are not linked: the per-project paths do not resolve from here
+        assert "](./feature-" not in content
+
+    def test_empty_sections(self, workspace_dir: Path):
+        """Test that empty sections use the dashboard's placeholders."""
+        content = render_workspace(aggregate(expand_roots([str(workspace_dir / "gamma")])))
+        assert "*No features in progress*" in content
+        assert "*No completed features*" in content
+
+    def test_rollup_totals(self, workspace_dir: Path):
+        """Test that the roll-up sums counts and carries feature records."""
+        rollup = build_rollup(aggregate(expand_roots([str(workspace_dir / "*")]), workers=1))
+
+        assert rollup["totals"] == {"backlog": 5, "in_progress": 1, "completed": 2}
+        beta = rollup["projects"][1]
+        assert beta["name"] == "beta"
+        assert beta["counts"] == {"backlog": 3, "in_progress": 1, "completed": 1}
+        assert [f["id"] for f in beta["features"]][:2] == ["feature-00000", "feature-00001"]
+        assert beta["features"][0]["unmetDependencies"] == []
+
+
+class TestGenerateWorkspace:
+    """Tests for generate_workspace and the CLI."""
+
+    def test_writes_outputs(self, workspace_dir: Path, tmp_path: Path):
+        """Test that both files are written to the output directory."""
+        output = tmp_path / "out"
+        generate_workspace([str(workspace_dir / "*")], output, workers=1)
+
+        assert (output / WORKSPACE_DASHBOARD).read_text().startswith("# Workspace Dashboard")
+        rollup = json.loads((output / WORKSPACE_ROLLUP).read_text())
+        assert [p["name"] for p in rollup["projects"]] == ["alpha", "beta", "gamma"]
+
+    def test_unchanged_write_skipped(self, workspace_dir: Path, tmp_path: Path, capsys):
+        """Test that a second run with no feature changes rewrites nothing."""
+        output = tmp_path / "out"
+        generate_workspace([str(workspace_dir / "*")], output, workers=1)
+        mtimes = {name: (output / name).stat().st_mtime_ns for name in (WORKSPACE_DASHBOARD, WORKSPACE_ROLLUP)}
+        capsys.readouterr()
+
+        generate_workspace([str(workspace_dir / "*")], output, workers=1)
+
+        assert "unchanged, skipped write" in capsys.readouterr().err
+        for name, mtime in mtimes.items():
+            assert (output / name).stat().st_mtime_ns == mtime
+
+    def test_cli(self, workspace_dir: Path, tmp_path: Path, monkeypatch):
+        """Test that the CLI accepts --output and --workers."""
+        output = tmp_path / "out"
+        monkeypatch.setattr(
+            sys, "argv",
+            ["workspace.py", "--output", str(output), "--workers", "1", str(workspace_dir / "*")],
+        )
+        assert workspace.main() == 0
+        assert (output / WORKSPACE_DASHBOARD).exists()
+
+    def test_cli_no_matches(self, tmp_path: Path, monkeypatch):
+        """Test that the CLI fails when no project root matches."""
+        monkeypatch.setattr(sys, "argv", ["workspace.py", "--output", str(tmp_path), str(tmp_path / "none*")])
+        assert workspace.main() == 1
+
+
+@pytest.mark.benchmark
+class TestWorkspaceBenchmark:
+    """Benchmark: serial vs pooled aggregation over many projects."""
+
+    def test_many_projects(self, tmp_path: Path, make_features, capsys):
+        """Test and report aggregation time for 200 projects of 50 features."""
+        for i in range(200):
+            make_features(tmp_path / f"project-{i:03d}", 50)
+        roots = expand_roots([str(tmp_path / "project-*")])
+        aggregate(roots, workers=1)  # fill the per-project caches
+
+        start = time.perf_counter()
+        serial = aggregate(roots, workers=1)
+        serial_done = time.perf_counter()
+        pooled = aggregate(roots)
+        pooled_done = time.perf_counter()
+
+        with capsys.disabled():
+            print(
+                f"\n[bench] 200 projects x 50 features (warm caches): serial {(serial_done - start) * 1000:.0f} ms, "
+                f"pool {(pooled_done - serial_done) * 1000:.0f} ms"
+            )
+
+        assert sum(len(p.features) for p in pooled) == 10_000
+        assert [p.features for p in pooled] == [p.features for p in serial]